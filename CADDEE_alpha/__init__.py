@@ -9,6 +9,8 @@ import CADDEE_alpha.core.mesh as mesh
 from CADDEE_alpha.utils.import_geometry import import_geometry
 from CADDEE_alpha.utils.units import Units
 from CADDEE_alpha.utils.loading import load_var
+from CADDEE_alpha.utils.parametric_coordinates import ParametricCoordinates
+from CADDEE_alpha.utils.transfer_operators import TransferOperator
 import caddee_materials as materials
 import CADDEE_alpha.utils.mesh_utils as mesh_utils
 import CADDEE_alpha.utils.struct_utils as struct_utils
\ No newline at end of file
@@ -6,7 +6,6 @@ from typing import Union
 class Aircraft(Component):
     """Aircraft container component"""
     def __init__(self, geometry: Union[FunctionSet, None] = None, **kwargs) -> None:
-        kwargs["do_not_remake_ffd_block"] = True
         super().__init__(geometry, **kwargs)
         self._skip_ffd = True
         
\ No newline at end of file
@@ -1,4 +1,4 @@
-from CADDEE_alpha.core.component import Component
+from CADDEE_alpha.core.component import Component, LazySurfaceAreaParameter
 from lsdo_geo.core.parameterization.volume_sectional_parameterization import (
     VolumeSectionalParameterization, VolumeSectionalParameterizationInputs
 )
@@ -15,7 +15,7 @@ class FuselageParameters:
     length : Union[float, int, csdl.Variable]
     max_width : Union[float, int, csdl.Variable]
     max_height : Union[float, int, csdl.Variable]
-    S_wet : Union[float, int, csdl.Variable, None]=None
+    S_wet : Union[float, int, csdl.Variable, None] = LazySurfaceAreaParameter()
 
 @dataclass
 class FuselageGeometricQuantities:
@@ -31,6 +31,9 @@ class Fuselage(Component):
     - length
     - max_width
     - max_height
+    - S_wet : wetted area (None default); if not provided, the 
+    surface area of the geometry (if any) is used, which is 
+    computed upon first access
 
     Note that parameters may be design variables for optimizaiton.
     If a geometry is provided, the geometry parameterization sovler
@@ -49,16 +52,17 @@ class Fuselage(Component):
         length : Union[int, float, csdl.Variable],
         max_width : Union[int, float, csdl.Variable, None] = None, 
         max_height : Union[int, float, csdl.Variable, None] = None, 
+        S_wet : Union[int, float, csdl.Variable, None] = None,
         geometry : Union[FunctionSet, None] = None,
         **kwargs
     ) -> None:
-        kwargs["do_not_remake_ffd_block"] = True
         super().__init__(geometry, **kwargs)
         
         # Do type checking
         csdl.check_parameter(length, "length", types=(int, float, csdl.Variable))
         csdl.check_parameter(max_width, "max_width", types=(int, float, csdl.Variable), allow_none=True)
         csdl.check_parameter(max_height, "max_height", types=(int, float, csdl.Variable), allow_none=True)
+        csdl.check_parameter(S_wet, "S_wet", types=(int, float, csdl.Variable), allow_none=True)
         
         self._name = f"fuselage_{self._instance_count}"
 
@@ -67,8 +71,13 @@ class Fuselage(Component):
             length=length,
             max_height=max_height,
             max_width=max_width,
+            S_wet=S_wet,
         )
 
+        # The wetted area defaults to the (lazily computed) surface area
+        if self.quantities._surface_area_function is not None:
+            self.parameters._surface_area_function = self._get_surface_area
+
         # compute form factor (according to Raymer) if parameters are provided
         if all(arg is not None for arg in [length, max_height, max_width]):
             if not isinstance(max_height, csdl.Variable):
@@ -85,24 +94,26 @@ class Fuselage(Component):
             if not isinstance(self.geometry, (FunctionSet)):
                 raise TypeError(f"wing gometry must be of type {FunctionSet}")
             else:
-                # Set the wetted area
-                self.parameters.S_wet = self.quantities.surface_area
-                
-                # Automatically make the FFD block upon instantiation 
-                self._ffd_block = self._make_ffd_block(self.geometry)
-
                 # Extract dimensions (height, width, length) from the FFD block
-                self._nose_point = geometry.project(self._ffd_block.evaluate(parametric_coordinates=np.array([1., 0.5, 0.5])))
-                self._tail_point = geometry.project(self._ffd_block.evaluate(parametric_coordinates=np.array([0., 0.5, 0.5])))
-
-                self.nose_point = geometry.evaluate(self._nose_point)
-                self.tail_point = geometry.evaluate(self._tail_point)
-
-                self._left_point = geometry.project(self._ffd_block.evaluate(parametric_coordinates=np.array([0.5, 0., 0.5])))
-                self._right_point = geometry.project(self._ffd_block.evaluate(parametric_coordinates=np.array([0.5, 1., 0.5])))
-
-                self._top_point = geometry.project(self._ffd_block.evaluate(parametric_coordinates=np.array([0.5, 0.5, 1.])))
-                self._bottom_point = geometry.project(self._ffd_block.evaluate(parametric_coordinates=np.array([0.5, 0.5, 0.])))
+                (
+                    self._nose_point, self._tail_point,
+                    self._left_point, self._right_point,
+                    self._top_point, self._bottom_point,
+                ) = self._project_ffd_block_points(
+                    self._ffd_block,
+                    np.array([
+                        [1., 0.5, 0.5],
+                        [0., 0.5, 0.5],
+                        [0.5, 0., 0.5],
+                        [0.5, 1., 0.5],
+                        [0.5, 0.5, 1.],
+                        [0.5, 0.5, 0.],
+                    ]),
+                )
+
+                nose_and_tail = geometry.evaluate(self._nose_point + self._tail_point)
+                self.nose_point = nose_and_tail[0]
+                self.tail_point = nose_and_tail[1]
 
 
     def _setup_ffd_block(self, ffd_block, parameterization_solver, plot : bool=False):
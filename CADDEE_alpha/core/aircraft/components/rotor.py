@@ -38,24 +38,20 @@ class Rotor(Component):
 
             else:
                 # Do projections for corner points
-                # Find principal axis/dim
-                # u-direction
-                u_dim = self._ffd_block.evaluate(parametric_coordinates=np.array([0., 0.5, 0.5])) - \
-                        self._ffd_block.evaluate(parametric_coordinates=np.array([1., 0.5, 0.5]))
-
-                # v-direction
-                v_dim = self._ffd_block.evaluate(parametric_coordinates=np.array([0., 0., 0.5])) - \
-                        self._ffd_block.evaluate(parametric_coordinates=np.array([0., 1., 0.5]))
-                
-                # w-direction
-                w_dim = self._ffd_block.evaluate(parametric_coordinates=np.array([0.5, 0.5, 0.])) - \
-                        self._ffd_block.evaluate(parametric_coordinates=np.array([0.5, 0.5, 1.]))
+                # Find principal axis/dim (u, v, w-direction end points in one evaluation)
+                dim_points = self._ffd_block.evaluate(
+                    parametric_coordinates=np.array([
+                        [0., 0.5, 0.5],
+                        [1., 0.5, 0.5],
+                        [0., 0., 0.5],
+                        [0., 1., 0.5],
+                        [0.5, 0.5, 0.],
+                        [0.5, 0.5, 1.],
+                    ])
+                ).value.reshape((3, 2, 3))
                 
                 # Get the dimension (i.e., size) of the FFD-block
-                u_norm = csdl.norm(u_dim).value
-                v_norm = csdl.norm(v_dim).value
-                w_norm = csdl.norm(w_dim).value
-                block_dim = np.array([u_norm, v_norm, w_norm]).flatten()
+                block_dim = np.linalg.norm(dim_points[:, 0, :] - dim_points[:, 1, :], axis=1)
 
                 # Get the principal direction
                 # self._pr_dim = np.where(block_dim == np.max(block_dim))[0][0]
@@ -65,26 +61,28 @@ class Rotor(Component):
                 self._pr_dim = smllst_dim
                 
                 if smllst_dim == 0:
-                    self._corner_point_1 = geometry.project(self._ffd_block.evaluate(parametric_coordinates=np.array([0.5, 0.5, 0.])))
-                    self._corner_point_2 = geometry.project(self._ffd_block.evaluate(parametric_coordinates=np.array([0.5, 0.5, 1.])))
-                    self._corner_point_3 = geometry.project(self._ffd_block.evaluate(parametric_coordinates=np.array([0.5, 0., 0.5])))
-                    self._corner_point_4 = geometry.project(self._ffd_block.evaluate(parametric_coordinates=np.array([0.5, 1., 0.5])))
+                    corner_parametric_coordinates = np.array([
+                        [0.5, 0.5, 0.], [0.5, 0.5, 1.], [0.5, 0., 0.5], [0.5, 1., 0.5],
+                    ])
 
                 elif smllst_dim == 1:
-                    self._corner_point_1 = geometry.project(self._ffd_block.evaluate(parametric_coordinates=np.array([0., 0.5, 0.5])))
-                    self._corner_point_2 = geometry.project(self._ffd_block.evaluate(parametric_coordinates=np.array([1., 0.5, 0.5])))
-                    self._corner_point_3 = geometry.project(self._ffd_block.evaluate(parametric_coordinates=np.array([0.5, 0.5, 0.])))
-                    self._corner_point_4 = geometry.project(self._ffd_block.evaluate(parametric_coordinates=np.array([0.5, 0.5, 1.])))
+                    corner_parametric_coordinates = np.array([
+                        [0., 0.5, 0.5], [1., 0.5, 0.5], [0.5, 0.5, 0.], [0.5, 0.5, 1.],
+                    ])
 
                 elif smllst_dim == 2:
-                    self._corner_point_1 = geometry.project(self._ffd_block.evaluate(parametric_coordinates=np.array([0., 0.5, 0.5])))
-                    self._corner_point_2 = geometry.project(self._ffd_block.evaluate(parametric_coordinates=np.array([1., 0.5, 0.5])))
-                    self._corner_point_3 = geometry.project(self._ffd_block.evaluate(parametric_coordinates=np.array([0.5, 0., 0.5])))
-                    self._corner_point_4 = geometry.project(self._ffd_block.evaluate(parametric_coordinates=np.array([0.5, 1., 0.5])))
+                    corner_parametric_coordinates = np.array([
+                        [0., 0.5, 0.5], [1., 0.5, 0.5], [0.5, 0., 0.5], [0.5, 1., 0.5],
+                    ])
 
                 else:
                     raise Exception(f"Invalid smallest dimension {smllst_dim}. Needs to be 0, 1, 2. This is unlikely to be a user error")
 
+                (
+                    self._corner_point_1, self._corner_point_2,
+                    self._corner_point_3, self._corner_point_4,
+                ) = self._project_ffd_block_points(self._ffd_block, corner_parametric_coordinates)
+
 
     def actuate(self, angle, axis_origin=None, axis_vector=None):
         if axis_origin is None:
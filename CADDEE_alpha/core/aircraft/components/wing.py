@@ -1,4 +1,4 @@
-from CADDEE_alpha.core.component import Component
+from CADDEE_alpha.core.component import Component, LazySurfaceAreaParameter
 from CADDEE_alpha.core.mesh.mesh import MeshContainer
 from lsdo_geo import construct_ffd_block_around_entities, construct_tight_fit_ffd_block
 import lsdo_function_spaces as lfs
@@ -27,7 +27,7 @@ class WingParameters:
     thickness_to_chord : Union[float, int, csdl.Variable] = 0.15
     thickness_to_chord_loc : float = 0.3
     MAC: Union[float, None] = None
-    S_wet : Union[float, int, csdl.Variable, None]=None
+    S_wet : Union[float, int, csdl.Variable, None] = LazySurfaceAreaParameter()
 
 @dataclass
 class WingGeometricQuantities:
@@ -52,6 +52,9 @@ class Wing(Component):
     - dihedral (deg) (None default)
     - sweep (deg) (None default)
     - taper_ratio (None default)
+    - S_wet : wetted area (None default); if not provided, the 
+    surface area of the geometry (if any) is used, which is 
+    computed upon first access
 
     Note that parameters may be design variables for optimizaiton.
     If a geometry is provided, the geometry parameterization sovler
@@ -78,13 +81,13 @@ class Wing(Component):
         tip_twist_delta : Union[int, float, csdl.Variable] = 0,
         thickness_to_chord: float = 0.15,
         thickness_to_chord_loc: float = 0.3,
+        S_wet : Union[int, float, csdl.Variable, None] = None,
         geometry : Union[lfs.FunctionSet, None]=None,
         tight_fit_ffd: bool = False,
         skip_ffd: bool = False,
         orientation: str = "horizontal",
         **kwargs
     ) -> None:
-        kwargs["do_not_remake_ffd_block"] = True
         super().__init__(geometry=geometry, **kwargs)
         
         # Do type checking 
@@ -97,6 +100,7 @@ class Wing(Component):
         csdl.check_parameter(taper_ratio, "taper_ratio", types=(int, float, csdl.Variable), allow_none=True)
         csdl.check_parameter(root_twist_delta, "root_twist_delta", types=(int, float, csdl.Variable))
         csdl.check_parameter(tip_twist_delta, "tip_twist_delta", types=(int, float, csdl.Variable))
+        csdl.check_parameter(S_wet, "S_wet", types=(int, float, csdl.Variable), allow_none=True)
         csdl.check_parameter(orientation, "orientation", values=["horizontal", "vertical"])
 
         # Check if wing is over-parameterized
@@ -131,8 +135,13 @@ class Wing(Component):
             tip_twist_delta=tip_twist_delta,
             thickness_to_chord=thickness_to_chord,
             thickness_to_chord_loc=thickness_to_chord_loc,
+            S_wet=S_wet,
         )
 
+        # The wetted area defaults to the (lazily computed) surface area
+        if self.quantities._surface_area_function is not None:
+            self.parameters._surface_area_function = self._get_surface_area
+
         # Compute MAC (i.e., characteristic length)
         if taper_ratio is None:
             taper_ratio = 1
@@ -178,49 +187,61 @@ class Wing(Component):
             if not isinstance(self.geometry, (lfs.FunctionSet)):
                 raise TypeError(f"wing gometry must be of type {lfs.FunctionSet}")
             else:
-                # Set the wetted area
-                self.parameters.S_wet = self.quantities.surface_area
-
-                # Make the FFD block upon instantiation
+                # Make an FFD block (optionally tight-fit) for computing the corner points
                 ffd_block = self._make_ffd_block(self.geometry, tight_fit=tight_fit_ffd, degree=(1, 2, 1), num_coefficients=(2, 2, 2))
 
-                # Compute the corner points of the wing 
+                # Compute the corner points of the wing (projected and evaluated in batches)
                 if self._orientation == "horizontal":
-                    self._LE_left_point = geometry.project(ffd_block.evaluate(parametric_coordinates=np.array([1., 0., 0.5])), plot=False, extrema=True)
-                    self._LE_mid_point = geometry.project(ffd_block.evaluate(parametric_coordinates=np.array([1., 0.5, 0.5])), plot=False, extrema=True)
-                    self._LE_right_point = geometry.project(ffd_block.evaluate(parametric_coordinates=np.array([1., 1.0, 0.5])), plot=False, extrema=True)
-
-                    self._TE_left_point = geometry.project(ffd_block.evaluate(parametric_coordinates=np.array([0., 0., 0.5])), plot=False, extrema=True)
-                    self._TE_mid_point = geometry.project(ffd_block.evaluate(parametric_coordinates=np.array([0., 0.5, 0.5])),  plot=False, extrema=True)
-                    self._TE_right_point = geometry.project(ffd_block.evaluate(parametric_coordinates=np.array([0., 1.0, 0.5])), plot=False, extrema=True)
-
-                    self.LE_left_tip = geometry.evaluate(self._LE_left_point)
-                    self.LE_right_tip = geometry.evaluate(self._LE_right_point)
-
-                    self.TE_left_tip = geometry.evaluate(self._TE_left_point)
-                    self.TE_right_tip = geometry.evaluate(self._TE_right_point)
-
-
-                    self.LE_center = geometry.evaluate(self._LE_mid_point)
-                    self.TE_center = geometry.evaluate(self._TE_mid_point)
+                    (
+                        self._LE_left_point, self._LE_mid_point, self._LE_right_point,
+                        self._TE_left_point, self._TE_mid_point, self._TE_right_point,
+                    ) = self._project_ffd_block_points(
+                        ffd_block, 
+                        np.array([
+                            [1., 0., 0.5],
+                            [1., 0.5, 0.5],
+                            [1., 1.0, 0.5],
+                            [0., 0., 0.5],
+                            [0., 0.5, 0.5],
+                            [0., 1.0, 0.5],
+                        ]),
+                        plot=False, 
+                        extrema=True,
+                    )
+
+                    corner_points = geometry.evaluate(
+                        self._LE_left_point + self._LE_mid_point + self._LE_right_point + \
+                        self._TE_left_point + self._TE_mid_point + self._TE_right_point
+                    )
+
+                    self.LE_left_tip = corner_points[0]
+                    self.LE_right_tip = corner_points[2]
+
+                    self.TE_left_tip = corner_points[3]
+                    self.TE_right_tip = corner_points[5]
+
+                    self.LE_center = corner_points[1]
+                    self.TE_center = corner_points[4]
 
                 else:
-                    self._LE_tip_point = geometry.project(ffd_block.evaluate(parametric_coordinates=np.array([1., 0.5, 0.])), direction=np.array([-1., 0., 0.]), plot=False, extrema=False)
-                    self._LE_root_point = geometry.project(ffd_block.evaluate(parametric_coordinates=np.array([1., 0.5, 1.])), direction=np.array([-1., 0., 0.]), plot=False, extrema=False)
-
-                    self._TE_tip_point = geometry.project(ffd_block.evaluate(parametric_coordinates=np.array([0., 0.5, 0.])), plot=False, extrema=True)
-                    self._TE_root_point = geometry.project(ffd_block.evaluate(parametric_coordinates=np.array([0., 0.5, 1.])), plot=False, extrema=True)
-
-                    self.LE_root = geometry.evaluate(self._LE_root_point)
-                    self.TE_root = geometry.evaluate(self._TE_root_point)
-
-                    # print(self.geometry.evaluate(self._LE_tip_point).value)
-                    # print(self.geometry.evaluate(self._LE_root_point).value)
-                    # print(self.geometry.evaluate(self._TE_tip_point).value)
-                    # print(self.geometry.evaluate(self._TE_root_point).value)
-                    # exit()
-
-                self._ffd_block = self._make_ffd_block(self.geometry, tight_fit=False)
+                    # LE and TE points are projected with different settings
+                    self._LE_tip_point, self._LE_root_point = self._project_ffd_block_points(
+                        ffd_block, 
+                        np.array([[1., 0.5, 0.], [1., 0.5, 1.]]), 
+                        direction=np.array([-1., 0., 0.]), 
+                        plot=False, 
+                        extrema=False,
+                    )
+                    self._TE_tip_point, self._TE_root_point = self._project_ffd_block_points(
+                        ffd_block, 
+                        np.array([[0., 0.5, 0.], [0., 0.5, 1.]]), 
+                        plot=False, 
+                        extrema=True,
+                    )
+
+                    root_points = geometry.evaluate(self._LE_root_point + self._TE_root_point)
+                    self.LE_root = root_points[0]
+                    self.TE_root = root_points[1]
 
                 # print("time for computing corner points", t6-t5)
             # internal geometry projection info
@@ -265,6 +286,10 @@ class Wing(Component):
         # Rotate the component about the axis
         wing_geometry.rotate(axis_origin=axis_origin, axis_vector=axis_vector / csdl.norm(axis_vector), angles=angle)
 
+    def _construct_ffd_block(self):
+        """Make the (non tight-fit) wing FFD block used for the parameterization."""
+        return self._make_ffd_block(self.geometry, tight_fit=False)
+
     def _make_ffd_block(self, 
             entities : List[lfs.Function], 
             num_coefficients : tuple=(2, 2, 2), 
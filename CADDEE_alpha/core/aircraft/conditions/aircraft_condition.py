@@ -453,6 +453,8 @@ class AircraftCondition(Condition):
             load_factor: Union[int, float, csdl.Variable] = 1,
             ref_point: Union[csdl.Variable, np.ndarray] = np.array([0., 0., 0.]),
             ac_mps=None,
+            half_model_forces: Union[list[csdl.Variable], None] = None,
+            half_model_moments: Union[list[csdl.Variable], None] = None,
         ) -> tuple[csdl.Variable]:
         from CADDEE_alpha.core.configuration import VectorizedConfig
 
@@ -482,6 +484,16 @@ class AircraftCondition(Condition):
         ref_point : Union[csdl.Variable, np.ndarray], optional
             reference points for computing inertial moments, by default np.array([0., 0., 0.])
 
+        half_model_forces : Union[list[csdl.Variable], None], optional
+            list of aero-propulsive forces computed on a half model (symmetric w.r.t. 
+            the xz-plane, e.g., 'make_vlm_surface(..., half_model=True)') of a symmetric 
+            condition; for the full aircraft, Fx and Fz are doubled and Fy is zero, 
+            by default None
+
+        half_model_moments : Union[list[csdl.Variable], None], optional
+            list of aero-propulsive moments computed on a half model; for the full 
+            aircraft, My is doubled and Mx and Mz are zero, by default None
+
         Returns
         -------
         tuple[csdl.Variable]
@@ -497,6 +509,8 @@ class AircraftCondition(Condition):
         csdl.check_parameter(load_factor, "load_factor", types=(int, float, csdl.Variable))
         csdl.check_parameter(aero_propulsive_moments, "aero_propulsive_moments", types=list)
         csdl.check_parameter(aero_propulsive_forces, "aero_propulsive_forces", types=list)
+        csdl.check_parameter(half_model_forces, "half_model_forces", types=list, allow_none=True)
+        csdl.check_parameter(half_model_moments, "half_model_moments", types=list, allow_none=True)
 
         num_nodes = self._num_nodes
         total_forces = csdl.Variable(shape=(self._num_nodes, 3), value=0.)
@@ -522,6 +536,25 @@ class AircraftCondition(Condition):
                 raise Exception(f"Shape mismatch. Moments must be shape (nun_nodes, 3)={(num_nodes, 3)}. Received shape {moment.shape}")
             
             total_moments =  total_moments + moment
+
+        # reconstruct the full aircraft loads of (symmetric) half models
+        if half_model_forces is not None:
+            for force in half_model_forces:
+                if not isinstance(force, csdl.Variable):
+                    raise TypeError(f"Received invalid type {force}. Forces must be of type {csdl.Variable}")
+                if not force.shape == (num_nodes, 3):
+                    raise Exception(f"Shape mismatch. Forces must be shape (nun_nodes, 3)={(num_nodes, 3)}. Received shape {force.shape}")
+                
+                total_forces = total_forces + force * np.tile(np.array([2., 0., 2.]), (num_nodes, 1))
+
+        if half_model_moments is not None:
+            for moment in half_model_moments:
+                if not isinstance(moment, csdl.Variable):
+                    raise TypeError(f"Received invalid type {moment}. Moments must be of type {csdl.Variable}")
+                if not moment.shape == (num_nodes, 3):
+                    raise Exception(f"Shape mismatch. Moments must be shape (nun_nodes, 3)={(num_nodes, 3)}. Received shape {moment.shape}")
+                
+                total_moments = total_moments + moment * np.tile(np.array([0., 2., 0.]), (num_nodes, 1))
         
         # Get Euler angles from the ac states
         ac_states = self.quantities.ac_states
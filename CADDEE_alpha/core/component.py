@@ -201,7 +201,11 @@ class ComponentQuantities:
         self._drag_parameters = drag_parameters
     
         self.surface_mesh = []
-        self.surface_area = None
+
+        # Surface area is computed lazily (on first access) by the owning 
+        # component through this callback; a user-set value takes precedence
+        self._surface_area = None
+        self._surface_area_function = None
 
         if mass_properties is None:
             self.mass_properties = MassProperties()
@@ -213,6 +217,20 @@ class ComponentQuantities:
             self.drag_parameters =  DragBuildUpQuantities()
         
 
+    @property
+    def surface_area(self):
+        if self._surface_area is not None:
+            return self._surface_area
+        elif self._surface_area_function is not None:
+            return self._surface_area_function()
+        else:
+            return None
+    
+    @surface_area.setter
+    def surface_area(self, value):
+        csdl.check_parameter(value, "surface_area", types=(int, float, csdl.Variable), allow_none=True)
+        self._surface_area = value
+
     @property
     def mass_properties(self):
         return self._mass_properties
@@ -252,6 +270,33 @@ class ComponentQuantities:
     #     self.surface_area = None
     #     self.drag_parameters = DragBuildUpQuantities()
 
+class LazySurfaceAreaParameter:
+    """Data class field descriptor for a wetted area parameter (e.g., S_wet).
+
+    A value that has been set (by the user) is returned as is. Otherwise, 
+    the (lazily computed) surface area of the owning component is returned
+    through the '_surface_area_function' callback of the data class instance, 
+    if any, such that the parameter is available right after instantiation 
+    without computing the area up front.
+    """
+    def __set_name__(self, owner, name):
+        self._attribute_name = f"_{name}"
+
+    def __get__(self, instance, owner=None):
+        # Default value of the data class field
+        if instance is None:
+            return None
+        value = instance.__dict__.get(self._attribute_name, None)
+        if value is None:
+            surface_area_function = instance.__dict__.get("_surface_area_function", None)
+            if surface_area_function is not None:
+                return surface_area_function()
+        return value
+
+    def __set__(self, instance, value):
+        instance.__dict__[self._attribute_name] = value
+
+
 @dataclass
 class ComponentParameters:
     pass
@@ -290,6 +335,17 @@ class Component:
 
     parent = None
 
+    # Parametric coordinates of the FFD block faces (1-6) and center
+    _ffd_block_face_parametric_coordinates = np.array([
+        [0.5, 0.5, 0.],
+        [0.5, 0.5, 1.],
+        [0.5, 0., 0.5],
+        [0.5, 1., 0.5],
+        [0., 0.5, 0.5],
+        [1., 0.5, 0.5],
+        [0.5, 0.5, 0.5],
+    ])
+
     def __init__(self, geometry : Union[FunctionSet, None]=None, 
                  compute_surface_area: bool=True, skip_ffd: bool=False, **kwargs) -> None: 
         csdl.check_parameter(geometry, "geometry", types=(FunctionSet), allow_none=True)
@@ -311,30 +367,83 @@ class Component:
         for key, value in kwargs.items():
             setattr(self.parameters, key, value)
         
+        # The FFD block, its face/center points and the surface area are 
+        # only computed upon first access (see corresponding properties)
         if geometry is not None and isinstance(geometry, FunctionSet):
             if self.compute_surface_area:
-                self.quantities.surface_area = self._compute_surface_area(geometry=geometry)
-            # if "do_not_remake_ffd_block" in kwargs.keys():
-            #     pass
-            # else:
-                # self._ffd_block = self._make_ffd_block(self.geometry)
-
-                # self.ffd_block_face_1 = self._ffd_block.evaluate(parametric_coordinates=np.array([0.5, 0.5, 0.]))
-                # self.ffd_block_face_2 = self._ffd_block.evaluate(parametric_coordinates=np.array([0.5, 0.5, 1.]))
-                # self.ffd_block_face_3 = self._ffd_block.evaluate(parametric_coordinates=np.array([0.5, 0., 0.5]))
-                # self.ffd_block_face_4 = self._ffd_block.evaluate(parametric_coordinates=np.array([0.5, 1., 0.5]))
-                # self.ffd_block_face_5 = self._ffd_block.evaluate(parametric_coordinates=np.array([0., 0.5, 0.5]))
-                # self.ffd_block_face_6 = self._ffd_block.evaluate(parametric_coordinates=np.array([1., 0.5, 0.5]))
-                # self.ffd_block_center = self._ffd_block.evaluate(parametric_coordinates=np.array([0.5, 0.5, 0.5]))
-            self._ffd_block = self._make_ffd_block(self.geometry)
-
-            self.ffd_block_face_1 = self._ffd_block.evaluate(parametric_coordinates=np.array([0.5, 0.5, 0.]))
-            self.ffd_block_face_2 = self._ffd_block.evaluate(parametric_coordinates=np.array([0.5, 0.5, 1.]))
-            self.ffd_block_face_3 = self._ffd_block.evaluate(parametric_coordinates=np.array([0.5, 0., 0.5]))
-            self.ffd_block_face_4 = self._ffd_block.evaluate(parametric_coordinates=np.array([0.5, 1., 0.5]))
-            self.ffd_block_face_5 = self._ffd_block.evaluate(parametric_coordinates=np.array([0., 0.5, 0.5]))
-            self.ffd_block_face_6 = self._ffd_block.evaluate(parametric_coordinates=np.array([1., 0.5, 0.5]))
-            self.ffd_block_center = self._ffd_block.evaluate(parametric_coordinates=np.array([0.5, 0.5, 0.5]))
+                self.quantities._surface_area_function = self._get_surface_area
+
+    @property
+    def geometry(self) -> Union[FunctionSet, Geometry, None]:
+        return self._geometry
+    
+    @geometry.setter
+    def geometry(self, value):
+        self._geometry = value
+        
+        # Reset any quantities derived from the (previous) geometry
+        self._cached_ffd_block = None
+        self._cached_ffd_block_points = None
+        self._cached_surface_area = None
+        self._cached_surface_area_key = None
+        self._sectional_projections = {}
+
+    @property
+    def _ffd_block(self):
+        """The component's FFD block, made upon first access."""
+        if self._cached_ffd_block is None and self.geometry is not None:
+            self._cached_ffd_block = self._construct_ffd_block()
+        return self._cached_ffd_block
+    
+    @_ffd_block.setter
+    def _ffd_block(self, value):
+        self._cached_ffd_block = value
+        self._cached_ffd_block_points = None
+
+    def _construct_ffd_block(self):
+        """Make the default FFD block of the component. 
+        
+        Can be overwritten by sub-components that require a different FFD block.
+        """
+        return self._make_ffd_block(self.geometry)
+
+    def _get_ffd_block_point(self, index: int) -> csdl.Variable:
+        """Return one of the FFD block face/center points, which are evaluated in one call."""
+        if self._ffd_block is None:
+            raise ValueError(f"Component {self._name} does not have an FFD block since its geometry is None.")
+        if self._cached_ffd_block_points is None:
+            self._cached_ffd_block_points = self._ffd_block.evaluate(
+                parametric_coordinates=self._ffd_block_face_parametric_coordinates
+            )
+        return self._cached_ffd_block_points[index]
+
+    @property
+    def ffd_block_face_1(self) -> csdl.Variable:
+        return self._get_ffd_block_point(0)
+    
+    @property
+    def ffd_block_face_2(self) -> csdl.Variable:
+        return self._get_ffd_block_point(1)
+    
+    @property
+    def ffd_block_face_3(self) -> csdl.Variable:
+        return self._get_ffd_block_point(2)
+    
+    @property
+    def ffd_block_face_4(self) -> csdl.Variable:
+        return self._get_ffd_block_point(3)
+    
+    @property
+    def ffd_block_face_5(self) -> csdl.Variable:
+        return self._get_ffd_block_point(4)
+    
+    @property
+    def ffd_block_face_6(self) -> csdl.Variable:
+        return self._get_ffd_block_point(5)
+    
+    @property
+    def ffd_block_center(self) -> csdl.Variable:
+        return self._get_ffd_block_point(6)
 
     def create_subgeometry(self, search_names:list[str], ignore_names:list[str]=[]) -> FunctionSet:
         """Create a sub-geometry by providing the search names of the e.g., OpenVSP component.
@@ -380,6 +489,18 @@ class Component:
 
         return ffd_block 
     
+    def _project_ffd_block_points(self, ffd_block, parametric_coordinates: np.ndarray, **kwargs) -> list:
+        """Evaluate several FFD block points and project them onto the geometry at once.
+
+        Returns one list of parametric coordinates per point, such that each 
+        entry can be evaluated individually (i.e., same as projecting one point).
+        Keyword arguments are passed on to the projection.
+        """
+        points = ffd_block.evaluate(parametric_coordinates=parametric_coordinates)
+        parametric_points = self.geometry.project(points, **kwargs)
+
+        return [[parametric_point] for parametric_point in parametric_points]
+
     def _setup_ffd_block(self):
         raise NotImplementedError(f"'_setup_ffd_block' has not been implemented for {type(self)}")
     
@@ -411,91 +532,114 @@ class Component:
             parent = self.parent
             self._find_system_component(parent)
 
-    def _compute_surface_area(self, geometry:Geometry):
-        import time 
-        """Compute the surface area of a component."""
-        parametric_mesh_grid_num = 10
-
-        surfaces = geometry.functions
-        surface_area = csdl.Variable(shape=(1, ), value=1)
-
-        surface_mesh = self.quantities.surface_mesh
-
-        num_surfaces = len(surfaces.keys())
-
-        parametric_mesh = geometry.generate_parametric_grid(grid_resolution=(parametric_mesh_grid_num, parametric_mesh_grid_num))
-        coords_vec = geometry.evaluate(parametric_mesh).reshape((num_surfaces, parametric_mesh_grid_num, parametric_mesh_grid_num, 3))
-        surface_mesh.append(coords_vec)
+    def _get_surface_area(self) -> csdl.Variable:
+        """Return the (memoized) surface area of the component.
+        
+        The area is re-computed if the geometry or any of its 
+        coefficients have been changed since the last computation.
+        """
+        key = [function.coefficients for function in self.geometry.functions.values()]
+        cached_key = self._cached_surface_area_key
+        
+        if cached_key is None or len(cached_key) != len(key) or \
+            any(coeffs is not cached_coeffs for coeffs, cached_coeffs in zip(key, cached_key)):
+            self._cached_surface_area = self._compute_surface_area(geometry=self.geometry)
+            self._cached_surface_area_key = key
 
-        # #########################
-        # self.geometry.plot_meshes(surface_mesh)
-        # #########################
+        return self._cached_surface_area
 
-        coords_u_end = coords_vec[:, 1:, :, :].reshape((num_surfaces, parametric_mesh_grid_num-1, parametric_mesh_grid_num, 3))
-        coords_u_start = coords_vec[:, :-1, :, :].reshape((num_surfaces, parametric_mesh_grid_num-1, parametric_mesh_grid_num, 3))
+    def _compute_surface_area(self, geometry:Geometry, store_surface_mesh: bool=False):
+        """Compute the surface area of a component.
 
-        coords_v_end = coords_vec[:, :, 1:, :].reshape((num_surfaces, parametric_mesh_grid_num, parametric_mesh_grid_num-1, 3))
-        coords_v_start = coords_vec[:, :, :-1, :].reshape((num_surfaces, parametric_mesh_grid_num, parametric_mesh_grid_num-1, 3))
+        The area is integrated with Gauss-Legendre quadrature over the 
+        knot spans of each surface, using the magnitude of the cross product
+        of the first parametric derivatives. All surfaces are evaluated at once.
 
-        u_vectors = coords_u_end - coords_u_start
-        u_vectors_start = u_vectors # .reshape((-1, ))
-        u_vectors_1 = u_vectors_start[:, :, :-1, :].reshape((num_surfaces, parametric_mesh_grid_num-1, parametric_mesh_grid_num-1, 3))
-        u_vectors_2 = u_vectors_start[:, :, 1:, :].reshape((num_surfaces, parametric_mesh_grid_num-1, parametric_mesh_grid_num-1, 3))
+        Parameters
+        ----------
+        geometry : Geometry
+            The (surface) geometry of the component
+        
+        store_surface_mesh : bool, optional
+            If True, the physical quadrature points are stored in 
+            'quantities.surface_mesh', by default False
+        """
+        parametric_points = []
+        weights = []
+        for ind, function in geometry.functions.items():
+            points_i, weights_i = _get_quadrature_rule(function.space)
+            parametric_points += [(ind, point.reshape((1, 2))) for point in points_i]
+            weights.append(weights_i)
+        weights = np.concatenate(weights)
 
+        u_vectors = geometry.evaluate(parametric_points, parametric_derivative_orders=(1, 0)).reshape((-1, 3))
+        v_vectors = geometry.evaluate(parametric_points, parametric_derivative_orders=(0, 1)).reshape((-1, 3))
 
-        v_vectors = coords_v_end - coords_v_start
-        v_vectors_start = v_vectors # .reshape((-1, ))
-        v_vectors_1 = v_vectors_start[:, :-1, :, :].reshape((num_surfaces, parametric_mesh_grid_num-1, parametric_mesh_grid_num-1, 3))
-        v_vectors_2 = v_vectors_start[:, 1:, :, :].reshape((num_surfaces, parametric_mesh_grid_num-1, parametric_mesh_grid_num-1, 3))
+        area_vectors = csdl.cross(u_vectors, v_vectors, axis=1)
+        area_magnitudes = csdl.norm(area_vectors, ord=2, axes=(1, ))
+        surface_area = csdl.sum(area_magnitudes * weights).reshape((1, ))
 
-        area_vectors_left_lower = csdl.cross(u_vectors_1, v_vectors_2, axis=3)
-        area_vectors_right_upper = csdl.cross(v_vectors_1, u_vectors_2, axis=3)
-        area_magnitudes_left_lower = csdl.norm(area_vectors_left_lower, ord=2, axes=(3, ))
-        area_magnitudes_right_upper = csdl.norm(area_vectors_right_upper, ord=2, axes=(3, ))
-        area_magnitudes = (area_magnitudes_left_lower + area_magnitudes_right_upper)/2
-        wireframe_area = csdl.sum(area_magnitudes)
-        surface_area =  surface_area + wireframe_area
+        if store_surface_mesh:
+            self.quantities.surface_mesh.append(geometry.evaluate(parametric_points))
 
-        # surface_area_2 = csdl.Variable(shape=(1, ), value=1)
+        return surface_area
 
-        # t3 = time.time()
-        # for i in surfaces.keys():
-        #     oml_para_mesh = []
-        #     for u in np.linspace(0, 1, parametric_mesh_grid_num):
-        #         for v in np.linspace(0, 1, parametric_mesh_grid_num):
-        #             oml_para_mesh.append((i, np.array([u,v]).reshape((1,2))))
-            
-        #     coords_vec = geometry.evaluate(oml_para_mesh).reshape((parametric_mesh_grid_num, parametric_mesh_grid_num, 3))
-        #     surface_mesh.append(coords_vec)
-            
-        #     coords_u_end = coords_vec[1:, :, :].reshape((parametric_mesh_grid_num-1, parametric_mesh_grid_num, 3))
-        #     coords_u_start = coords_vec[:-1, :, :].reshape((parametric_mesh_grid_num-1, parametric_mesh_grid_num, 3))
 
-        #     coords_v_end = coords_vec[:, 1:, :].reshape((parametric_mesh_grid_num, parametric_mesh_grid_num-1, 3))
-        #     coords_v_start = coords_vec[:, :-1, :].reshape((parametric_mesh_grid_num, parametric_mesh_grid_num-1, 3))
+# Gauss-Legendre quadrature rules are cached per function space (see _get_quadrature_rule)
+_quadrature_rule_cache = {}
 
-        #     u_vectors = coords_u_end - coords_u_start
-        #     u_vectors_start = u_vectors # .reshape((-1, ))
-        #     u_vectors_1 = u_vectors_start[:, :-1, :].reshape((parametric_mesh_grid_num-1, parametric_mesh_grid_num-1, 3))
-        #     u_vectors_2 = u_vectors_start[:, 1:, :].reshape((parametric_mesh_grid_num-1, parametric_mesh_grid_num-1, 3))
+def _get_quadrature_rule(space, num_points_per_span: Union[int, None]=None):
+    """Return the Gauss-Legendre points and weights for a 2D function space.
 
+    The points are placed in each non-empty knot span of a B-spline 
+    space (or on [0, 1] for other spaces), with (degree + 1) points per span
+    and parametric direction by default. Rules are cached by the 
+    space's degree and knots, such that surfaces with the same space 
+    share the same arrays.
 
-        #     v_vectors = coords_v_end - coords_v_start
-        #     v_vectors_start = v_vectors # .reshape((-1, ))
-        #     v_vectors_1 = v_vectors_start[:-1, :, :].reshape((parametric_mesh_grid_num-1, parametric_mesh_grid_num-1, 3))
-        #     v_vectors_2 = v_vectors_start[1:, :, :].reshape((parametric_mesh_grid_num-1, parametric_mesh_grid_num-1, 3))
+    Returns
+    -------
+    tuple
+        parametric points of shape (num_points, 2) and weights of shape (num_points, )
+    """
+    degree = getattr(space, "degree", None)
+    if degree is None:
+        degree = (1, 1)
+    elif isinstance(degree, int):
+        degree = (degree, degree)
+    
+    knots = getattr(space, "knots", None)
+    if knots is None:
+        knot_vectors = (np.array([0., 1.]), np.array([0., 1.]))
+    elif isinstance(knots, np.ndarray) and knots.ndim == 1:
+        knot_vectors = tuple(knots[indices] for indices in space.knot_indices)
+    else:
+        knot_vectors = tuple(np.asarray(knot_vector, dtype=float) for knot_vector in knots)
+
+    key = (tuple(degree), num_points_per_span) + tuple(knot_vector.tobytes() for knot_vector in knot_vectors)
+    if key in _quadrature_rule_cache:
+        return _quadrature_rule_cache[key]
+
+    points_1d = []
+    weights_1d = []
+    for dim in range(2):
+        n = degree[dim] + 1 if num_points_per_span is None else num_points_per_span
+        gauss_points, gauss_weights = np.polynomial.legendre.leggauss(n)
+        
+        breaks = np.unique(np.clip(knot_vectors[dim], 0., 1.))
+        lower, upper = breaks[:-1], breaks[1:]
+        half_lengths = (upper - lower) / 2
+        
+        points_1d.append(((lower + upper) / 2 + np.outer(gauss_points, half_lengths)).T.flatten())
+        weights_1d.append(np.outer(half_lengths, gauss_weights).flatten())
 
-        #     area_vectors_left_lower = csdl.cross(u_vectors_1, v_vectors_2, axis=2)
-        #     area_vectors_right_upper = csdl.cross(v_vectors_1, u_vectors_2, axis=2)
-        #     area_magnitudes_left_lower = csdl.norm(area_vectors_left_lower, ord=2, axes=(2, ))
-        #     area_magnitudes_right_upper = csdl.norm(area_vectors_right_upper, ord=2, axes=(2, ))
-        #     area_magnitudes = (area_magnitudes_left_lower + area_magnitudes_right_upper)/2
-        #     wireframe_area = csdl.sum(area_magnitudes)
-        #     surface_area_2 =  surface_area_2 + wireframe_area 
+    u, v = np.meshgrid(points_1d[0], points_1d[1], indexing="ij")
+    parametric_points = np.column_stack((u.flatten(), v.flatten()))
+    weights = np.outer(weights_1d[0], weights_1d[1]).flatten()
 
-        # t4 = time.time()
+    _quadrature_rule_cache[key] = (parametric_points, weights)
 
-        return surface_area
+    return parametric_points, weights
 
 
 class ComponentDict(dict):
@@ -1,6 +1,7 @@
 from __future__ import annotations
 from CADDEE_alpha.core.component import Component, VectorizedComponent
 from CADDEE_alpha.core.mesh.mesh import MeshContainer, SolverMesh
+from CADDEE_alpha.core.mesh.meshers import OneDBoxBeam, update_box_beams
 from CADDEE_alpha.utils.copy_comps import copy_comps
 from lsdo_function_spaces import FunctionSet
 import numpy as np 
@@ -966,9 +967,16 @@ class Configuration:
         print("time for inner optimization", t2-t1)
 
         print("update meshes after inner optimization")
+        box_beams = []
         for mesh_name, mesh in self.mesh_container.items():
             for discretization_name, discretization in mesh.discretizations.items():
-                discretization._update()
+                # box beams (e.g., wing, tail, boom) are updated in one batched call
+                if isinstance(discretization, OneDBoxBeam):
+                    box_beams.append(discretization)
+                else:
+                    discretization._update()
+        if box_beams:
+            update_box_beams(box_beams)
         
         if plot:
             system_geometry.plot(show=True)
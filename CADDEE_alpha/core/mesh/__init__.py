@@ -1,4 +1,5 @@
 from CADDEE_alpha.core.mesh.meshers import (
-    make_1d_box_beam, make_rotor_mesh, make_vlm_surface, VLMMesh, BeamMesh, RotorMeshes, ShellMesh, import_shell_mesh,
+    make_1d_box_beam, update_box_beams, make_rotor_mesh, make_rotor_group, RotorGroup, make_vlm_surface, get_sectional_projections, make_vlm_surface_family, SectionalProjections, SectionalAirfoils, VLMMesh, BeamMesh, RotorMeshes, ShellMesh, import_shell_mesh,
     PanelMesh, make_wing_panel_mesh, make_nacelle_panel_mesh, make_blade_panel_mesh, make_rotor_panel_mesh
-)
\ No newline at end of file
+)
+from CADDEE_alpha.core.mesh.mesh import PackedMeshBuffer, pack_discretizations
@@ -3,6 +3,8 @@ import csdl_alpha as csdl
 from dataclasses import dataclass
 from typing import Union, List, Dict
 from CADDEE_alpha.utils.caddee_dict import CADDEEDict
+from CADDEE_alpha.utils.mesh_utils import XDMFTimeSeriesExporter
+import numpy as np
 import copy
 
 
@@ -17,6 +19,13 @@ class Discretization(csdl.VariableGroup):
         csdl.check_parameter(self.nodal_coordinates, "nodal_coordinates", types=csdl.Variable, allow_none=True)
         csdl.check_parameter(self.nodal_velocities, "nodal_velocities", types=csdl.Variable, allow_none=True)
 
+    def export_xdmf(self, file_name:str, point_fields:dict=None, cell_fields:dict=None) -> XDMFTimeSeriesExporter:
+        """Return an exporter that streams the nodal coordinates and fields 
+        into an XDMF+HDF5 time series (see 'XDMFTimeSeriesExporter')."""
+        exporter = XDMFTimeSeriesExporter(file_name)
+        exporter.add_discretization(type(self).__name__, self, point_fields=point_fields, cell_fields=cell_fields)
+        return exporter
+
     def copy(self):
         raise NotImplementedError(f"Discretization {self} does not have an implemented copy method.")
         # discretization = Discretization(
@@ -46,11 +55,14 @@ class VectorizedDiscretization:
                 def method(*args, **kwargs):
                     return_list = []
                     for i, comp in enumerate(self.disc_list):
-                        args_i = [arg[i] for arg in args]
-                        kwargs_i = {key: arg[i] for key, arg in kwargs.items()}
+                        args_i = [_get_condition_argument(arg, i) for arg in args]
+                        kwargs_i = {key: _get_condition_argument(arg, i) for key, arg in kwargs.items()}
                         output = getattr(comp, name)(*args_i, **kwargs_i)
                         if output:
                             return_list.append(output)
+                    # Outputs that support it are stacked along a leading (num_nodes) axis
+                    if len(return_list) == self.num_nodes and hasattr(return_list[0], "_stack_conditions"):
+                        return type(return_list[0])._stack_conditions(return_list)
                     return return_list
                 return method
             else:
@@ -68,6 +80,13 @@ class VectorizedDiscretization:
             existing_attrs = [attr for attr in dir(self.disc_list[0]) if not attr.startswith("__")]
             raise AttributeError(f"Attribute {name} does not exist. Existing attributes are {existing_attrs}")
 
+def _get_condition_argument(argument, index:int):
+    """Return the entry of a per-condition argument (list, tuple, array or variable); 
+    other arguments (e.g., int, float, str, None) are shared by all conditions."""
+    if isinstance(argument, (list, tuple, np.ndarray, csdl.Variable)):
+        return argument[index]
+    return argument
+
 class DiscretizationsDict(CADDEEDict):
     def __init__(self, types=(Discretization, list), *args, **kwargs):
         super().__init__(types, *args, **kwargs)
@@ -87,13 +106,133 @@ class DiscretizationsDict(CADDEEDict):
     def __getitem__(self, key) -> Discretization:
         return super().__getitem__(key)
 
+@dataclass
+class PackedMeshBuffer:
+    """Nodal coordinates and velocities of several (structured) surfaces, 
+    e.g., the lifting surfaces of a VLM mesh, packed into contiguous 
+    (num_nodes, total_points, 3) buffers with an offsets/shape table.
+
+    Solvers can consume the buffers directly and map results back to 
+    the surfaces by offset with 'unpack'.
+
+    Parameters
+    ----------
+    nodal_coordinates : csdl.Variable
+        packed coordinates; shape (num_nodes, total_points, 3)
+
+    nodal_velocities : csdl.Variable, None
+        packed velocities; shape (num_nodes, total_points, 3)
+
+    names : list
+        names of the surfaces
+
+    shapes : list
+        shape of the point grid of each surface, e.g., (num_chordwise + 1, num_spanwise + 1)
+
+    offsets : np.ndarray
+        offsets of the surfaces' points; shape (num_surfaces + 1, )
+
+    panel_offsets : np.ndarray
+        offsets of the surfaces' panels (cells of the point grids); shape (num_surfaces + 1, )
+    """
+    nodal_coordinates : csdl.Variable
+    nodal_velocities : Union[csdl.Variable, None]
+    names : list
+    shapes : list
+    offsets : np.ndarray
+    panel_offsets : np.ndarray
+
+    def get_slice(self, name:str, location:str="nodes") -> slice:
+        """Return the slice of a surface's points (location="nodes") or panels (location="panels")."""
+        offsets = self.offsets if location == "nodes" else self.panel_offsets
+        i = self.names.index(name)
+        return slice(int(offsets[i]), int(offsets[i+1]))
+
+    def unpack(self, values:csdl.Variable, location:str="nodes") -> dict:
+        """Map a packed (num_nodes, total_points or total_panels, ...) result back to the surfaces.
+
+        Returns
+        -------
+        dict
+            maps each surface name to its values of shape (num_nodes, ) + grid shape + trailing shape
+        """
+        csdl.check_parameter(location, "location", values=("nodes", "panels"))
+        unpacked = {}
+        for name, shape in zip(self.names, self.shapes):
+            if location == "panels":
+                shape = tuple(dim - 1 for dim in shape)
+            surface_slice = self.get_slice(name, location)
+            unpacked[name] = values[:, surface_slice].reshape((values.shape[0], ) + shape + tuple(values.shape[2:]))
+        return unpacked
+
+def pack_discretizations(discretizations:Dict[str, Discretization]) -> PackedMeshBuffer:
+    """Pack the (expanded) nodal coordinates and velocities of several 
+    discretizations into one buffer (see 'PackedMeshBuffer').
+
+    The discretizations must have coordinates of shape (num_nodes, ) + grid shape + (3, ),
+    e.g., after 'finalize_meshes' of a condition.
+    """
+    names = list(discretizations.keys())
+    coordinates = [discretizations[name].nodal_coordinates for name in names]
+    velocities = [discretizations[name].nodal_velocities for name in names]
+
+    num_nodes = coordinates[0].shape[0]
+    shapes = [tuple(coordinate.shape[1:-1]) for coordinate in coordinates]
+    offsets = np.concatenate(([0], np.cumsum([int(np.prod(shape)) for shape in shapes])))
+    panel_offsets = np.concatenate(([0], np.cumsum([int(np.prod([dim - 1 for dim in shape])) for shape in shapes])))
+    for name, coordinate in zip(names, coordinates):
+        if coordinate.shape[0] != num_nodes:
+            raise ValueError(f"Discretization '{name}' has {coordinate.shape[0]} nodes along the 'num_nodes' axis; expected {num_nodes}")
+
+    def pack(variables):
+        if any(variable is None for variable in variables):
+            return None
+        if len(variables) == 1:
+            return variables[0].reshape((num_nodes, int(offsets[-1]), 3))
+        packed = csdl.Variable(shape=(num_nodes, int(offsets[-1]), 3), value=0.)
+        for i, variable in enumerate(variables):
+            packed = packed.set(
+                csdl.slice[:, int(offsets[i]):int(offsets[i+1]), :],
+                variable.reshape((num_nodes, int(offsets[i+1] - offsets[i]), 3)),
+            )
+        return packed
+
+    return PackedMeshBuffer(
+        nodal_coordinates=pack(coordinates),
+        nodal_velocities=pack(velocities),
+        names=names,
+        shapes=shapes,
+        offsets=offsets,
+        panel_offsets=panel_offsets,
+    )
+
 class SolverMesh:
     discretizations : DiscretizationsDict = DiscretizationsDict()
+    _packed_buffer = None
+    _packed_buffer_key = None
 
     def copy(self):
         solver_mesh = SolverMesh()
         return solver_mesh
 
+    def pack(self, names:list=None) -> PackedMeshBuffer:
+        """Pack the discretizations (by default all) into one buffer (see 'PackedMeshBuffer').
+
+        The buffer is created once and reused as long as the discretizations' 
+        coordinates and velocities are unchanged (e.g., within one condition).
+        """
+        if names is None:
+            names = list(self.discretizations.keys())
+        discretizations = {name : self.discretizations[name] for name in names}
+        key = tuple(
+            (name, id(discretization.nodal_coordinates), id(discretization.nodal_velocities))
+            for name, discretization in discretizations.items()
+        )
+        if self._packed_buffer is None or self._packed_buffer_key != key:
+            self._packed_buffer = pack_discretizations(discretizations)
+            self._packed_buffer_key = key
+        return self._packed_buffer
+
 
 class MeshContainer(CADDEEDict):
     def __init__(self, types=(SolverMesh, list), *args, **kwargs):
@@ -101,6 +240,38 @@ class MeshContainer(CADDEEDict):
     
     def __getitem__(self, key) -> SolverMesh:
         return super().__getitem__(key)
+
+    def export_xdmf(self, file_name:str, point_fields:dict=None, cell_fields:dict=None) -> XDMFTimeSeriesExporter:
+        """Return an exporter that streams all (vectorized) discretizations of all 
+        meshes, including their fields, into one XDMF+HDF5 time series.
+
+        Parameters
+        ----------
+        file_name : str
+            name of the (.xdmf) file
+
+        point_fields : dict, optional
+            nodal fields of the discretizations, keyed by "<mesh_name>/<discretization_name>"; 
+            each entry is a dictionary mapping field names to variables/arrays
+
+        cell_fields : dict, optional
+            element fields of the discretizations, keyed as for point fields
+
+        Returns
+        -------
+        XDMFTimeSeriesExporter
+            call 'write' to append the current values as a time step
+        """
+        point_fields = point_fields or {}
+        cell_fields = cell_fields or {}
+        exporter = XDMFTimeSeriesExporter(file_name)
+        for mesh_name, mesh in self.items():
+            if not isinstance(mesh, SolverMesh):
+                continue
+            for discretization_name, discretization in mesh.discretizations.items():
+                name = f"{mesh_name}/{discretization_name}"
+                exporter.add_discretization(name, discretization, point_fields=point_fields.get(name), cell_fields=cell_fields.get(name))
+        return exporter
     
     # def __init__(self, *args, **kwargs):
     #     super().__init__(*args, **kwargs)
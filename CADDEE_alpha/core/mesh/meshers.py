@@ -6,195 +6,170 @@ from lsdo_function_spaces import FunctionSet
 from typing import Union
 from dataclasses import dataclass
 from CADDEE_alpha.utils.caddee_dict import CADDEEDict
-from CADDEE_alpha.utils.mesh_utils import import_mesh
+from CADDEE_alpha.utils.mesh_utils import import_mesh, memmap_array, partition_mesh_rcb
+from CADDEE_alpha.utils.parametric_coordinates import ParametricCoordinates
 import lsdo_function_spaces as fs
 import lsdo_geo as lg
 from scipy.interpolate import interp1d
 
 
 def cosine_spacing(num_pts, spanwise_points=None, chord_surface=None, num_chordwise=None, flip=False):
+    """Re-distribute points with (half-)cosine spacing.
+
+    The spacing is a fixed numpy vector, such that csdl variables (e.g., LE/TE 
+    points evaluated from the geometry) are interpolated with csdl operations 
+    only; this does not require inline evaluation and is differentiable. Numpy 
+    arrays are spaced with numpy.
+
+    Parameters
+    ----------
+    num_pts : int
+        number of (span-wise) points; if 'chord_surface' is given, the number of span-wise panels
+
+    spanwise_points : Union[np.ndarray, csdl.Variable], optional
+        points (num_pts, 3) whose first and last entry are the end points
+
+    chord_surface : Union[np.ndarray, csdl.Variable], optional
+        chord surface (num_chordwise+1, num_pts+1, 3) whose first and last 
+        rows are the LE and TE points
+
+    num_chordwise : int, optional
+        number of chord-wise panels (required with 'chord_surface')
+
+    flip : bool, optional
+        reverse the order of the span-wise points, by default False
+    """
     if spanwise_points is not None:
         i_vec = np.arange(0, num_pts)
         half_cos = 1 - np.cos(i_vec * np.pi / (2 * (num_pts - 1)))
+        if flip:
+            # p[num_pts-1-k] = end - (end - start) * half_cos[num_pts-1-k]
+            half_cos = half_cos[::-1]
 
-        half_cos_array = np.ones((num_pts, 3))
-        half_cos_array[:, 0] = half_cos
-        half_cos_array[:, 1] = half_cos
-        half_cos_array[:, 2] = half_cos
-
-        if flip is False:
-            points = spanwise_points[-1, :] - (spanwise_points[-1, :] - spanwise_points[0, :]) * half_cos_array
-
-        else:
-            points = np.flip(spanwise_points[-1, :] - (spanwise_points[-1, :] - spanwise_points[0, :]) * half_cos_array, axis=0)
+        start_point = spanwise_points[0, :]
+        end_point = spanwise_points[num_pts-1, :]
 
-        return points
+        return _interpolate_points(end_point, start_point, half_cos, action='k->ik')
 
     elif chord_surface is not None:
-        chord_surface = chord_surface.value.reshape((num_chordwise + 1, num_pts + 1, 3))
+        chord_surface = chord_surface.reshape((num_chordwise + 1, num_pts + 1, 3))
         i_vec = np.arange(0, num_chordwise + 1)
         half_cos = 1 - np.cos(i_vec * np.pi / (2 * (num_chordwise)))
 
-        new_chord_surface = np.zeros((num_chordwise + 1, num_pts+ 1, 3))
+        LE_points = chord_surface[0, :, :]
+        TE_points = chord_surface[num_chordwise, :, :]
 
-        new_chord_surface[:, :, 0] = (chord_surface[0, :, 0].reshape((num_pts + 1, 1)) - (chord_surface[0, :, 0] - chord_surface[-1, :, 0]).reshape((num_pts + 1, 1)) * half_cos.reshape((1, num_chordwise+1))).T
-        new_chord_surface[:, :, 1] = (chord_surface[0, :, 1].reshape((num_pts + 1, 1)) - (chord_surface[0, :, 1] - chord_surface[-1, :, 1]).reshape((num_pts + 1, 1)) * half_cos.reshape((1, num_chordwise+1))).T
-        new_chord_surface[:, :, 2] = (chord_surface[0, :, 2].reshape((num_pts + 1, 1)) - (chord_surface[0, :, 2] - chord_surface[-1, :, 2]).reshape((num_pts + 1, 1)) * half_cos.reshape((1, num_chordwise+1))).T
-
-        return new_chord_surface
-
-def make_mesh_symmetric(quantity, num_spanwise, spanwise_index=0):
-    num_spanwise_half = int(num_spanwise/2 + 1)
+        return _interpolate_points(LE_points, TE_points, half_cos, action='jk->ijk')
 
-    symmetric_quantity = csdl.Variable(shape=quantity.shape, value=0.)
+def _interpolate_points(points_a, points_b, weights:np.ndarray, action:str):
+    """Compute points_a + (points_b - points_a) * weights, where the weights 
+    (a fixed numpy vector) add a leading dimension; works for numpy arrays and csdl variables."""
+    shape = weights.shape + points_a.shape
+    weights_array = np.broadcast_to(weights.reshape(weights.shape + (1, ) * len(points_a.shape)), shape).copy()
     
-    for i in csdl.frange(num_spanwise_half):
-        # starting from wing center moving outward
-        index = int(num_spanwise/2) + i
-        symmetric_index = int(num_spanwise/2) - i
-        
-        # take the span-wise mean for x, z 
-        if spanwise_index is None:
-            spanwise_mean = (quantity[index] + quantity[symmetric_index]) / 2
-        
-        elif spanwise_index == 0:
-            spanwise_mean_x = (quantity[index, 0] + quantity[symmetric_index, 0]) / 2
-            spanwise_mean_z = (quantity[index, 2] + quantity[symmetric_index, 2]) / 2
-            
-            # in the y-direction, take mean of the absolute values
-            spanwise_mean_y = ((quantity[index, 1]**2)**0.5 + (quantity[symmetric_index, 1]**2)**0.5) / 2
-        
-        elif spanwise_index == 1:
-            spanwise_mean_x = (quantity[:, index, 0] + quantity[:, symmetric_index, 0]) / 2
-            spanwise_mean_z = (quantity[:, index, 2] + quantity[:, symmetric_index, 2]) / 2
-            
-            # in the y-direction, take mean of the absolute values
-            spanwise_mean_y = (((quantity[:, index, 1]+1e-5)**2)**0.5 + ((quantity[:, symmetric_index, 1]+1e-5)**2)**0.5) / 2
-            # spanwise_mean_y = (csdl.absolute(quantity[:, index, 1]) + csdl.absolute(quantity[:, symmetric_index, 1])) / 2
-
-        # Populate the csdl variable with the symmetric entries
-        if index == symmetric_index:
-            if spanwise_index is None:
-                symmetric_quantity = symmetric_quantity.set(
-                    slices=csdl.slice[index],
-                    value=spanwise_mean,
-                )
-            
-            elif spanwise_index == 0:
-                # x
-                symmetric_quantity = symmetric_quantity.set(
-                    slices=csdl.slice[index, 0],
-                    value=spanwise_mean_x,
-                )
-                # y
-                symmetric_quantity = symmetric_quantity.set(
-                    slices=csdl.slice[index, 1],
-                    value=spanwise_mean_y,
-                )
-                # z
-                symmetric_quantity = symmetric_quantity.set(
-                    slices=csdl.slice[index, 2],
-                    value=spanwise_mean_z,
-                )
-
-            elif spanwise_index == 1:
-                # x
-                symmetric_quantity = symmetric_quantity.set(
-                    slices=csdl.slice[:, index, 0],
-                    value=spanwise_mean_x,
-                )
-                # y
-                symmetric_quantity = symmetric_quantity.set(
-                    slices=csdl.slice[:, index, 1],
-                    value=spanwise_mean_y,
-                )
-                # z
-                symmetric_quantity = symmetric_quantity.set(
-                    slices=csdl.slice[:, index, 2],
-                    value=spanwise_mean_z,
-                )
-
-        else:
-            if spanwise_index is None:
-                symmetric_quantity = symmetric_quantity.set(
-                    slices=csdl.slice[index],
-                    value=spanwise_mean,
-                )
+    if isinstance(points_a, csdl.Variable) or isinstance(points_b, csdl.Variable):
+        points_a_exp = csdl.expand(points_a, shape, action=action)
+        difference_exp = csdl.expand(points_b - points_a, shape, action=action)
+        return points_a_exp + difference_exp * weights_array
+
+    points_a = np.asarray(points_a)
+    points_b = np.asarray(points_b)
+    return points_a[None] + (points_b - points_a)[None] * weights_array
+
+def _get_mirror_indices(num_spanwise:int):
+    """Return the number of mirrored span-wise entries, the index of each 
+    entry's mirror image and the sign of the span-wise (y) coordinate."""
+    num_spanwise_half = int(num_spanwise/2 + 1)
+    center_index = int(num_spanwise/2)
+    num_entries = center_index + num_spanwise_half
+    indices = np.arange(num_entries)
+    mirror_indices = 2 * center_index - indices
+    signs = np.where(indices >= center_index, 1., -1.)
+    return num_entries, mirror_indices, signs
 
-                symmetric_quantity = symmetric_quantity.set(
-                    slices=csdl.slice[symmetric_index],
-                    value=spanwise_mean,
-                )
+def make_mesh_symmetric(quantity, num_spanwise, spanwise_index=0):
+    """Make a quantity symmetric w.r.t. the (span-wise) center index.
 
-            elif spanwise_index == 0:
-                # x
-                symmetric_quantity = symmetric_quantity.set(
-                    slices=csdl.slice[index, 0],
-                    value=spanwise_mean_x,
-                )
+    Each entry is replaced by the mean of itself and its mirror image; for 
+    coordinates (spanwise_index = 0 or 1), the y-coordinate is the mean 
+    of the absolute values with the sign of the respective half. The mirror
+    images are gathered at once rather than set index by index.
 
-                symmetric_quantity = symmetric_quantity.set(
-                    slices=csdl.slice[symmetric_index, 0],
-                    value=spanwise_mean_x,
-                )
+    Parameters
+    ----------
+    quantity : csdl.Variable
+        quantity with the span-wise dimension first (spanwise_index = None or 0) 
+        or second (spanwise_index = 1); for 0 and 1 the last dimension holds (x, y, z)
 
-                # y
-                symmetric_quantity = symmetric_quantity.set(
-                    slices=csdl.slice[index, 1],
-                    value=spanwise_mean_y,
-                )
+    num_spanwise : int
+        number of span-wise panels (or number of nodes for an odd number of nodes)
 
-                symmetric_quantity = symmetric_quantity.set(
-                    slices=csdl.slice[symmetric_index, 1],
-                    value=-spanwise_mean_y,
-                )
+    spanwise_index : int, None
+        see above, by default 0
+    """
+    shape = quantity.shape
+    num_entries, mirror_indices, signs = _get_mirror_indices(num_spanwise)
+    span_axis = 1 if spanwise_index == 1 else 0
+    num_leading = int(np.prod(shape[0:span_axis]))
+    num_span = shape[span_axis]
+    num_trailing = int(np.prod(shape[span_axis+1:]))
 
-                # z
-                symmetric_quantity = symmetric_quantity.set(
-                    slices=csdl.slice[index, 2],
-                    value=spanwise_mean_z,
-                )
+    # gather the entries and their mirror images (flattened to rows)
+    rows = (np.arange(num_leading).reshape((-1, 1)) * num_span + np.arange(num_entries).reshape((1, -1))).flatten()
+    mirror_rows = (np.arange(num_leading).reshape((-1, 1)) * num_span + mirror_indices.reshape((1, -1))).flatten()
+    quantity_flat = quantity.reshape((num_leading * num_span, num_trailing))
+    entries = quantity_flat[rows.tolist()]
+    mirror_entries = quantity_flat[mirror_rows.tolist()]
 
-                symmetric_quantity = symmetric_quantity.set(
-                    slices=csdl.slice[symmetric_index, 2],
-                    value=spanwise_mean_z,
-                )
+    symmetric_entries = (entries + mirror_entries) / 2
+    if spanwise_index is not None:
+        # in the y-direction, take mean of the absolute values
+        offset = 1e-5 if spanwise_index == 1 else 0.
+        spanwise_mean_y = (((entries[:, 1] + offset)**2)**0.5 + ((mirror_entries[:, 1] + offset)**2)**0.5) / 2
+        symmetric_entries = symmetric_entries.set(csdl.slice[:, 1], spanwise_mean_y * np.tile(signs, num_leading))
 
-            if spanwise_index == 1:
-                # x
-                symmetric_quantity = symmetric_quantity.set(
-                    slices=csdl.slice[:, index, 0],
-                    value=spanwise_mean_x,
-                )
+    symmetric_entries = symmetric_entries.reshape(shape[0:span_axis] + (num_entries, ) + shape[span_axis+1:])
+    if num_entries == num_span:
+        return symmetric_entries
 
-                symmetric_quantity = symmetric_quantity.set(
-                    slices=csdl.slice[:, symmetric_index, 0],
-                    value=spanwise_mean_x,
-                )
+    symmetric_quantity = csdl.Variable(shape=shape, value=0.)
+    if span_axis == 0:
+        return symmetric_quantity.set(csdl.slice[0:num_entries], symmetric_entries)
+    return symmetric_quantity.set(csdl.slice[:, 0:num_entries], symmetric_entries)
 
-                # y
-                symmetric_quantity = symmetric_quantity.set(
-                    slices=csdl.slice[:, index, 1],
-                    value=spanwise_mean_y,
-                )
 
-                symmetric_quantity = symmetric_quantity.set(
-                    slices=csdl.slice[:, symmetric_index, 1],
-                    value=-spanwise_mean_y,
-                )
+# aggregation parameter of the (KS) maximum thickness-to-chord ratio
+_MAX_THICKNESS_TO_CHORD_RHO = 1e4
 
-                # z
-                symmetric_quantity = symmetric_quantity.set(
-                    slices=csdl.slice[:, index, 2],
-                    value=spanwise_mean_z,
-                )
 
-                symmetric_quantity = symmetric_quantity.set(
-                    slices=csdl.slice[:, symmetric_index, 2],
-                    value=spanwise_mean_z,
-                )
-    return symmetric_quantity
+@dataclass
+class SectionalAirfoils(csdl.VariableGroup):
+    """Airfoil sections of a camber surface (see 'CamberSurface.extract_airfoil_sections').
 
+    All quantities have a leading (num_nodes) axis, which is one for a 
+    single camber surface and the number of conditions for a vectorized one.
+    """
+    upper_coordinates : csdl.Variable = None
+    lower_coordinates : csdl.Variable = None
+    chord : csdl.Variable = None
+    twist : csdl.Variable = None
+    thickness_to_chord : csdl.Variable = None
+    max_thickness_to_chord : csdl.Variable = None
+
+    @classmethod
+    def _stack_conditions(cls, sections_list: list) -> SectionalAirfoils:
+        """Stack the sections of several conditions along the leading (num_nodes) axis."""
+        num_nodes = len(sections_list)
+        stacked_quantities = {}
+        for field_name in ["upper_coordinates", "lower_coordinates", "chord", "twist", "thickness_to_chord", "max_thickness_to_chord"]:
+            quantities = [getattr(sections, field_name) for sections in sections_list]
+            shape = quantities[0].shape[1:]
+            stacked_quantity = csdl.Variable(shape=(num_nodes, ) + shape, value=0.)
+            for i, quantity in enumerate(quantities):
+                stacked_quantity = stacked_quantity.set(csdl.slice[i], quantity.reshape(shape))
+            stacked_quantities[field_name] = stacked_quantity
+        
+        return cls(**stacked_quantities)
 
 @dataclass
 class CamberSurface(Discretization):
@@ -202,12 +177,16 @@ class CamberSurface(Discretization):
     _lower_wireframe_para = None
     _airfoil_upper_para = None
     _airfoil_lower_para = None
+    _num_airfoil_points = None
     _geom = None
     _num_chord_wise = None
     _num_spanwise = None
     _LE_points_para = None
     _TE_points_para = None
     _chordwise_spacing = None
+    _half_model = False
+
+    symmetry_plane = None
 
     embedded_airfoil_model_Cl = None
     embedded_airfoil_model_Cd = None
@@ -233,6 +212,11 @@ class CamberSurface(Discretization):
         discretization._LE_points_para = self._LE_points_para
         discretization._TE_points_para = self._TE_points_para
         discretization._chordwise_spacing = self._chordwise_spacing
+        discretization._airfoil_upper_para = self._airfoil_upper_para
+        discretization._airfoil_lower_para = self._airfoil_lower_para
+        discretization._num_airfoil_points = self._num_airfoil_points
+        discretization._half_model = self._half_model
+        discretization.symmetry_plane = self.symmetry_plane
 
         discretization.embedded_airfoil_model_Cl = self.embedded_airfoil_model_Cl
         discretization.embedded_airfoil_model_Cd = self.embedded_airfoil_model_Cd
@@ -281,8 +265,12 @@ class CamberSurface(Discretization):
         LE_points_csdl_mid_panel = LE_points_csdl_mid_panel.set(csdl.slice[:, 0], LE_points_csdl_mid_panel[:, 0] + 0.1)
         TE_points_csdl_mid_panel = TE_points_csdl_mid_panel.set(csdl.slice[:, 0], TE_points_csdl_mid_panel[:, 0] - 0.1)
 
-        LE_points_re_projected = wing_geometry.evaluate(wing_geometry.project(LE_points_csdl_mid_panel, grid_search_density_parameter=grid_search_density, plot=plot))
-        TE_points_re_projected = wing_geometry.evaluate(wing_geometry.project(TE_points_csdl_mid_panel, grid_search_density_parameter=grid_search_density, plot=plot))
+        # re-project the LE and TE points of all stations in one call
+        LE_TE_points_re_projected = wing_geometry.evaluate(wing_geometry.project(
+            csdl.vstack((LE_points_csdl_mid_panel, TE_points_csdl_mid_panel)), grid_search_density_parameter=grid_search_density, plot=plot
+        ))
+        LE_points_re_projected = LE_TE_points_re_projected[0:num_spanwise, :]
+        TE_points_re_projected = LE_TE_points_re_projected[num_spanwise:, :]
         
         num_chordwise = len(norm_chord_wise_coordinates)
         chord_surface = csdl.linear_combination(LE_points_re_projected, TE_points_re_projected, num_chordwise)
@@ -306,23 +294,121 @@ class CamberSurface(Discretization):
             chord_surface.shape, action='k->ijk'
         )
 
-        self._airfoil_upper_para = wing_geometry.project(
+        self._airfoil_upper_para = ParametricCoordinates.from_list(wing_geometry.project(
             chord_surface - vertical_offset_1, 
             direction=np.array([0., 0., 1.]), 
             plot=plot, 
             grid_search_density_parameter=grid_search_density
-        )
+        ))
 
-        self._airfoil_lower_para = wing_geometry.project(
+        self._airfoil_lower_para = ParametricCoordinates.from_list(wing_geometry.project(
             chord_surface + vertical_offset_1, 
             direction=np.array([0., 0., -1]), 
             plot=plot, 
             grid_search_density_parameter=grid_search_density,
-        )
+        ))
+        self._num_airfoil_points = num_chordwise
 
         return self._airfoil_lower_para, self._airfoil_upper_para
+
+    def extract_airfoil_sections(self, num_points: int=120, spacing: str="sin", 
+                                 grid_search_density: int=10, plot: bool=False, oml_geometry=None) -> SectionalAirfoils:
+        """Extract the local airfoil coordinates, chord, twist and thickness-to-chord 
+        ratio at the (mid-panel) span-wise stations of the camber surface.
+
+        The upper and lower surface points are projected once (see 
+        'project_airfoil_points') and the cached parametric coordinates 
+        of all stations are evaluated in a single call, such that the 
+        sections can be re-extracted cheaply after geometry updates.
+        For a vectorized camber surface, the sections of all conditions 
+        are stacked along the leading (num_nodes) axis.
+
+        Parameters
+        ----------
+        num_points : int, optional
+            number of chord-wise points per surface, by default 120
+
+        spacing : str, optional
+            chord-wise spacing of the points, by default "sin"
+
+        grid_search_density : int, optional
+            grid search density of the projections, by default 10
+
+        oml_geometry : lg.Geometry, optional
+            geometry to project onto and evaluate, by default the wing geometry
+
+        Returns
+        -------
+        SectionalAirfoils
+            local (x/c, z/c) coordinates of shape (num_nodes, num_span, num_chord, 2), 
+            chord, twist (nose-up positive) and maximum thickness-to-chord ratio 
+            (a smooth KS maximum, which exceeds the maximum of the distribution by 
+            at most log(num_points) / 1e4) of shape (num_nodes, num_span), and the 
+            thickness-to-chord distribution 
+            of shape (num_nodes, num_span, num_chord), where num_nodes is one 
+            for a single (i.e., not vectorized) camber surface and num_span is 
+            halved for half models
+        """
+        airfoil_lower_para, airfoil_upper_para = self.project_airfoil_points(
+            num_points=num_points, spacing=spacing, grid_search_density=grid_search_density, plot=plot, oml_geometry=oml_geometry,
+        )
+        wing_geometry = self._geom if oml_geometry is None else oml_geometry
+        num_spanwise = self._num_spanwise
+        num_chordwise = self._num_airfoil_points
+
+        points = wing_geometry.evaluate(ParametricCoordinates.concatenate([airfoil_upper_para, airfoil_lower_para]))
+        points = points.reshape((2, num_chordwise, num_spanwise, 3))
+        # half models only keep the stations with y >= 0
+        upper_points = self._get_half_model(points[0])
+        lower_points = self._get_half_model(points[1])
+        num_spanwise = upper_points.shape[1]
+
+        LE_points = (upper_points[0] + lower_points[0]) / 2
+        TE_points = (upper_points[-1] + lower_points[-1]) / 2
+
+        # chord line in the (streamwise) x-z plane of each section
+        delta_x = TE_points[:, 0] - LE_points[:, 0]
+        delta_z = TE_points[:, 2] - LE_points[:, 2]
+        chord = (delta_x**2 + delta_z**2)**0.5
+        twist = csdl.arcsin(-delta_z / chord)
+
+        cos_exp = csdl.expand(delta_x / chord**2, (num_chordwise, num_spanwise), action="j->ij")
+        sin_exp = csdl.expand(delta_z / chord**2, (num_chordwise, num_spanwise), action="j->ij")
+        LE_x_exp = csdl.expand(LE_points[:, 0], (num_chordwise, num_spanwise), action="j->ij")
+        LE_z_exp = csdl.expand(LE_points[:, 2], (num_chordwise, num_spanwise), action="j->ij")
+
+        coordinates = {}
+        for surface, surface_points in (("upper", upper_points), ("lower", lower_points)):
+            relative_x = surface_points[:, :, 0] - LE_x_exp
+            relative_z = surface_points[:, :, 2] - LE_z_exp
+            local_coordinates = csdl.Variable(shape=(1, num_spanwise, num_chordwise, 2), value=0.)
+            local_coordinates = local_coordinates.set(csdl.slice[0, :, :, 0], (relative_x * cos_exp + relative_z * sin_exp).T())
+            local_coordinates = local_coordinates.set(csdl.slice[0, :, :, 1], (relative_z * cos_exp - relative_x * sin_exp).T())
+            coordinates[surface] = local_coordinates
+
+        thickness_to_chord = coordinates["upper"][:, :, :, 1] - coordinates["lower"][:, :, :, 1]
+
+        # smooth (KS) maximum over the chord-wise points of each station, such that 
+        # it is part of the graph (i.e., it tracks geometry updates and has derivatives)
+        max_thickness_to_chord = csdl.maximum(thickness_to_chord, axes=(2, ), rho=_MAX_THICKNESS_TO_CHORD_RHO)
+
+        return SectionalAirfoils(
+            upper_coordinates=coordinates["upper"],
+            lower_coordinates=coordinates["lower"],
+            chord=chord.reshape((1, num_spanwise)),
+            twist=twist.reshape((1, num_spanwise)),
+            thickness_to_chord=thickness_to_chord,
+            max_thickness_to_chord=max_thickness_to_chord,
+        )
         
 
+    def _get_half_model(self, surface):
+        """Return the half (y >= 0) of a symmetric surface for half models; 
+        the full surface otherwise."""
+        if not self._half_model:
+            return surface
+        return surface[:, int(self._num_spanwise/2):, :]
+
     def _update(self):
         if self._upper_wireframe_para is not None and self._lower_wireframe_para is not None:
             # Re-evaluate the geometry after coefficients have changed
@@ -335,7 +421,7 @@ class CamberSurface(Discretization):
             # Ensure that the mesh is symmetric across the xz-plane
             camber_surface = make_mesh_symmetric(camber_surface_raw, self._num_spanwise, spanwise_index=1)
 
-            self.nodal_coordinates = camber_surface
+            self.nodal_coordinates = self._get_half_model(camber_surface)
 
             return self
         
@@ -361,7 +447,7 @@ class CamberSurface(Discretization):
             chord_surface = chord_surface.reshape((self._num_chord_wise+1, self._num_spanwise+1, 3))
             chord_surface_sym = make_mesh_symmetric(chord_surface, self._num_spanwise, spanwise_index=1)
 
-            self.nodal_coordinates = chord_surface_sym
+            self.nodal_coordinates = self._get_half_model(chord_surface_sym)
 
 
             return self
@@ -378,75 +464,9 @@ class CamberSurfaceDict(DiscretizationsDict):
 class VLMMesh(SolverMesh):
     discretizations : dict[CamberSurface] = CamberSurfaceDict()
 
-def make_vlm_surface(
-    wing_comp,
-    num_spanwise: int,
-    num_chordwise: int, 
-    spacing_spanwise: str = 'linear',
-    spacing_chordwise: str = 'linear',
-    chord_wise_points_for_airfoil = None,
-    ignore_camber: bool = False, 
-    plot: bool = False,
-    grid_search_density: int = 10,
-    LE_interp : Union[str, None] = None,
-    TE_interp : Union[str, None] = None,
-) -> CamberSurface:
-    """Make a VLM camber surface mesh for wing-like components. This method is NOT 
-    intended for vertically oriented lifting surfaces like a vertical tail.
-
-    Parameters
-    ----------
-    wing_comp : Wing
-        instance of a 'Wing' component
-    
-    num_spanwise : int
-        number of span-wise panels (note that if odd, 
-        central panel will be larger)
-    
-    num_chordwise : int
-        number of chord-wise panels
-    
-    spacing_spanwise : str, optional
-        spacing of the span-wise panels (linear or cosine 
-        currently supported), by default 'linear'
-    
-    spacing_chordwise : str, optional
-        spacing of the chord-wise panels (linear or cosine 
-        currently supported), by default 'linear'
-    
-    plot : bool, optional
-        plot the projections, by default False
-    
-    grid_search_density : int, optional
-        parameter to refine the quality of projections (note that the higher this parameter 
-        the longer the projections will take; for finer meshes, especially with cosine 
-        spacing, a value of 40-50 is recommended), by default 10
-
-    Returns
-    -------
-    VLMMesh: csdl.VariableGroup
-        data class storing the mesh coordinates and mesh velocities (latter will be set later)
-
-    """
-    from CADDEE_alpha.core.aircraft.components.wing import Wing
-    csdl.check_parameter(wing_comp, "wing_comp", types=Wing)
-    csdl.check_parameter(num_spanwise, "num_spanwise", types=int)
-    csdl.check_parameter(num_chordwise, "num_chordwise", types=int)
-    csdl.check_parameter(spacing_spanwise, "spacing_spanwise", values=("linear", "cosine"))
-    csdl.check_parameter(spacing_chordwise, "spacing_chordwise", values=("linear", "cosine"))
-    csdl.check_parameter(plot, "plot", types=bool)
-    csdl.check_parameter(grid_search_density, "grid_search_density", types=int)
-    csdl.check_parameter(ignore_camber, "ignore_camber", types=bool)
-    csdl.check_parameter(LE_interp, "LE_interp", values=("ellipse", None))
-    csdl.check_parameter(TE_interp, "TE_interp", values=("ellipse", None))
-
-    if wing_comp.geometry is None:
-        raise Exception("Cannot generate mesh for component with geoemetry=None")
-
-    if num_spanwise % 2 != 0:
-        raise Exception("Number of spanwise panels must be even.")
-
-    wing_geometry: FunctionSet = wing_comp.geometry
+def _compute_spanwise_LE_TE_points(wing_comp, num_spanwise, spacing_spanwise, LE_interp, TE_interp):
+    """Compute the (not yet projected) span-wise LE and TE stations of a wing."""
+    wing_geometry = wing_comp.geometry
 
     LE_left_point = wing_geometry.evaluate(wing_comp._LE_left_point).value
     LE_mid_point = wing_geometry.evaluate(wing_comp._LE_mid_point).value
@@ -587,156 +607,181 @@ def make_vlm_surface(
     else:
         raise NotImplementedError
 
-    LE_points_para = wing_geometry.project(LE_points, plot=plot)
-    TE_points_para = wing_geometry.project(TE_points, plot=plot)
+    return LE_points, TE_points
 
-    LE_points_csdl = wing_geometry.evaluate(LE_points_para)
-    TE_points_csdl = wing_geometry.evaluate(TE_points_para)
-    
-    y_mean_spanwise = (LE_points_csdl[:, 1] + TE_points_csdl[:, 1])/ 2 
-    LE_points_csdl = LE_points_csdl.set(csdl.slice[:, 1], y_mean_spanwise)
-    TE_points_csdl = TE_points_csdl.set(csdl.slice[:, 1], y_mean_spanwise)
 
-    
+@dataclass
+class SectionalProjections:
+    """Projected span-wise stations (LE/TE) and chord-wise wireframes 
+    (upper/lower surface) of a wing at a given resolution.
 
-    if spacing_chordwise == "linear":
-        chord_surface = csdl.linear_combination(LE_points_csdl, TE_points_csdl, num_chordwise+1).reshape((num_chordwise+1, num_spanwise+1, 3))
-    
-    elif spacing_chordwise == "cosine":
-        # chord_surface = csdl.linear_combination(TE_points_csdl, LE_points_csdl, num_chordwise+1).reshape((-1, 3))
-        chord_surface = cosine_spacing(
-            num_spanwise, 
-            None,
-            csdl.linear_combination(LE_points_csdl, TE_points_csdl, num_chordwise+1),
-            num_chordwise
-        )
+    Instances are cached per wing (see 'get_sectional_projections') and 
+    shared between meshers, e.g., 'make_vlm_surface' and 'make_wing_panel_mesh'.
+    """
+    num_spanwise: int
+    num_chordwise: int
+    spacing_chordwise: str
+    LE_points_para: list
+    TE_points_para: list
+    upper_wireframe_para: Union[list, ParametricCoordinates, None] = None
+    lower_wireframe_para: Union[list, ParametricCoordinates, None] = None
+
+    def evaluate_LE_TE_points(self, geometry):
+        """Evaluate the LE and TE stations with a common (mean) y-coordinate."""
+        LE_points_csdl = geometry.evaluate(self.LE_points_para)
+        TE_points_csdl = geometry.evaluate(self.TE_points_para)
+        
+        y_mean_spanwise = (LE_points_csdl[:, 1] + TE_points_csdl[:, 1])/ 2 
+        LE_points_csdl = LE_points_csdl.set(csdl.slice[:, 1], y_mean_spanwise)
+        TE_points_csdl = TE_points_csdl.set(csdl.slice[:, 1], y_mean_spanwise)
 
-    chord_surface = chord_surface.reshape((num_chordwise+1, num_spanwise+1, 3))
-    if ignore_camber:
-        chord_surface_sym = make_mesh_symmetric(chord_surface, num_spanwise, spanwise_index=1)
-        vlm_mesh = CamberSurface(
-            nodal_coordinates=chord_surface_sym,
-        )
-        vlm_mesh._geom = wing_geometry
-        vlm_mesh._num_chord_wise = num_chordwise
-        vlm_mesh._num_spanwise = num_spanwise
-        vlm_mesh._num_chord_wise = num_chordwise
-        vlm_mesh._chordwise_spacing = spacing_chordwise
-        vlm_mesh._LE_points_para = LE_points_para
-        vlm_mesh._TE_points_para = TE_points_para
+        return LE_points_csdl, TE_points_csdl
 
-        wing_comp._discretizations[f"{wing_comp._name}_vlm_camber_mesh"] = vlm_mesh
+    def evaluate_chord_surface(self, geometry):
+        """Evaluate the (flat) chord surface between the LE and TE stations; 
+        shape (num_chordwise+1, num_spanwise+1, 3)."""
+        num_chordwise = self.num_chordwise
+        num_spanwise = self.num_spanwise
+        LE_points_csdl, TE_points_csdl = self.evaluate_LE_TE_points(geometry)
 
-    else:
-        vertical_offset_1 = csdl.expand(
-            csdl.Variable(shape=(3, ), value=np.array([0., 0., 0.25])),
-            chord_surface.shape, action='k->ijk'
+        if self.spacing_chordwise == "linear":
+            chord_surface = csdl.linear_combination(LE_points_csdl, TE_points_csdl, num_chordwise+1).reshape((num_chordwise+1, num_spanwise+1, 3))
+        
+        elif self.spacing_chordwise == "cosine":
+            chord_surface = cosine_spacing(
+                num_spanwise, 
+                None,
+                csdl.linear_combination(LE_points_csdl, TE_points_csdl, num_chordwise+1),
+                num_chordwise
+            )
+
+        return chord_surface.reshape((num_chordwise+1, num_spanwise+1, 3))
+
+    def subsample(self, num_spanwise: int, num_chordwise: int) -> SectionalProjections:
+        """Derive the projections of a coarser (nested) resolution by 
+        sub-sampling the parametric coordinates; no projections are needed.
+
+        The span-wise and chord-wise resolutions must divide the 
+        resolution of this instance (linear and cosine spacing are nested).
+        """
+        if self.num_spanwise % num_spanwise != 0 or self.num_chordwise % num_chordwise != 0:
+            raise ValueError(f"Resolution ({num_spanwise}, {num_chordwise}) is not nested in ({self.num_spanwise}, {self.num_chordwise}); "
+                             "the number of span-wise and chord-wise panels must divide the fine resolution")
+        if num_spanwise % 2 != 0:
+            raise ValueError("Number of spanwise panels must be even.")
+        
+        spanwise_stride = self.num_spanwise // num_spanwise
+        chordwise_stride = self.num_chordwise // num_chordwise
+
+        projections = SectionalProjections(
+            num_spanwise=num_spanwise,
+            num_chordwise=num_chordwise,
+            spacing_chordwise=self.spacing_chordwise,
+            LE_points_para=ParametricCoordinates.from_list(self.LE_points_para)[::spanwise_stride],
+            TE_points_para=ParametricCoordinates.from_list(self.TE_points_para)[::spanwise_stride],
         )
 
-        upper_surace_wireframe_para = wing_geometry.project(
-            chord_surface - vertical_offset_1, 
-            direction=np.array([0., 0., 1.]), 
-            plot=plot, 
-            grid_search_density_parameter=grid_search_density
-        )
+        if self.upper_wireframe_para is not None:
+            grid_indices = np.arange((self.num_chordwise + 1) * (self.num_spanwise + 1)).reshape(
+                (self.num_chordwise + 1, self.num_spanwise + 1)
+            )[::chordwise_stride, ::spanwise_stride].flatten()
+            projections.upper_wireframe_para = ParametricCoordinates.from_list(self.upper_wireframe_para)[grid_indices]
+            projections.lower_wireframe_para = ParametricCoordinates.from_list(self.lower_wireframe_para)[grid_indices]
 
-        lower_surace_wireframe_para = wing_geometry.project(
-            chord_surface + vertical_offset_1, 
-            direction=np.array([0., 0., -1]), 
-            plot=plot, 
-            grid_search_density_parameter=grid_search_density,
-        )
+        return projections
 
-        upper_surace_wireframe = wing_geometry.evaluate(upper_surace_wireframe_para).reshape((num_chordwise + 1, num_spanwise + 1, 3))
-        lower_surace_wireframe = wing_geometry.evaluate(lower_surace_wireframe_para).reshape((num_chordwise + 1, num_spanwise + 1, 3))
 
-        # compute the camber surface as the mean of the upper and lower wireframe
-        camber_surface_raw = (upper_surace_wireframe + lower_surace_wireframe) / 2
+def _sectional_projection_keys(num_spanwise, num_chordwise, spacing_spanwise, spacing_chordwise, 
+                               LE_interp, TE_interp, grid_search_density):
+    """Return the cache keys of the span-wise stations and of the full sectional projections."""
+    spanwise_key = ("spanwise", num_spanwise, spacing_spanwise, LE_interp, TE_interp)
+    return spanwise_key, spanwise_key + (num_chordwise, spacing_chordwise, grid_search_density)
 
-        # Ensure that the mesh is symmetric across the xz-plane
-        camber_surface = make_mesh_symmetric(camber_surface_raw, num_spanwise, spanwise_index=1)
-    
-        vlm_mesh = CamberSurface(
-            nodal_coordinates=camber_surface,
-        )
-        vlm_mesh._geom = wing_geometry
-        vlm_mesh._lower_wireframe_para = lower_surace_wireframe_para
-        vlm_mesh._upper_wireframe_para = upper_surace_wireframe_para
-        vlm_mesh._num_chord_wise = num_chordwise
-        vlm_mesh._num_spanwise = num_spanwise
 
-    if chord_wise_points_for_airfoil is not None:
-        LE_points_csdl_mid_panel = (LE_points_csdl[0:-1, :] + LE_points_csdl[1:, :]) / 2
-        TE_points_csdl_mid_panel = (TE_points_csdl[0:-1, :] + TE_points_csdl[1:, :]) / 2
-
-        LE_points_csdl_mid_panel = LE_points_csdl_mid_panel.set(csdl.slice[:, 0], LE_points_csdl_mid_panel[:, 0] + 0.1)
-        TE_points_csdl_mid_panel = TE_points_csdl_mid_panel.set(csdl.slice[:, 0], TE_points_csdl_mid_panel[:, 0] - 0.1)
+def get_sectional_projections(
+    wing_comp,
+    num_spanwise: int,
+    num_chordwise: int,
+    spacing_spanwise: str = 'linear',
+    spacing_chordwise: str = 'linear',
+    LE_interp : Union[str, None] = None,
+    TE_interp : Union[str, None] = None,
+    grid_search_density: int = 10,
+    project_wireframes: bool = True,
+    plot: bool = False,
+) -> SectionalProjections:
+    """Get the sectional projections of a wing at a given resolution.
 
-        LE_points_re_projected = wing_geometry.evaluate(wing_geometry.project(LE_points_csdl_mid_panel, grid_search_density_parameter=grid_search_density, plot=plot))
-        TE_points_re_projected = wing_geometry.evaluate(wing_geometry.project(TE_points_csdl_mid_panel, grid_search_density_parameter=grid_search_density, plot=plot))
-        
-        num_chordwise = len(chord_wise_points_for_airfoil)
-        # chord_surface = csdl.linear_combination(LE_points_csdl_mid_panel, TE_points_csdl_mid_panel, num_chordwise)
-        chord_surface = csdl.linear_combination(LE_points_re_projected, TE_points_re_projected, num_chordwise)
+    The projections are cached on the wing: the span-wise LE/TE stations 
+    are shared by all chord-wise resolutions, and the upper/lower 
+    wireframes are only projected once per resolution (and only if 
+    'project_wireframes' is True).
 
-        x_interp = csdl.Variable(shape=(num_chordwise, ), value=chord_wise_points_for_airfoil)
-        x_interp_exp = csdl.expand(x_interp, (num_chordwise, num_spanwise), action="i->ij")
-        # LE_exp_x = csdl.expand(LE_points_csdl_mid_panel[:, 0], (num_chordwise, num_spanwise), action="j->ij")
-        # TE_exp_x = csdl.expand(TE_points_csdl_mid_panel[:, 0], (num_chordwise, num_spanwise), action="j->ij")
+    Parameters
+    ----------
+    wing_comp : Wing
+        instance of a 'Wing' component
 
-        LE_exp_x = csdl.expand(LE_points_re_projected[:, 0], (num_chordwise, num_spanwise), action="j->ij")
-        TE_exp_x = csdl.expand(TE_points_re_projected[:, 0], (num_chordwise, num_spanwise), action="j->ij")
+    project_wireframes : bool, optional
+        project the chord surface onto the upper and lower wing surface, by default True
 
-        skewed_chord_surface_x = LE_exp_x + (TE_exp_x - LE_exp_x) * x_interp_exp
+    See 'make_vlm_surface' for the remaining parameters.
+    """
+    wing_geometry = wing_comp.geometry
+    cache = wing_comp._sectional_projections
 
+    spanwise_key, key = _sectional_projection_keys(
+        num_spanwise, num_chordwise, spacing_spanwise, spacing_chordwise, 
+        LE_interp, TE_interp, grid_search_density,
+    )
 
-        chord_surface = chord_surface.set(
-            csdl.slice[:, :, 0],
-            skewed_chord_surface_x,
+    if key not in cache:
+        if spanwise_key not in cache:
+            LE_points, TE_points = _compute_spanwise_LE_TE_points(
+                wing_comp, num_spanwise, spacing_spanwise, LE_interp, TE_interp
+            )
+            cache[spanwise_key] = (
+                wing_geometry.project(LE_points, plot=plot),
+                wing_geometry.project(TE_points, plot=plot),
+            )
+        
+        LE_points_para, TE_points_para = cache[spanwise_key]
+        cache[key] = SectionalProjections(
+            num_spanwise=num_spanwise,
+            num_chordwise=num_chordwise,
+            spacing_chordwise=spacing_chordwise,
+            LE_points_para=LE_points_para,
+            TE_points_para=TE_points_para,
         )
+    
+    projections = cache[key]
 
+    if project_wireframes and projections.upper_wireframe_para is None:
+        chord_surface = projections.evaluate_chord_surface(wing_geometry)
+        
         vertical_offset_1 = csdl.expand(
             csdl.Variable(shape=(3, ), value=np.array([0., 0., 0.25])),
             chord_surface.shape, action='k->ijk'
         )
 
-        airfoil_upper_para = wing_geometry.project(
+        projections.upper_wireframe_para = wing_geometry.project(
             chord_surface - vertical_offset_1, 
             direction=np.array([0., 0., 1.]), 
             plot=plot, 
             grid_search_density_parameter=grid_search_density
         )
 
-        airfoil_lower_para = wing_geometry.project(
+        projections.lower_wireframe_para = wing_geometry.project(
             chord_surface + vertical_offset_1, 
             direction=np.array([0., 0., -1]), 
             plot=plot, 
             grid_search_density_parameter=grid_search_density,
         )
 
-        vlm_mesh._airfoil_upper_para = airfoil_upper_para
-        vlm_mesh._airfoil_lower_para = airfoil_lower_para
-
-        vlm_mesh.airfoil_nodes_upper = wing_geometry.evaluate(airfoil_upper_para)
-        vlm_mesh.airfoil_nodes_lower = wing_geometry.evaluate(airfoil_lower_para)
-
-
-
-
+    return projections
 
-    wing_comp._discretizations[f"{wing_comp._name}_vlm_camber_mesh"] = vlm_mesh
-
-    return vlm_mesh
-
-@dataclass
-class PanelDiscretization(Discretization):
-    nodal_coordinates:csdl.Variable=None
-    
-class PanelMesh(SolverMesh):
-    def __init__(self):
-        self.discretizations = DiscretizationsDict()
 
-def make_wing_panel_mesh(
+def make_vlm_surface(
     wing_comp,
     num_spanwise: int,
     num_chordwise: int, 
@@ -748,8 +793,9 @@ def make_wing_panel_mesh(
     grid_search_density: int = 10,
     LE_interp : Union[str, None] = None,
     TE_interp : Union[str, None] = None,
-) -> PanelMesh:
-    """Make a panel mesh for wing-like components. This method is NOT 
+    half_model: bool = False,
+) -> CamberSurface:
+    """Make a VLM camber surface mesh for wing-like components. This method is NOT 
     intended for vertically oriented lifting surfaces like a vertical tail.
 
     Parameters
@@ -780,14 +826,22 @@ def make_wing_panel_mesh(
         the longer the projections will take; for finer meshes, especially with cosine 
         spacing, a value of 40-50 is recommended), by default 10
 
+    half_model : bool, optional
+        only keep the (y >= 0) half of the symmetric mesh, which is tagged with 
+        symmetry_plane = "xz", for symmetric conditions (the loads are passed as 
+        'half_model_forces' and 'half_model_moments' to 'assemble_forces_and_moments'); 
+        the airfoil nodes and sections are only kept at the (num_spanwise / 2) 
+        mid-panel stations of this half, by default False
+
     Returns
     -------
-    wing_panel_mesh: csdl.VariableGroup
+    VLMMesh: csdl.VariableGroup
         data class storing the mesh coordinates and mesh velocities (latter will be set later)
 
     """
     from CADDEE_alpha.core.aircraft.components.wing import Wing
     csdl.check_parameter(wing_comp, "wing_comp", types=Wing)
+    csdl.check_parameter(half_model, "half_model", types=bool)
     csdl.check_parameter(num_spanwise, "num_spanwise", types=int)
     csdl.check_parameter(num_chordwise, "num_chordwise", types=int)
     csdl.check_parameter(spacing_spanwise, "spacing_spanwise", values=("linear", "cosine"))
@@ -802,195 +856,295 @@ def make_wing_panel_mesh(
         raise Exception("Cannot generate mesh for component with geoemetry=None")
 
     if num_spanwise % 2 != 0:
-        raise Exception("Number of spanwise panels must be even.")
+        raise ValueError("Number of spanwise panels must be even.")
 
     wing_geometry: FunctionSet = wing_comp.geometry
+    projections = get_sectional_projections(
+        wing_comp, num_spanwise, num_chordwise, spacing_spanwise=spacing_spanwise,
+        spacing_chordwise=spacing_chordwise, LE_interp=LE_interp, TE_interp=TE_interp,
+        grid_search_density=grid_search_density, project_wireframes=not ignore_camber, plot=plot,
+    )
+    LE_points_para = projections.LE_points_para
+    TE_points_para = projections.TE_points_para
 
-    # TODO: find the physical coordinates of LE/TE endpoints from OpenVSP
-    # TODO: talk to Josh on his status of rotor meshing
-    LE_left_point = wing_geometry.evaluate(wing_comp._LE_left_point).value
-    LE_mid_point = wing_geometry.evaluate(wing_comp._LE_mid_point).value
-    LE_right_point = wing_geometry.evaluate(wing_comp._LE_right_point).value
+    if ignore_camber:
+        chord_surface = projections.evaluate_chord_surface(wing_geometry)
+        chord_surface_sym = make_mesh_symmetric(chord_surface, num_spanwise, spanwise_index=1)
+        vlm_mesh = CamberSurface(
+            nodal_coordinates=chord_surface_sym,
+        )
+        vlm_mesh._geom = wing_geometry
+        vlm_mesh._num_chord_wise = num_chordwise
+        vlm_mesh._num_spanwise = num_spanwise
+        vlm_mesh._num_chord_wise = num_chordwise
+        vlm_mesh._chordwise_spacing = spacing_chordwise
+        vlm_mesh._LE_points_para = LE_points_para
+        vlm_mesh._TE_points_para = TE_points_para
 
-    TE_left_point = wing_geometry.evaluate(wing_comp._TE_left_point).value
-    TE_mid_point = wing_geometry.evaluate(wing_comp._TE_mid_point).value
-    TE_right_point = wing_geometry.evaluate(wing_comp._TE_right_point).value
+        wing_comp._discretizations[f"{wing_comp._name}_vlm_camber_mesh"] = vlm_mesh
 
-    if spacing_spanwise == "linear":
-        num_spanwise_half = int(num_spanwise / 2)
-        LE_points_1 = np.linspace(LE_left_point, LE_mid_point, num_spanwise_half + 1)
-        LE_points_2 = np.linspace(LE_mid_point, LE_right_point, num_spanwise_half + 1)
+    else:
+        upper_surace_wireframe_para = projections.upper_wireframe_para
+        lower_surace_wireframe_para = projections.lower_wireframe_para
+
+        upper_surace_wireframe = wing_geometry.evaluate(upper_surace_wireframe_para).reshape((num_chordwise + 1, num_spanwise + 1, 3))
+        lower_surace_wireframe = wing_geometry.evaluate(lower_surace_wireframe_para).reshape((num_chordwise + 1, num_spanwise + 1, 3))
+
+        # compute the camber surface as the mean of the upper and lower wireframe
+        camber_surface_raw = (upper_surace_wireframe + lower_surace_wireframe) / 2
+
+        # Ensure that the mesh is symmetric across the xz-plane
+        camber_surface = make_mesh_symmetric(camber_surface_raw, num_spanwise, spanwise_index=1)
+    
+        vlm_mesh = CamberSurface(
+            nodal_coordinates=camber_surface,
+        )
+        vlm_mesh._geom = wing_geometry
+        vlm_mesh._lower_wireframe_para = lower_surace_wireframe_para
+        vlm_mesh._upper_wireframe_para = upper_surace_wireframe_para
+        vlm_mesh._num_chord_wise = num_chordwise
+        vlm_mesh._num_spanwise = num_spanwise
+        vlm_mesh._LE_points_para = LE_points_para
+        vlm_mesh._TE_points_para = TE_points_para
+
+    if chord_wise_points_for_airfoil is not None:
+        LE_points_csdl, TE_points_csdl = projections.evaluate_LE_TE_points(wing_geometry)
+
+        LE_points_csdl_mid_panel = (LE_points_csdl[0:-1, :] + LE_points_csdl[1:, :]) / 2
+        TE_points_csdl_mid_panel = (TE_points_csdl[0:-1, :] + TE_points_csdl[1:, :]) / 2
+
+        LE_points_csdl_mid_panel = LE_points_csdl_mid_panel.set(csdl.slice[:, 0], LE_points_csdl_mid_panel[:, 0] + 0.1)
+        TE_points_csdl_mid_panel = TE_points_csdl_mid_panel.set(csdl.slice[:, 0], TE_points_csdl_mid_panel[:, 0] - 0.1)
+
+        # re-project the LE and TE points of all stations in one call
+        LE_TE_points_re_projected = wing_geometry.evaluate(wing_geometry.project(
+            csdl.vstack((LE_points_csdl_mid_panel, TE_points_csdl_mid_panel)), grid_search_density_parameter=grid_search_density, plot=plot
+        ))
+        LE_points_re_projected = LE_TE_points_re_projected[0:num_spanwise, :]
+        TE_points_re_projected = LE_TE_points_re_projected[num_spanwise:, :]
         
-        # Check whether spanwise points should projected based on ellipse
-        if LE_interp is not None:
-            array_to_project = np.zeros((num_spanwise + 1, 3))
-            y = np.array([LE_left_point[1], LE_mid_point[1], LE_right_point[1]])
-            z = np.array([LE_left_point[2], LE_mid_point[2], LE_right_point[2]])
-            fz = interp1d(y, z, kind="linear")
+        num_chordwise = len(chord_wise_points_for_airfoil)
+        # chord_surface = csdl.linear_combination(LE_points_csdl_mid_panel, TE_points_csdl_mid_panel, num_chordwise)
+        chord_surface = csdl.linear_combination(LE_points_re_projected, TE_points_re_projected, num_chordwise)
 
-            # Set up equation for an ellipse
-            h = LE_left_point[0]
-            b = 2 * (h - LE_mid_point[0]) # Semi-minor axis
-            a = LE_right_point[1] # semi-major axis
-            
-            interp_y_1 = np.linspace(y[0], y[1], num_spanwise_half+1)
-            interp_y_2 = np.linspace(y[1], y[2], num_spanwise_half+1)
+        x_interp = csdl.Variable(shape=(num_chordwise, ), value=chord_wise_points_for_airfoil)
+        x_interp_exp = csdl.expand(x_interp, (num_chordwise, num_spanwise), action="i->ij")
+        # LE_exp_x = csdl.expand(LE_points_csdl_mid_panel[:, 0], (num_chordwise, num_spanwise), action="j->ij")
+        # TE_exp_x = csdl.expand(TE_points_csdl_mid_panel[:, 0], (num_chordwise, num_spanwise), action="j->ij")
 
-            array_to_project[0:num_spanwise_half+1, 0] = (b**2 * (1 - interp_y_1**2/a**2))**0.5 + h
-            array_to_project[0:num_spanwise_half+1, 1] = interp_y_1
-            array_to_project[0:num_spanwise_half+1, 2] = fz(interp_y_1)
+        LE_exp_x = csdl.expand(LE_points_re_projected[:, 0], (num_chordwise, num_spanwise), action="j->ij")
+        TE_exp_x = csdl.expand(TE_points_re_projected[:, 0], (num_chordwise, num_spanwise), action="j->ij")
 
-            array_to_project[num_spanwise_half:, 0] = (b**2 * (1 - interp_y_2**2/a**2))**0.5 + h
-            array_to_project[num_spanwise_half:, 1] = interp_y_2
-            array_to_project[num_spanwise_half:, 2] = fz(interp_y_2)
+        skewed_chord_surface_x = LE_exp_x + (TE_exp_x - LE_exp_x) * x_interp_exp
 
-            LE_points = array_to_project
-        else:
-            LE_points = np.vstack((LE_points_1, LE_points_2[1:, :]))
 
-        TE_points_1 = np.linspace(TE_left_point, TE_mid_point, num_spanwise_half + 1)
-        TE_points_2 = np.linspace(TE_mid_point, TE_right_point, num_spanwise_half + 1)
-        # Check whether spanwise points should projected based on ellipse
-        if TE_interp is not None:
-            array_to_project = np.zeros((num_spanwise + 1, 3))
-            y = np.array([TE_left_point[1], TE_mid_point[1], TE_right_point[1]])
-            z = np.array([TE_left_point[2], TE_mid_point[2], TE_right_point[2]])
-            fz = interp1d(y, z, kind="linear")
+        chord_surface = chord_surface.set(
+            csdl.slice[:, :, 0],
+            skewed_chord_surface_x,
+        )
 
-            # Set up equation for an ellipse
-            h = TE_left_point[0]
-            b = 2 * (h - TE_mid_point[0]) # Semi-minor axis
-            a = TE_right_point[1] # semi-major axis
+        vertical_offset_1 = csdl.expand(
+            csdl.Variable(shape=(3, ), value=np.array([0., 0., 0.25])),
+            chord_surface.shape, action='k->ijk'
+        )
 
-            interp_y_1 = np.linspace(y[0], y[1], num_spanwise_half+1)
-            interp_y_2 = np.linspace(y[1], y[2], num_spanwise_half+1)
+        airfoil_upper_para = wing_geometry.project(
+            chord_surface - vertical_offset_1, 
+            direction=np.array([0., 0., 1.]), 
+            plot=plot, 
+            grid_search_density_parameter=grid_search_density
+        )
 
-            array_to_project[0:num_spanwise_half+1, 0] = -(b**2 * (1 - interp_y_1**2/a**2))**0.5 + h
-            array_to_project[0:num_spanwise_half+1, 1] = interp_y_1
-            array_to_project[0:num_spanwise_half+1, 2] = fz(interp_y_1)
+        airfoil_lower_para = wing_geometry.project(
+            chord_surface + vertical_offset_1, 
+            direction=np.array([0., 0., -1]), 
+            plot=plot, 
+            grid_search_density_parameter=grid_search_density,
+        )
 
-            array_to_project[num_spanwise_half:, 0] = -(b**2 * (1 - interp_y_2**2/a**2))**0.5 + h
-            array_to_project[num_spanwise_half:, 1] = interp_y_2
-            array_to_project[num_spanwise_half:, 2] = fz(interp_y_2)
-            
-            TE_points = array_to_project
-        else:
-            TE_points = np.vstack((TE_points_1, TE_points_2[1:, :]))
-    
-    elif spacing_spanwise == "cosine":
-        num_spanwise_half = int(num_spanwise / 2)
-        if LE_interp is not None:
-            array_to_project = np.zeros((num_spanwise + 1, 3))
-            y = np.array([LE_left_point[1], LE_mid_point[1], LE_right_point[1]])
-            z = np.array([LE_left_point[2], LE_mid_point[2], LE_right_point[2]])
-            fz = interp1d(y, z, kind="linear")
+        vlm_mesh._airfoil_upper_para = ParametricCoordinates.from_list(airfoil_upper_para)
+        vlm_mesh._airfoil_lower_para = ParametricCoordinates.from_list(airfoil_lower_para)
+        vlm_mesh._num_airfoil_points = num_chordwise
 
-            # Set up equation for an ellipse
-            h = LE_left_point[0]
-            b = 2 * (h - LE_mid_point[0]) # Semi-minor axis
-            a = LE_right_point[1] # semi-major axis
-            
-            i_vec = np.arange(0, num_spanwise_half+1)
-            half_cos = np.linspace(0, 1, len(i_vec))**2
-            # half_cos = 1 - np.cos(i_vec * np.pi / (2 * num_spanwise_half))
+        vlm_mesh.airfoil_nodes_upper = wing_geometry.evaluate(airfoil_upper_para)
+        vlm_mesh.airfoil_nodes_lower = wing_geometry.evaluate(airfoil_lower_para)
 
-            interp_y_1 = y[0] - (y[0] - y[1]) * half_cos
-            interp_y_2 = np.flip(y[2] - (y[2] - y[1]) * half_cos)
 
-            array_to_project[0:num_spanwise_half+1, 0] = (b**2 * (1 - interp_y_1**2/a**2))**0.5 + h
-            array_to_project[0:num_spanwise_half+1, 1] = interp_y_1
-            array_to_project[0:num_spanwise_half+1, 2] = fz(interp_y_1)
 
-            array_to_project[num_spanwise_half:, 0] = (b**2 * (1 - interp_y_2**2/a**2))**0.5 + h
-            array_to_project[num_spanwise_half:, 1] = interp_y_2
-            array_to_project[num_spanwise_half:, 2] = fz(interp_y_2)
 
-            LE_points = array_to_project
-        else:
-            LE_points_1 = cosine_spacing(num_spanwise_half + 1, np.linspace(LE_mid_point, LE_left_point, num_spanwise_half + 1))
-            LE_points_2 = cosine_spacing(num_spanwise_half + 1, np.linspace(LE_mid_point, LE_right_point, num_spanwise_half + 1), flip=True)
-            LE_points = np.vstack((LE_points_1, LE_points_2[1:, :]))
 
-        if TE_interp is not None:
-            array_to_project = np.zeros((num_spanwise + 1, 3))
-            y = np.array([TE_left_point[1], TE_mid_point[1], TE_right_point[1]])
-            z = np.array([TE_left_point[2], TE_mid_point[2], TE_right_point[2]])
-            fz = interp1d(y, z, kind="linear")
+    if half_model:
+        vlm_mesh._half_model = True
+        vlm_mesh.symmetry_plane = "xz"
+        vlm_mesh.nodal_coordinates = vlm_mesh._get_half_model(vlm_mesh.nodal_coordinates)
+        # the (mid-panel) airfoil stations with y >= 0 are the second half as well
+        if chord_wise_points_for_airfoil is not None:
+            vlm_mesh.airfoil_nodes_upper = vlm_mesh._get_half_model(vlm_mesh.airfoil_nodes_upper.reshape((num_chordwise, num_spanwise, 3)))
+            vlm_mesh.airfoil_nodes_lower = vlm_mesh._get_half_model(vlm_mesh.airfoil_nodes_lower.reshape((num_chordwise, num_spanwise, 3)))
 
-            # Set up equation for an ellipse
-            h = TE_left_point[0]
-            b = 2 * (h - TE_mid_point[0]) # Semi-minor axis
-            a = TE_right_point[1] # semi-major axis
-            
-            i_vec = np.arange(0, num_spanwise_half+1)
-            half_cos = np.linspace(0, 1, len(i_vec))**2
-            # half_cos = 1 - np.cos(i_vec * np.pi / (2 * num_spanwise_half))
+    wing_comp._discretizations[f"{wing_comp._name}_vlm_camber_mesh"] = vlm_mesh
 
-            interp_y_1 = y[0] - (y[0] - y[1]) * half_cos
-            interp_y_2 = np.flip(y[2] - (y[2] - y[1]) * half_cos)
+    return vlm_mesh
 
-            array_to_project[0:num_spanwise_half+1, 0] = -(b**2 * (1 - interp_y_1**2/a**2))**0.5 + h
-            array_to_project[0:num_spanwise_half+1, 1] = interp_y_1
-            array_to_project[0:num_spanwise_half+1, 2] = fz(interp_y_1)
+def make_vlm_surface_family(
+    wing_comp,
+    resolutions: list,
+    spacing_spanwise: str = 'linear',
+    spacing_chordwise: str = 'linear',
+    ignore_camber: bool = False, 
+    plot: bool = False,
+    grid_search_density: int = 10,
+    LE_interp : Union[str, None] = None,
+    TE_interp : Union[str, None] = None,
+    half_model: bool = False,
+) -> dict:
+    """Make a family of nested-resolution VLM camber surfaces (e.g., for 
+    convergence studies) from one projection at the finest resolution.
 
-            array_to_project[num_spanwise_half:, 0] = -(b**2 * (1 - interp_y_2**2/a**2))**0.5 + h
-            array_to_project[num_spanwise_half:, 1] = interp_y_2
-            array_to_project[num_spanwise_half:, 2] = fz(interp_y_2)
+    The coarser meshes are derived by sub-sampling the parametric coordinates
+    of the finest one, so the additional levels only cost evaluations.
 
-            TE_points = array_to_project
+    Parameters
+    ----------
+    wing_comp : Wing
+        instance of a 'Wing' component
 
-        else:
-            TE_points_1 = cosine_spacing(num_spanwise_half + 1, np.linspace(TE_mid_point, TE_left_point, num_spanwise_half + 1))
-            TE_points_2 = cosine_spacing(num_spanwise_half + 1, np.linspace(TE_mid_point, TE_right_point, num_spanwise_half + 1), flip=True)
-            TE_points = np.vstack((TE_points_1, TE_points_2[1:, :]))
+    resolutions : list
+        list of (num_spanwise, num_chordwise) tuples; all resolutions must 
+        divide the finest one, e.g., [(8, 2), (16, 4), (32, 8)]
+
+    See 'make_vlm_surface' for the remaining parameters.
+
+    Returns
+    -------
+    dict
+        maps each (num_spanwise, num_chordwise) tuple to its CamberSurface
+    """
+    csdl.check_parameter(resolutions, "resolutions", types=list)
+    if len(resolutions) == 0:
+        raise ValueError("Need at least one resolution")
     
-    else:
-        raise NotImplementedError
+    resolutions = [(int(num_spanwise), int(num_chordwise)) for num_spanwise, num_chordwise in resolutions]
+    fine_num_spanwise = max(resolution[0] for resolution in resolutions)
+    fine_num_chordwise = max(resolution[1] for resolution in resolutions)
+
+    fine_projections = get_sectional_projections(
+        wing_comp, fine_num_spanwise, fine_num_chordwise, spacing_spanwise=spacing_spanwise,
+        spacing_chordwise=spacing_chordwise, LE_interp=LE_interp, TE_interp=TE_interp,
+        grid_search_density=grid_search_density, project_wireframes=not ignore_camber, plot=plot,
+    )
+
+    # Register the sub-sampled projections such that 'make_vlm_surface' re-uses them
+    cache = wing_comp._sectional_projections
+    for num_spanwise, num_chordwise in resolutions:
+        spanwise_key, key = _sectional_projection_keys(
+            num_spanwise, num_chordwise, spacing_spanwise, spacing_chordwise, 
+            LE_interp, TE_interp, grid_search_density,
+        )
+        if key not in cache or (not ignore_camber and cache[key].upper_wireframe_para is None):
+            cache[key] = fine_projections.subsample(num_spanwise, num_chordwise)
+        if spanwise_key not in cache:
+            cache[spanwise_key] = (cache[key].LE_points_para, cache[key].TE_points_para)
+
+    vlm_meshes = {}
+    for num_spanwise, num_chordwise in resolutions:
+        vlm_mesh = make_vlm_surface(
+            wing_comp, num_spanwise, num_chordwise, spacing_spanwise=spacing_spanwise,
+            spacing_chordwise=spacing_chordwise, ignore_camber=ignore_camber, plot=plot,
+            grid_search_density=grid_search_density, LE_interp=LE_interp, TE_interp=TE_interp, half_model=half_model,
+        )
+        wing_comp._discretizations[f"{wing_comp._name}_vlm_camber_mesh_{num_spanwise}x{num_chordwise}"] = vlm_mesh
+        vlm_meshes[(num_spanwise, num_chordwise)] = vlm_mesh
+
+    # The default discretization is the finest mesh
+    wing_comp._discretizations[f"{wing_comp._name}_vlm_camber_mesh"] = vlm_meshes[max(vlm_meshes, key=lambda resolution: resolution[0] * resolution[1])]
+
+    return vlm_meshes
+
+@dataclass
+class PanelDiscretization(Discretization):
+    nodal_coordinates:csdl.Variable=None
+    
+class PanelMesh(SolverMesh):
+    def __init__(self):
+        self.discretizations = DiscretizationsDict()
 
-    LE_points_para = wing_geometry.project(LE_points, plot=plot)
-    TE_points_para = wing_geometry.project(TE_points, plot=plot)
+def make_wing_panel_mesh(
+    wing_comp,
+    num_spanwise: int,
+    num_chordwise: int, 
+    spacing_spanwise: str = 'linear',
+    spacing_chordwise: str = 'linear',
+    chord_wise_points_for_airfoil = None,
+    ignore_camber: bool = False, 
+    plot: bool = False,
+    grid_search_density: int = 10,
+    LE_interp : Union[str, None] = None,
+    TE_interp : Union[str, None] = None,
+) -> PanelMesh:
+    """Make a panel mesh for wing-like components. This method is NOT 
+    intended for vertically oriented lifting surfaces like a vertical tail.
 
-    LE_points_csdl = wing_geometry.evaluate(LE_points_para)
-    TE_points_csdl = wing_geometry.evaluate(TE_points_para)
+    Parameters
+    ----------
+    wing_comp : Wing
+        instance of a 'Wing' component
     
-    y_mean_spanwise = (LE_points_csdl[:, 1] + TE_points_csdl[:, 1])/ 2 
-    LE_points_csdl = LE_points_csdl.set(csdl.slice[:, 1], y_mean_spanwise)
-    TE_points_csdl = TE_points_csdl.set(csdl.slice[:, 1], y_mean_spanwise)
-
+    num_spanwise : int
+        number of span-wise panels (note that if odd, 
+        central panel will be larger)
     
-
-    if spacing_chordwise == "linear":
-        chord_surface = csdl.linear_combination(LE_points_csdl, TE_points_csdl, num_chordwise+1).reshape((num_chordwise+1, num_spanwise+1, 3))
+    num_chordwise : int
+        number of chord-wise panels
     
-    elif spacing_chordwise == "cosine":
-        # chord_surface = csdl.linear_combination(TE_points_csdl, LE_points_csdl, num_chordwise+1).reshape((-1, 3))
-        chord_surface = cosine_spacing(
-            num_spanwise, 
-            None,
-            csdl.linear_combination(LE_points_csdl, TE_points_csdl, num_chordwise+1),
-            num_chordwise
-        )
+    spacing_spanwise : str, optional
+        spacing of the span-wise panels (linear or cosine 
+        currently supported), by default 'linear'
+    
+    spacing_chordwise : str, optional
+        spacing of the chord-wise panels (linear or cosine 
+        currently supported), by default 'linear'
+    
+    plot : bool, optional
+        plot the projections, by default False
+    
+    grid_search_density : int, optional
+        parameter to refine the quality of projections (note that the higher this parameter 
+        the longer the projections will take; for finer meshes, especially with cosine 
+        spacing, a value of 40-50 is recommended), by default 10
 
-    chord_surface = chord_surface.reshape((num_chordwise+1, num_spanwise+1, 3))
+    Returns
+    -------
+    wing_panel_mesh: csdl.VariableGroup
+        data class storing the mesh coordinates and mesh velocities (latter will be set later)
 
-    vertical_offset_1 = csdl.expand(
-        csdl.Variable(shape=(3, ), value=np.array([0., 0., 0.25])),
-        chord_surface.shape, action='k->ijk'
-    )
+    """
+    from CADDEE_alpha.core.aircraft.components.wing import Wing
+    csdl.check_parameter(wing_comp, "wing_comp", types=Wing)
+    csdl.check_parameter(num_spanwise, "num_spanwise", types=int)
+    csdl.check_parameter(num_chordwise, "num_chordwise", types=int)
+    csdl.check_parameter(spacing_spanwise, "spacing_spanwise", values=("linear", "cosine"))
+    csdl.check_parameter(spacing_chordwise, "spacing_chordwise", values=("linear", "cosine"))
+    csdl.check_parameter(plot, "plot", types=bool)
+    csdl.check_parameter(grid_search_density, "grid_search_density", types=int)
+    csdl.check_parameter(ignore_camber, "ignore_camber", types=bool)
+    csdl.check_parameter(LE_interp, "LE_interp", values=("ellipse", None))
+    csdl.check_parameter(TE_interp, "TE_interp", values=("ellipse", None))
 
-    upper_surace_wireframe_para = wing_geometry.project(
-        chord_surface - vertical_offset_1, 
-        direction=np.array([0., 0., 1.]), 
-        plot=plot, 
-        grid_search_density_parameter=grid_search_density
-    )
+    if wing_comp.geometry is None:
+        raise Exception("Cannot generate mesh for component with geoemetry=None")
+
+    if num_spanwise % 2 != 0:
+        raise Exception("Number of spanwise panels must be even.")
 
-    lower_surace_wireframe_para = wing_geometry.project(
-        chord_surface + vertical_offset_1, 
-        direction=np.array([0., 0., -1]), 
-        plot=plot, 
-        grid_search_density_parameter=grid_search_density,
+    wing_geometry: FunctionSet = wing_comp.geometry
+    projections = get_sectional_projections(
+        wing_comp, num_spanwise, num_chordwise, spacing_spanwise=spacing_spanwise,
+        spacing_chordwise=spacing_chordwise, LE_interp=LE_interp, TE_interp=TE_interp,
+        grid_search_density=grid_search_density, project_wireframes=True, plot=plot,
     )
+    upper_surace_wireframe_para = projections.upper_wireframe_para
+    lower_surace_wireframe_para = projections.lower_wireframe_para
 
     # for rotor blades, change direction to [1.,0.,0.]
     upper_surace_wireframe = wing_geometry.evaluate(upper_surace_wireframe_para).reshape((num_chordwise + 1, num_spanwise + 1, 3))
@@ -1020,6 +1174,46 @@ def make_wing_panel_mesh(
 
     return wing_panel_mesh
 
+def _evaluate_parametric_grids(geometry, parametric_grids:dict):
+    """Evaluate parametric grids on several surfaces of a geometry with one 
+    evaluation.
+
+    Parameters
+    ----------
+    geometry : FunctionSet
+        geometry containing the surfaces
+    
+    parametric_grids : dict
+        maps surface (function) indices to parametric grids of shape (..., 2)
+
+    Returns
+    -------
+    tuple
+        the stacked points (num_points, 3) and a dictionary mapping each 
+        surface index to an index array (of the shape of the grid) into the stacked points
+    """
+    surface_indices = []
+    uv = []
+    index_grids = {}
+    start = 0
+    for surface_index, parametric_grid in parametric_grids.items():
+        grid_shape = parametric_grid.shape[:-1]
+        num_points = int(np.prod(grid_shape))
+        surface_indices.append(np.full((num_points, ), surface_index))
+        uv.append(parametric_grid.reshape((-1, 2)))
+        index_grids[surface_index] = np.arange(start, start + num_points).reshape(grid_shape)
+        start += num_points
+
+    parametric_coordinates = ParametricCoordinates(np.concatenate(surface_indices), np.vstack(uv))
+    points = geometry.evaluate(parametric_coordinates).reshape((-1, 3))
+
+    return points, index_grids
+
+def _gather_grid(points:csdl.Variable, index_pattern:np.ndarray) -> csdl.Variable:
+    """Assemble a grid of shape index_pattern.shape + (3, ) from the stacked 
+    points (num_points, 3) with a single gather."""
+    return points[index_pattern.flatten().tolist()].reshape(index_pattern.shape + (3, ))
+
 def make_nacelle_panel_mesh(
     nacelle_geometry,
     body_id: list,
@@ -1031,14 +1225,15 @@ def make_nacelle_panel_mesh(
 ) -> PanelMesh:
     
     surfaces = nacelle_geometry.functions
-    nacelle_meshes_raw = []
-    i = 0
+    surface_keys = list(surfaces.keys())
 
-    for surface in surfaces.values():
-        i += 1
+    # Build the parametric grids of the body and tip surfaces (1-based ids)
+    parametric_grids = {}
+    for i in list(body_id) + list(tip_id):
+        surface = surfaces[surface_keys[i-1]]
         if i in tip_id:
             parametric_mesh_i = surface.space.generate_parametric_grid(grid_resolution=(grid_nl_tip,grid_nr))
-            nacelle_mesh_i = surface.evaluate(parametric_mesh_i, plot=plot).reshape((grid_nl_tip,grid_nr,3))
+            parametric_mesh_i = parametric_mesh_i.reshape((grid_nl_tip,grid_nr,2))
         else:
             parametric_mesh_i = surface.space.generate_parametric_grid(grid_resolution=(grid_nl_body,grid_nr))
             parametric_mesh_i = parametric_mesh_i.reshape((grid_nl_body,grid_nr,2))
@@ -1050,55 +1245,35 @@ def make_nacelle_panel_mesh(
             else:
                 parametric_mesh_i[-1,:,0] = np.linspace(parametric_mesh_i[-1,0,0], parametric_mesh_i[-2,0,0], grid_nr)
                 parametric_mesh_i[-1,:,1] = np.ones(grid_nr)
+        
+        parametric_grids[surface_keys[i-1]] = parametric_mesh_i
 
-            nacelle_mesh_i = surface.evaluate(parametric_mesh_i, plot=plot).reshape((grid_nl_body,grid_nr,3))
-
-        if plot:
-            nacelle_geometry.plot_meshes(nacelle_mesh_i)
-        nacelle_meshes_raw.append(nacelle_mesh_i)
+    points, index_grids = _evaluate_parametric_grids(nacelle_geometry, parametric_grids)
     
-    
-    body_mesh_1 = nacelle_meshes_raw[body_id[0]-1] # lower left
-    body_mesh_2 = nacelle_meshes_raw[body_id[1]-1] # lower right
-    body_mesh_3 = nacelle_meshes_raw[body_id[2]-1] # upper left
-    body_mesh_4 = nacelle_meshes_raw[body_id[3]-1] # upper right
-    tip_mesh_1 = nacelle_meshes_raw[tip_id[0]-1]
-    tip_mesh_2 = nacelle_meshes_raw[tip_id[1]-1]
-    tip_mesh_3 = nacelle_meshes_raw[tip_id[2]-1]
-    tip_mesh_4 = nacelle_meshes_raw[tip_id[3]-1]
-
-    upper_body_mesh = csdl.Variable(shape=(grid_nl_body, 2 * grid_nr - 1, 3), value=0.)
-    upper_body_mesh = upper_body_mesh.set(csdl.slice[:,:grid_nr,:], value=body_mesh_3[:,:,:][:,::-1,:])
-    upper_body_mesh = upper_body_mesh.set(csdl.slice[:,grid_nr:,:], value=body_mesh_4[:,:-1,:][:,::-1,:])
-
-    upper_tip_mesh = csdl.Variable(shape=(grid_nl_tip, 2 * grid_nr - 1, 3), value=0.)
-    upper_tip_mesh = upper_tip_mesh.set(csdl.slice[:,:grid_nr,:], value=tip_mesh_3[:,:,:][:,::-1,:])
-    upper_tip_mesh = upper_tip_mesh.set(csdl.slice[:,grid_nr:,:], value=tip_mesh_4[:,:-1,:][:,::-1,:])
-
-    upper_surface_mesh = csdl.Variable(shape=(grid_nl_tip + grid_nl_body - 1, 2 * grid_nr - 1, 3), value=0.)
-    upper_surface_mesh = upper_surface_mesh.set(csdl.slice[:(grid_nl_body-1),:,:], value=upper_body_mesh[::-1,:,:][:-1,:,:])
-    upper_surface_mesh = upper_surface_mesh.set(csdl.slice[(grid_nl_body-1):,:,:], value=upper_tip_mesh[::-1,:,:])
-    
-    lower_body_mesh = csdl.Variable(shape=(grid_nl_body, 2 * grid_nr - 1, 3), value=0.)
-    lower_body_mesh = lower_body_mesh.set(csdl.slice[:,:grid_nr,:], value=body_mesh_1[:,:,:][:,::-1,:])
-    lower_body_mesh = lower_body_mesh.set(csdl.slice[:,grid_nr:,:], value=body_mesh_2[:,:-1,:][:,::-1,:])
-
-    lower_tip_mesh = csdl.Variable(shape=(grid_nl_tip, 2 * grid_nr - 1, 3), value=0.)
-    lower_tip_mesh = lower_tip_mesh.set(csdl.slice[:,:grid_nr,:], value=tip_mesh_1[:,:,:][:,::-1,:])
-    lower_tip_mesh = lower_tip_mesh.set(csdl.slice[:,grid_nr:,:], value=tip_mesh_2[:,:-1,:][:,::-1,:])
-
-
-    lower_surface_mesh = csdl.Variable(shape=(grid_nl_tip + grid_nl_body - 1, 2 * grid_nr - 1, 3), value=0.)
-    lower_surface_mesh = lower_surface_mesh.set(csdl.slice[:grid_nl_tip,:,:], value=lower_tip_mesh)
-    lower_surface_mesh = lower_surface_mesh.set(csdl.slice[grid_nl_tip:,:,:], value=lower_body_mesh[1:,:,:])
-
-    nacelle_mesh = csdl.Variable(shape=(2*(grid_nl_body+grid_nl_tip)-3, 2 * grid_nr - 1, 3), value=0.)
-    nacelle_mesh = nacelle_mesh.set(csdl.slice[:grid_nl_tip + grid_nl_body - 2,:,:], value=upper_surface_mesh[:-1,:,:])
-    nacelle_mesh = nacelle_mesh.set(csdl.slice[grid_nl_tip + grid_nl_body - 2:,:,:], value=lower_surface_mesh[:,::-1,:])
+    # Build the index pattern of the nacelle mesh in numpy
+    body_mesh_1 = index_grids[surface_keys[body_id[0]-1]] # lower left
+    body_mesh_2 = index_grids[surface_keys[body_id[1]-1]] # lower right
+    body_mesh_3 = index_grids[surface_keys[body_id[2]-1]] # upper left
+    body_mesh_4 = index_grids[surface_keys[body_id[3]-1]] # upper right
+    tip_mesh_1 = index_grids[surface_keys[tip_id[0]-1]]
+    tip_mesh_2 = index_grids[surface_keys[tip_id[1]-1]]
+    tip_mesh_3 = index_grids[surface_keys[tip_id[2]-1]]
+    tip_mesh_4 = index_grids[surface_keys[tip_id[3]-1]]
+
+    upper_body_mesh = np.concatenate((body_mesh_3[:,::-1], body_mesh_4[:,:-1][:,::-1]), axis=1)
+    upper_tip_mesh = np.concatenate((tip_mesh_3[:,::-1], tip_mesh_4[:,:-1][:,::-1]), axis=1)
+    upper_surface_mesh = np.concatenate((upper_body_mesh[::-1,:][:-1,:], upper_tip_mesh[::-1,:]), axis=0)
+
+    lower_body_mesh = np.concatenate((body_mesh_1[:,::-1], body_mesh_2[:,:-1][:,::-1]), axis=1)
+    lower_tip_mesh = np.concatenate((tip_mesh_1[:,::-1], tip_mesh_2[:,:-1][:,::-1]), axis=1)
+    lower_surface_mesh = np.concatenate((lower_tip_mesh, lower_body_mesh[1:,:]), axis=0)
+
+    nacelle_mesh_pattern = np.concatenate((upper_surface_mesh[:-1,:], lower_surface_mesh[:,::-1]), axis=0)
+    nacelle_mesh = _gather_grid(points, nacelle_mesh_pattern)
 
     if plot:
-        nacelle_geometry.plot_meshes(upper_surface_mesh)
-        nacelle_geometry.plot_meshes(lower_surface_mesh)
+        nacelle_geometry.plot_meshes(_gather_grid(points, upper_surface_mesh))
+        nacelle_geometry.plot_meshes(_gather_grid(points, lower_surface_mesh))
         nacelle_geometry.plot_meshes(nacelle_mesh)
         print("First row of nodes on the nacelle:", nacelle_mesh.value[0,:,:])
         print("Last row of nodes on the nacelle:", nacelle_mesh.value[-1,:,:])
@@ -1119,19 +1294,18 @@ def make_rotor_panel_mesh(
     
     surfaces = rotor_geometry.functions
 
-    lower_surface = surfaces[blade_keys[0]]
-    upper_surface = surfaces[blade_keys[1]]
-    lower_parametric_mesh = lower_surface.space.generate_parametric_grid(grid_resolution=(grid_nl, grid_nr))
-    lower_blade_mesh = lower_surface.evaluate(lower_parametric_mesh, plot=plot).reshape((grid_nl, grid_nr, 3))
-    upper_parametric_mesh = upper_surface.space.generate_parametric_grid(grid_resolution=(grid_nl, grid_nr))
-    upper_blade_mesh = upper_surface.evaluate(upper_parametric_mesh, plot=plot).reshape((grid_nl, grid_nr,3))
+    lower_key = blade_keys[0]
+    upper_key = blade_keys[1]
+    parametric_grids = {
+        key : surfaces[key].space.generate_parametric_grid(grid_resolution=(grid_nl, grid_nr)).reshape((grid_nl, grid_nr, 2))
+        for key in (lower_key, upper_key)
+    }
+    points, index_grids = _evaluate_parametric_grids(rotor_geometry, parametric_grids)
 
-    upper_blade_mesh = csdl.einsum(upper_blade_mesh, action='ijk->jik')
-    lower_blade_mesh = csdl.einsum(lower_blade_mesh, action='ijk->jik')
-
-    blade_mesh = csdl.Variable(shape=(2 * grid_nr - 1, grid_nl, 3), value=0.)
-    blade_mesh = blade_mesh.set(csdl.slice[:grid_nr,:,:], value=lower_blade_mesh[::-1,:,:][:,:,:])
-    blade_mesh = blade_mesh.set(csdl.slice[grid_nr:,:,:], value=upper_blade_mesh[::-1,:,:][1:,:,:])
+    lower_blade_mesh = index_grids[lower_key].T
+    upper_blade_mesh = index_grids[upper_key].T
+    blade_mesh_pattern = np.concatenate((lower_blade_mesh[::-1,:], upper_blade_mesh[::-1,:][1:,:]), axis=0)
+    blade_mesh = _gather_grid(points, blade_mesh_pattern)
 
     if plot:
         rotor_geometry.plot_meshes(blade_mesh)
@@ -1323,37 +1497,99 @@ def make_blade_panel_mesh(
     return blade_panel_mesh
 
 
+def _rotation_matrix(axis:np.ndarray, angle:float) -> np.ndarray:
+    """Rotation matrix about a (unit) axis (Rodrigues' formula)."""
+    axis = np.asarray(axis, dtype=float).flatten()
+    axis = axis / np.linalg.norm(axis)
+    K = np.array([
+        [0., -axis[2], axis[1]],
+        [axis[2], 0., -axis[0]],
+        [-axis[1], axis[0], 0.],
+    ])
+    return np.eye(3) + np.sin(angle) * K + (1 - np.cos(angle)) * K @ K
+
 def make_rotor_panel_mesh_grid(
     rotor_geometry,
     blade_keys: list,
     grid_nr: int,
     grid_nl: int, 
     plot: bool = False,
+    rotated_copies: bool = False,
+    rotation_axis_origin: Union[np.ndarray, None] = None,
+    rotation_axis_vector: Union[np.ndarray, None] = None,
 ) -> PanelMesh:
-    
-    surfaces = rotor_geometry.functions
+    """Make a panel mesh of all blades of a rotor, with the blades 
+    stacked along the second (chord-wise) dimension.
 
-    num_blades = int(len(surfaces.keys())/2)
+    Parameters
+    ----------
+    rotor_geometry : FunctionSet
+        geometry of the rotor (two surfaces per blade)
 
-    blade_meshes = csdl.Variable(shape=(grid_nl, num_blades*(2*grid_nr-1), 3), 
-                                      value=0.)
+    blade_keys : list
+        surface indices of the blades ordered as [lower_1, upper_1, lower_2, ...]
 
-    for i in range(num_blades):
-        lower_surface_i = surfaces[blade_keys[2*i]]
-        upper_surface_i = surfaces[blade_keys[2*i+1]]
-        lower_parametric_mesh_i = lower_surface_i.space.generate_parametric_grid(grid_resolution=(grid_nl,grid_nr))
-        lower_blade_mesh_i = lower_surface_i.evaluate(lower_parametric_mesh_i, plot=plot).reshape((grid_nl,grid_nr,3))
-        upper_parametric_mesh_i = upper_surface_i.space.generate_parametric_grid(grid_resolution=(grid_nl,grid_nr))
-        upper_blade_mesh_i = upper_surface_i.evaluate(upper_parametric_mesh_i, plot=plot).reshape((grid_nl,grid_nr,3))
-        
-        blade_mesh_i = csdl.Variable(shape=(grid_nl, 2 * grid_nr - 1, 3), value=0.)
-        blade_mesh_i = blade_mesh_i.set(csdl.slice[:,:grid_nr,:], value=lower_blade_mesh_i[:,:,:][:,::-1,:])
-        blade_mesh_i = blade_mesh_i.set(csdl.slice[:,grid_nr:,:], value=upper_blade_mesh_i[:,:-1,:][:,::-1,:])
+    grid_nr : int
+        number of chord-wise nodes per surface
+
+    grid_nl : int
+        number of span-wise nodes
+
+    plot : bool, optional
+        plot the blade meshes, by default False
+
+    rotated_copies : bool, optional
+        only mesh the first blade and generate the other blades as one 
+        batch of rotated copies (equally spaced about the rotation axis), 
+        by default False
+
+    rotation_axis_origin : np.ndarray, optional
+        origin of the rotation axis (required if 'rotated_copies' is True)
+
+    rotation_axis_vector : np.ndarray, optional
+        direction of the rotation axis (required if 'rotated_copies' is True)
+    """
+    surfaces = rotor_geometry.functions
+
+    num_blades = int(len(surfaces.keys())/2)
+    num_nodes_per_blade = 2 * grid_nr - 1
 
-        if plot:
-            rotor_geometry.plot_meshes(blade_mesh_i)
+    if rotated_copies:
+        if rotation_axis_origin is None or rotation_axis_vector is None:
+            raise ValueError("'rotation_axis_origin' and 'rotation_axis_vector' must be provided if 'rotated_copies' is True")
+        meshed_blades = 1
+    else:
+        meshed_blades = num_blades
+
+    parametric_grids = {}
+    for i in range(meshed_blades):
+        for key in (blade_keys[2*i], blade_keys[2*i+1]):
+            parametric_grids[key] = surfaces[key].space.generate_parametric_grid(grid_resolution=(grid_nl,grid_nr)).reshape((grid_nl,grid_nr,2))
+    points, index_grids = _evaluate_parametric_grids(rotor_geometry, parametric_grids)
+
+    blade_patterns = []
+    for i in range(meshed_blades):
+        lower_blade_mesh_i = index_grids[blade_keys[2*i]]
+        upper_blade_mesh_i = index_grids[blade_keys[2*i+1]]
+        blade_patterns.append(np.concatenate((lower_blade_mesh_i[:,::-1], upper_blade_mesh_i[:,:-1][:,::-1]), axis=1))
+    
+    blade_meshes = _gather_grid(points, np.concatenate(blade_patterns, axis=1))
+
+    if rotated_copies:
+        # Rotate the first blade about the rotation axis by 2*pi*i/num_blades (p_i = R_i (p - o) + o)
+        origin = np.asarray(rotation_axis_origin, dtype=float).reshape((1, 3))
+        rotation_matrices_T = np.hstack([
+            _rotation_matrix(rotation_axis_vector, 2 * np.pi * i / num_blades).T for i in range(num_blades)
+        ])
+        num_points = grid_nl * num_nodes_per_blade
+        centered_blade = blade_meshes.reshape((num_points, 3)) - np.tile(origin, (num_points, 1))
+        rotated_blades = csdl.matmat(centered_blade, rotation_matrices_T) + np.tile(origin, (num_points, num_blades))
+        rotated_blades = rotated_blades.reshape((grid_nl, num_nodes_per_blade, num_blades, 3))
+        blade_meshes = csdl.einsum(rotated_blades, action='ijkl->ikjl').reshape((grid_nl, num_blades * num_nodes_per_blade, 3))
 
-        blade_meshes = blade_meshes.set(csdl.slice[:,i*(2*grid_nr-1):(i+1)*(2*grid_nr-1),:], value=blade_mesh_i)
+    if plot:
+        for i in range(num_blades):
+            rotor_geometry.plot_meshes(blade_meshes[:,i*num_nodes_per_blade:(i+1)*num_nodes_per_blade,:])
 
     blade_panel_mesh = PanelDiscretization(
         nodal_coordinates=blade_meshes,
@@ -1391,26 +1627,71 @@ class OneDBoxBeam(Discretization):
     _rear_grid_parametric = None
     _half_wing = False
 
+    _geometry_points_parametric = None
+    _geometry_point_slices = None
+    _thickness_points_parametric = None
+    _thickness_point_slices = None
+    _group_points_parametric = None
+
+    def _get_geometry_points_parametric(self) -> ParametricCoordinates:
+        """Return the stacked parametric coordinates of all points evaluated 
+        on the geometry during an update (cached after the first call)."""
+        if self._geometry_points_parametric is None:
+            point_sets = {
+                "LE" : self._LE_points_parametric,
+                "TE" : self._TE_points_parametric,
+                "top" : self._node_top_parametric,
+                "bottom" : self._node_bottom_parametric,
+            }
+            if self._spar_geom is not None:
+                point_sets["fore"] = self._fore_points_parametric
+                point_sets["aft"] = self._aft_points_parametric
+            
+            self._geometry_points_parametric, self._geometry_point_slices = _stack_parametric_coordinates(point_sets)
+        
+        return self._geometry_points_parametric
+
+    def _get_thickness_points_parametric(self) -> ParametricCoordinates:
+        """Return the stacked parametric coordinates of all points at which 
+        the thickness is evaluated during an update (cached after the first call)."""
+        if self._thickness_points_parametric is None:
+            point_sets = {
+                "top" : self._top_grid_parametric,
+                "bottom" : self._bottom_grid_parametric,
+            }
+            if self._front_grid_parametric is not None:
+                point_sets["front"] = self._front_grid_parametric
+                point_sets["rear"] = self._rear_grid_parametric
+            
+            self._thickness_points_parametric, self._thickness_point_slices = _stack_parametric_coordinates(point_sets)
+        
+        return self._thickness_points_parametric
 
     def _update(self):
-        LE_points_csdl = self._geom.evaluate(self._LE_points_parametric).reshape((self.num_beam_nodes, 3))
-        TE_points_csdl = self._geom.evaluate(self._TE_points_parametric).reshape((self.num_beam_nodes, 3))
+        update_box_beams([self])
+
+    def _set_from_stacked_evaluations(self, geometry_points:csdl.Variable, thicknesses:csdl.Variable):
+        """Update the beam from the stacked geometry and thickness evaluations."""
+        num_elements = self.num_beam_nodes - 1
+        point_slices = self._geometry_point_slices
+        thickness_slices = self._thickness_point_slices
 
         if self._spar_geom is not None:
-            beam_width_nodal = (self._geom.evaluate(self._fore_points_parametric)[:,0] 
-                                - self._geom.evaluate(self._aft_points_parametric)[:,0])
+            beam_width_nodal = (geometry_points[point_slices["fore"]][:, 0] 
+                                - geometry_points[point_slices["aft"]][:, 0])
         else:
+            LE_points_csdl = geometry_points[point_slices["LE"]]
+            TE_points_csdl = geometry_points[point_slices["TE"]]
             beam_width_raw = csdl.norm((LE_points_csdl - TE_points_csdl) * self._norm_beam_width, axes=(1, ))
             if self._half_wing:
                 beam_width_nodal = beam_width_raw
             else:
                 beam_width_nodal = make_mesh_symmetric(beam_width_raw, self.num_beam_nodes, spanwise_index=None)
         
-        
         self.beam_width = (beam_width_nodal[0:-1] + beam_width_nodal[1:]) / 2
 
-        node_top = self._geom.evaluate(self._node_top_parametric).reshape((self.num_beam_nodes, 3))
-        node_bottom = self._geom.evaluate(self._node_bottom_parametric).reshape((self.num_beam_nodes, 3))
+        node_top = geometry_points[point_slices["top"]]
+        node_bottom = geometry_points[point_slices["bottom"]]
 
         if self._half_wing:
             self.nodal_coordinates = (node_top + node_bottom) / 2
@@ -1425,16 +1706,98 @@ class OneDBoxBeam(Discretization):
         
         self.beam_height = (beam_height_nodal[0:-1] + beam_height_nodal[1:]) / 2
 
-        top_thickness_grid = self._material_properties.evaluate_thickness(self._top_grid_parametric)
-        bottom_thickness_grid = self._material_properties.evaluate_thickness(self._bottom_grid_parametric)
-        self.top_skin_thickness = csdl.average(top_thickness_grid.reshape((self.num_beam_nodes-1, -1)), axes=(1,))
-        self.bottom_skin_thickness = csdl.average(bottom_thickness_grid.reshape((self.num_beam_nodes-1, -1)), axes=(1,))
+        self.top_skin_thickness = csdl.average(thicknesses[thickness_slices["top"]].reshape((num_elements, -1)), axes=(1,))
+        self.bottom_skin_thickness = csdl.average(thicknesses[thickness_slices["bottom"]].reshape((num_elements, -1)), axes=(1,))
+
+        if "front" in thickness_slices:
+            front_thickness = csdl.average(thicknesses[thickness_slices["front"]].reshape((num_elements, -1)), axes=(1,))
+            rear_thickness = csdl.average(thicknesses[thickness_slices["rear"]].reshape((num_elements, -1)), axes=(1,))
+            self.shear_web_thickness = (front_thickness + rear_thickness) / 2
+
+
+def _stack_parametric_coordinates(point_sets:dict):
+    """Concatenate named sets of parametric coordinates and return the 
+    stacked coordinates together with the slice of each set."""
+    point_sets = {name : ParametricCoordinates.from_list(points) for name, points in point_sets.items()}
+    slices = {}
+    start = 0
+    for name, points in point_sets.items():
+        slices[name] = slice(start, start + len(points))
+        start += len(points)
+    
+    return ParametricCoordinates.concatenate(list(point_sets.values())), slices
+
+
+def _group_by_identity(beams:list, attribute:str) -> list:
+    """Group beams (or other discretizations) that share the same object (e.g., geometry) for the given attribute."""
+    groups = {}
+    for beam in beams:
+        obj = getattr(beam, attribute)
+        groups.setdefault(id(obj), (obj, []))[1].append(beam)
+    return list(groups.values())
+
 
-        front_thickness_grid = self._material_properties.evaluate_thickness(self._front_grid_parametric)
-        rear_thickness_grid = self._material_properties.evaluate_thickness(self._rear_grid_parametric)
-        front_thickness = csdl.average(front_thickness_grid.reshape((self.num_beam_nodes-1, -1)), axes=(1,))
-        rear_thickness = csdl.average(rear_thickness_grid.reshape((self.num_beam_nodes-1, -1)), axes=(1,))
-        self.shear_web_thickness = (front_thickness + rear_thickness) / 2
+def _get_group_points_parametric(group:list, points_type:str) -> ParametricCoordinates:
+    """Return the (cached) concatenated geometry or thickness points of a group of beams.
+
+    Single beams use their own stacked points. For several beams, the 
+    concatenation is cached on the first beam of the group together with 
+    the beams themselves (such that their ids cannot be reused), so later 
+    updates re-use the same instance (including its surface grouping).
+    """
+    get_points = {
+        "geometry" : lambda beam: beam._get_geometry_points_parametric(),
+        "thickness" : lambda beam: beam._get_thickness_points_parametric(),
+    }[points_type]
+    if len(group) == 1:
+        return get_points(group[0])
+
+    first_beam = group[0]
+    if first_beam._group_points_parametric is None:
+        first_beam._group_points_parametric = {}
+    key = (points_type, ) + tuple(id(beam) for beam in group)
+    if key not in first_beam._group_points_parametric:
+        first_beam._group_points_parametric[key] = (
+            tuple(group), ParametricCoordinates.concatenate([get_points(beam) for beam in group])
+        )
+    
+    return first_beam._group_points_parametric[key][1]
+
+
+def update_box_beams(beams:list[OneDBoxBeam]):
+    """Update several 1D box beams (e.g., wing, tail, boom) in one batched call.
+
+    The points of all beams sharing the same geometry are evaluated with a 
+    single geometry evaluation and the thicknesses of all beams sharing the 
+    same material properties with a single thickness evaluation. The 
+    concatenated parametric coordinates of each group are built once and 
+    re-used on later updates.
+
+    Parameters
+    ----------
+    beams : list[OneDBoxBeam]
+        The beams to be updated
+    """
+    geometry_points = {}
+    for geometry, group in _group_by_identity(beams, "_geom"):
+        stacked_points = geometry.evaluate(_get_group_points_parametric(group, "geometry")).reshape((-1, 3))
+        start = 0
+        for beam in group:
+            num_points = len(beam._geometry_points_parametric)
+            geometry_points[id(beam)] = stacked_points[start:start+num_points]
+            start += num_points
+
+    thicknesses = {}
+    for material_properties, group in _group_by_identity(beams, "_material_properties"):
+        stacked_thicknesses = material_properties.evaluate_thickness(_get_group_points_parametric(group, "thickness"))
+        start = 0
+        for beam in group:
+            num_points = len(beam._thickness_points_parametric)
+            thicknesses[id(beam)] = stacked_thicknesses[start:start+num_points]
+            start += num_points
+
+    for beam in beams:
+        beam._set_from_stacked_evaluations(geometry_points[id(beam)], thicknesses[id(beam)])
 
 
 class OneDBoxBeamDict(DiscretizationsDict):
@@ -1695,14 +2058,9 @@ def make_1d_box_beam(
         grid = np.linspace(spanwise+beam_width_offset[i]/2, spanwise-beam_width_offset[i]/2, num_chordwise).reshape(-1,3)
         node_grid[i,:,:] = grid
     node_grid = node_grid.reshape(-1,3)
-    top_grid = wing_geometry.project(node_grid + offset, direction=np.array([0., 0., -1]), plot=plot)
-    bottom_grid = wing_geometry.project(node_grid - offset, direction=np.array([0., 0., 1]), plot=plot)
-    top_thickness_grid = material_properties.evaluate_thickness(top_grid).reshape((num_beam_nodes-1, -1))
-    bottom_thickness_grid = material_properties.evaluate_thickness(bottom_grid).reshape((num_beam_nodes-1, -1))
-
-    # NOTE: not 100% sure this is right so if there's an issue with the beam thickness, this is the first place to check
-    top_thickness = csdl.average(top_thickness_grid, axes=(1,))
-    bottom_thickness = csdl.average(bottom_thickness_grid, axes=(1,))
+    top_grid = ParametricCoordinates.from_list(wing_geometry.project(node_grid + offset, direction=np.array([0., 0., -1]), plot=plot))
+    bottom_grid = ParametricCoordinates.from_list(wing_geometry.project(node_grid - offset, direction=np.array([0., 0., 1]), plot=plot))
+    thickness_point_sets = {"top" : top_grid, "bottom" : bottom_grid}
 
     # Compute the spar thickness if the spars are projected
     if project_spars:
@@ -1720,13 +2078,24 @@ def make_1d_box_beam(
         # NOTE: only really works well for 2 spars, but then so does the rest of the code
         f_spar_geometry = spar_geometery.declare_component(function_search_names=["0"])
         r_spar_geometry = spar_geometery.declare_component(function_search_names=["1"])
-        front_grid = f_spar_geometry.project(node_grid + offset, direction=np.array([-1., 0., 0.]), plot=plot)
-        rear_grid = r_spar_geometry.project(node_grid - offset, direction=np.array([1., 0., 0.]), plot=plot)
-        front_thickness_grid = material_properties.evaluate_thickness(front_grid).reshape((num_beam_nodes-1, -1))
-        rear_thickness_grid = material_properties.evaluate_thickness(rear_grid).reshape((num_beam_nodes-1, -1))
-        front_thickness = csdl.average(front_thickness_grid, axes=(1,))
-        rear_thickness = csdl.average(rear_thickness_grid, axes=(1,))
-        shear_web_thickness = (front_thickness + rear_thickness) / 2
+        front_grid = ParametricCoordinates.from_list(f_spar_geometry.project(node_grid + offset, direction=np.array([-1., 0., 0.]), plot=plot))
+        rear_grid = ParametricCoordinates.from_list(r_spar_geometry.project(node_grid - offset, direction=np.array([1., 0., 0.]), plot=plot))
+        thickness_point_sets["front"] = front_grid
+        thickness_point_sets["rear"] = rear_grid
+
+    # Evaluate the skin (and spar) thicknesses at once
+    thickness_points, thickness_slices = _stack_parametric_coordinates(thickness_point_sets)
+    thicknesses = material_properties.evaluate_thickness(thickness_points)
+    element_thicknesses = {
+        name : csdl.average(thicknesses[thickness_slice].reshape((num_beam_nodes-1, -1)), axes=(1,))
+        for name, thickness_slice in thickness_slices.items()
+    }
+
+    # NOTE: not 100% sure this is right so if there's an issue with the beam thickness, this is the first place to check
+    top_thickness = element_thicknesses["top"]
+    bottom_thickness = element_thicknesses["bottom"]
+    if project_spars:
+        shear_web_thickness = (element_thicknesses["front"] + element_thicknesses["rear"]) / 2
 
     beam_mesh = OneDBoxBeam(
         nodal_coordinates=beam_nodes,
@@ -1753,6 +2122,8 @@ def make_1d_box_beam(
     beam_mesh._node_bottom_parametric = node_bottom_parametric
     beam_mesh._top_grid_parametric = top_grid
     beam_mesh._bottom_grid_parametric = bottom_grid
+    beam_mesh._thickness_points_parametric = thickness_points
+    beam_mesh._thickness_point_slices = thickness_slices
     if project_spars:
         beam_mesh._spar_geom = spar_geometery
         beam_mesh._front_spar_geom = f_spar_geometry
@@ -1785,32 +2156,186 @@ class RotorDiscretization(Discretization):
     _p3 = None
     _p4 = None
 
+    _in_plane_ex = None
+    _in_plane_ey = None
+
+    _blade_geom = None
+    _blade_edges_parametric = None
+    _blade_in_geom = False
+
     def _update(self):
         if self._disk_parametric is not None:
             shape = (self.num_radial, self.num_azimuthal, 3)
             self.disk_mesh = self._geom.evaluate(self._disk_parametric).reshape(shape)
 
-        p1 = self._geom.evaluate(self._p1)
-        p2 = self._geom.evaluate(self._p2)
-        p3 = self._geom.evaluate(self._p3)
-        p4 = self._geom.evaluate(self._p4)
-        
-        # Compute thrust origin as the mean of two corner points
-        self.thrust_origin = (p1 + p2) / 2 
-        
-        # Compute in-plane vectors from the corner points
-        in_plane_x = p1 - p2
-        radius = csdl.norm(in_plane_x) / 2
-        in_plane_ex = in_plane_x / (2 * radius)
+        # the (geometric) radius is not written back, such that a user-assigned 
+        # radius (e.g., the rotor parameter) is kept on updates
+        (
+            self.thrust_origin, _, self._in_plane_ex, 
+            self._in_plane_ey, self.thrust_vector
+        ) = _compute_rotor_frame(self._geom, self._p1, self._p2, self._p3, self._p4)
 
-        in_plane_y = p3 - p4
-        in_plane_ey = in_plane_y / csdl.norm(in_plane_y)
-        
-        # compute thrust vector
-        self.thrust_vector = csdl.cross(in_plane_ey, in_plane_ex)
+        if self._blade_edges_parametric is not None:
+            self._update_blade_profiles()
 
         return self
 
+    def _update_blade_profiles(self):
+        """Compute the chord and twist profiles from the (projected) blade 
+        LE and TE points at the radial stations (evaluation only)."""
+        num_radial = self.num_radial
+        edge_points = self._get_blade_geometry().evaluate(self._blade_edges_parametric).reshape((2, num_radial, 3))
+        chord_vectors = edge_points[0] - edge_points[1]
+        self.chord_profile = csdl.norm(chord_vectors, axes=(1, ))
+
+        # twist (pitch) angle between the chord line and the rotor plane; positive if the LE is ahead along the thrust vector
+        thrust_vector_exp = csdl.expand(self.thrust_vector.reshape((3, )), (num_radial, 3), action='j->ij')
+        self.twist_profile = csdl.arcsin(csdl.sum(chord_vectors * thrust_vector_exp, axes=(1, )) / self.chord_profile)
+
+    def _get_blade_geometry(self):
+        """Return the geometry to evaluate the blade edges on.
+
+        Copies of the discretization (e.g., for vectorized configurations) 
+        only rebind '_geom', so the blade functions are taken from it if 
+        the blade geometry was part of the rotor geometry (see 'make_rotor_mesh'); 
+        the blade geometry is used otherwise.
+        """
+        if self._blade_in_geom:
+            return self._geom
+        return self._blade_geom
+
+    def compute_disk_coordinates(self, hub_radius=None) -> np.ndarray:
+        """Compute the (cartesian) coordinates of the disk grid from the
+        current rotor frame; shape (num_radial, num_azimuthal, 3).
+
+        Only the rotor frame (origin, radius and in-plane unit vectors) 
+        is recomputed, the normalized radial stations and the azimuthal
+        (cos, sin) basis are cached.
+
+        Parameters
+        ----------
+        hub_radius : float, optional
+            normalized hub radius, by default 'norm_hub_radius'
+        """
+        if hub_radius is None:
+            hub_radius = self.norm_hub_radius
+        
+        return _make_disk_coordinates(
+            _get_value(self.thrust_origin), _get_value(self.radius), 
+            _get_value(self._in_plane_ex), _get_value(self._in_plane_ey),
+            self.num_radial, self.num_azimuthal, _get_value(hub_radius),
+        )
+
+def _get_value(quantity):
+    if isinstance(quantity, csdl.Variable):
+        return quantity.value
+    return quantity
+
+def _compute_rotor_frame(geometry, p1, p2, p3, p4):
+    """Compute the thrust origin, radius, in-plane unit vectors and thrust 
+    vector of a rotor from its four corner points (one geometry evaluation)."""
+    corner_points = ParametricCoordinates.concatenate([p1, p2, p3, p4])
+    points = geometry.evaluate(corner_points).reshape((4, 3))
+    p1 = points[0:1]
+    p2 = points[1:2]
+    p3 = points[2:3]
+    p4 = points[3:4]
+
+    # Compute thrust origin as the mean of two corner points
+    thrust_origin = (p1 + p2) / 2 
+    
+    # Compute in-plane vectors from the corner points
+    in_plane_x = p1 - p2
+    radius = csdl.norm(in_plane_x) / 2
+    in_plane_ex = in_plane_x / (2 * radius)
+
+    in_plane_y = p3 - p4
+    in_plane_ey = in_plane_y / csdl.norm(in_plane_y)
+    
+    # compute thrust vector
+    thrust_vector = csdl.cross(in_plane_ey, in_plane_ex)
+
+    return thrust_origin, radius, in_plane_ex, in_plane_ey, thrust_vector
+
+_disk_basis_cache = {}
+
+def _get_disk_basis(num_radial:int, num_azimuthal:int):
+    """Return the (cached) normalized radial stations, shape (num_radial, ), 
+    and the unit in-plane basis (cos, sin), shape (num_azimuthal, 2), of a disk grid."""
+    key = (num_radial, num_azimuthal)
+    if key not in _disk_basis_cache:
+        norm_radius_linspace = 1.0 / num_radial / 2.0 + np.linspace(
+            0.0, 1.0 - 1.0 / num_radial, num_radial
+        )
+        thetha_vec = np.linspace(
+            0., 2 * np.pi - 2 * np.pi / num_azimuthal, num_azimuthal
+        )
+        in_plane_basis = np.stack((np.cos(thetha_vec), np.sin(thetha_vec)), axis=1)
+        _disk_basis_cache[key] = (norm_radius_linspace, in_plane_basis)
+    
+    return _disk_basis_cache[key]
+
+def _make_disk_coordinates(origin, radius, ex, ey, num_radial, num_azimuthal, norm_hub_radius):
+    """Vectorized construction of the disk grid (num_radial, num_azimuthal, 3)."""
+    norm_radius_linspace, in_plane_basis = _get_disk_basis(num_radial, num_azimuthal)
+    
+    radius = np.asarray(radius).reshape(())
+    hub_radius = radius * norm_hub_radius
+    radius_vec = hub_radius + (radius - hub_radius) * norm_radius_linspace
+
+    # (num_azimuthal, 3) unit in-plane directions
+    directions = in_plane_basis[:, 0:1] * np.reshape(ex, (1, 3)) + in_plane_basis[:, 1:2] * np.reshape(ey, (1, 3))
+
+    return np.reshape(origin, (1, 1, 3)) + radius_vec[:, None, None] * directions[None, :, :]
+
+def _project_blade_edges(blade_geometry, origin, radius, thrust_vector, radial_stations, grid_resolution:int=50,
+                         grid_search_density:int=10, plot:bool=False) -> ParametricCoordinates:
+    """Project the LE and TE points of a blade at the (normalized) radial stations.
+
+    The edges are found from a sampled parametric grid of the blade as 
+    the extreme points in the tangential direction within a radial band 
+    around each station, and are then projected at the exact stations 
+    in one call. The edge that is ahead along the thrust vector is taken 
+    as the LE (i.e., positive pitch).
+
+    Returns
+    -------
+    ParametricCoordinates
+        the LE points followed by the TE points; shape (2 * num_radial, )
+    """
+    origin = np.reshape(origin, (3, ))
+    normal = np.reshape(thrust_vector, (3, )) / np.linalg.norm(thrust_vector)
+    radius = float(np.reshape(radius, ()))
+    radial_stations = np.asarray(radial_stations) * radius
+
+    samples = blade_geometry.evaluate(blade_geometry.generate_parametric_grid((grid_resolution, grid_resolution)), non_csdl=True).reshape((-1, 3))
+    relative_samples = samples - origin
+    in_plane_samples = relative_samples - np.outer(relative_samples @ normal, normal)
+
+    # radial (e_r) and tangential (e_t) directions of the blade
+    e_r = in_plane_samples.mean(axis=0)
+    e_r /= np.linalg.norm(e_r)
+    e_t = np.cross(normal, e_r)
+    r = relative_samples @ e_r
+    t = relative_samples @ e_t
+    z = relative_samples @ normal
+
+    band = np.max(np.diff(radial_stations)) / 2 if len(radial_stations) > 1 else radius / 10
+    edge_points = np.zeros((2, len(radial_stations), 3))
+    for i, station in enumerate(radial_stations):
+        in_band = np.nonzero(np.abs(r - station) <= band)[0]
+        if in_band.shape[0] == 0:
+            in_band = np.argsort(np.abs(r - station))[0:grid_resolution]
+        for j, sample in enumerate((in_band[np.argmax(t[in_band])], in_band[np.argmin(t[in_band])])):
+            edge_points[j, i] = origin + station * e_r + t[sample] * e_t + z[sample] * normal
+
+    if np.mean((edge_points[0] - edge_points[1]) @ normal) < 0:
+        edge_points = edge_points[::-1]
+
+    return ParametricCoordinates.from_list(
+        blade_geometry.project(edge_points.reshape((-1, 3)), grid_search_density_parameter=grid_search_density, plot=plot)
+    )
+
 class RotorDiscretizationDict(DiscretizationsDict):
     def __getitem__(self, key) -> RotorDiscretization:
         return super().__getitem__(key)
@@ -1827,8 +2352,16 @@ def make_rotor_mesh(
     blade_comps=None,
     plot: bool = False,
     do_disk_projections:bool = False,
+    grid_search_density: int = 10,
 ) -> RotorDiscretization: 
-    
+    """Make the rotor discretization (thrust origin/vector, radius, and, 
+    optionally, the disk mesh and chord/twist profiles).
+
+    If 'blade_comps' (blade component(s) or geometry) is given, the LE and TE 
+    points of the first blade are projected once at the radial stations of 
+    the disk mesh, and the chord and twist profiles are re-evaluated from 
+    the geometry whenever the discretization is updated.
+    """
     from CADDEE_alpha.core.aircraft.components.rotor import Rotor
     # Do type checking
     csdl.check_parameter(rotor_comp, "rotor_comp", types=Rotor)
@@ -1842,25 +2375,11 @@ def make_rotor_mesh(
     if rotor_geometry is None:
         raise ValueError("Cannot compute rotor mesh parameters since the geometry is None")
     
-    # Get the "corner" points from the ffd block
-    p1 = rotor_geometry.evaluate(rotor_comp._corner_point_1)
-    p2 = rotor_geometry.evaluate(rotor_comp._corner_point_2)
-    p3 = rotor_geometry.evaluate(rotor_comp._corner_point_3)
-    p4 = rotor_geometry.evaluate(rotor_comp._corner_point_4)
-    
-    # Compute thrust origin as the mean of two corner points
-    thrust_origin = (p1 + p2) / 2 
-    
-    # Compute in-plane vectors from the corner points
-    in_plane_x = p1 - p2
-    radius = csdl.norm(in_plane_x) / 2
-    in_plane_ex = in_plane_x / (2 * radius)
-
-    in_plane_y = p3 - p4
-    in_plane_ey = in_plane_y / csdl.norm(in_plane_y)
-    
-    # compute thrust vector
-    thrust_vector = csdl.cross(in_plane_ey, in_plane_ex)
+    # Get the rotor frame from the "corner" points of the ffd block
+    thrust_origin, radius, in_plane_ex, in_plane_ey, thrust_vector = _compute_rotor_frame(
+        rotor_geometry, rotor_comp._corner_point_1, rotor_comp._corner_point_2,
+        rotor_comp._corner_point_3, rotor_comp._corner_point_4,
+    )
 
     rotor_mesh_parameters = RotorDiscretization(
         nodal_coordinates=thrust_origin,
@@ -1879,29 +2398,14 @@ def make_rotor_mesh(
     rotor_mesh_parameters._p4 = rotor_comp._corner_point_4
     rotor_mesh_parameters._geom = rotor_geometry
     
+    rotor_mesh_parameters._in_plane_ex = in_plane_ex
+    rotor_mesh_parameters._in_plane_ey = in_plane_ey
+
     # make disk mesh
     if num_azimuthal > 1 and do_disk_projections:
-        p = thrust_origin
-        v1 = in_plane_ex
-        v2 = in_plane_ey
-
-        norm_radius_linspace = 1.0 / num_radial / 2.0 + np.linspace(
-            0.0, 1.0 - 1.0 / num_radial, num_radial
-        )
-        
-        hub_radius = radius * rotor_comp.parameters.hub_radius
-        
-        radius_vec = hub_radius + (radius - hub_radius) * norm_radius_linspace
-
-        thetha_vec = np.linspace(
-            0., 2 * np.pi - 2 * np.pi / num_azimuthal, num_azimuthal
+        cartesian_coordinates = rotor_mesh_parameters.compute_disk_coordinates(
+            hub_radius=rotor_comp.parameters.hub_radius
         )
-
-        cartesian_coordinates = np.zeros((num_radial, num_azimuthal, 3))
-        for i in range(num_radial):
-            for j in range(num_azimuthal):
-                cartesian_coordinates[i, j, :] = p.value + radius_vec.value[i] * (np.cos(thetha_vec[j]) * v1.value \
-                                                    + np.sin(thetha_vec[j]) * v2.value)
         
         disk_mesh_parametric = rotor_geometry.project(cartesian_coordinates, plot=plot)
         disk_mesh = rotor_geometry.evaluate(disk_mesh_parametric).reshape((num_radial, num_azimuthal, 3))
@@ -1909,19 +2413,271 @@ def make_rotor_mesh(
         rotor_mesh_parameters.disk_mesh = disk_mesh
         rotor_mesh_parameters._disk_parametric = disk_mesh_parametric
 
+    # extract chord and twist profiles from the blade geometry
+    if blade_comps is not None:
+        blade_comp = blade_comps[0] if isinstance(blade_comps, (list, tuple)) else blade_comps
+        blade_geometry = blade_comp.geometry if hasattr(blade_comp, "geometry") else blade_comp
+        if blade_geometry is None:
+            raise ValueError("Cannot extract chord and twist profiles since the blade geometry is None")
+
+        norm_hub_radius = _get_value(rotor_comp.parameters.hub_radius)
+        norm_radius_linspace, _ = _get_disk_basis(num_radial, num_azimuthal)
+        radial_stations = norm_hub_radius + (1 - norm_hub_radius) * norm_radius_linspace
+
+        rotor_mesh_parameters._blade_geom = blade_geometry
+        # compare the functions by identity, since separately made function sets may reuse the same indices
+        rotor_mesh_parameters._blade_in_geom = all(
+            rotor_geometry.functions.get(ind) is function for ind, function in blade_geometry.functions.items()
+        )
+        rotor_mesh_parameters._blade_edges_parametric = _project_blade_edges(
+            blade_geometry, thrust_origin.value, radius.value, thrust_vector.value, radial_stations,
+            grid_search_density=grid_search_density, plot=plot,
+        )
+        rotor_mesh_parameters._update_blade_profiles()
+
     rotor_comp._discretizations[f"{rotor_comp._name}_rotor_mesh_parameters"] = rotor_mesh_parameters
 
     return rotor_mesh_parameters
 
+
+@dataclass
+class RotorGroup(Discretization):
+    """Stacked discretization of N rotors with identical topology (e.g., lift rotors).
+
+    The thrust origins, thrust vectors, radii and chord/twist profiles of the 
+    rotors are stacked along a leading dimension of size 'num_rotors' and 
+    updated with one geometry evaluation per (distinct) rotor geometry, 
+    which also updates the disk meshes. The thrust origins are the nodal
+    coordinates, which are expanded by the aircraft condition to a single 
+    (num_nodes, num_rotors, 3) mesh, such that rotor solvers can vectorize 
+    across rotors. One-engine-inoperative cases can use 'get_rotor_mask'.
+    """
+    thrust_vector : Union[csdl.Variable, None] = None
+    thrust_origin : Union[csdl.Variable, None] = None
+    chord_profile : Union[csdl.Variable, None] = None
+    twist_profile : Union[csdl.Variable, None] = None
+    radius : Union[csdl.Variable, None] = None
+    num_rotors: Union[int, None] = None
+    num_radial: Union[int, None] = None
+    num_azimuthal: Union[int, None] = None
+    num_blades: Union[int, None] = None
+    rotor_names: Union[list, None] = None
+
+    _rotor_discretizations : list = None
+    _stacked_parametric_coordinates : dict = None
+
+    def _get_stacked_parametric_coordinates(self, geometry, group:list) -> ParametricCoordinates:
+        """Return the (cached) corner points of all rotors in a group, followed by their disk points."""
+        if self._stacked_parametric_coordinates is None:
+            self._stacked_parametric_coordinates = {}
+        key = (id(geometry), ) + tuple(id(rotor) for rotor in group)
+        if key not in self._stacked_parametric_coordinates:
+            self._stacked_parametric_coordinates[key] = ParametricCoordinates.concatenate(
+                [corner_point for rotor in group for corner_point in (rotor._p1, rotor._p2, rotor._p3, rotor._p4)]
+                + [rotor._disk_parametric for rotor in group if rotor._disk_parametric is not None]
+            )
+        return self._stacked_parametric_coordinates[key]
+
+    def _update(self):
+        rotors = self._rotor_discretizations
+        num_rotors = self.num_rotors
+        disk_shape = (self.num_radial, self.num_azimuthal, 3)
+        num_disk_points = self.num_radial * self.num_azimuthal
+
+        # Evaluate the corner (and disk) points of all rotors sharing a geometry at once; 
+        # separate geometries may reuse the same function indices and are evaluated separately
+        geometry_groups = _group_by_identity(rotors, "_geom")
+        corner_points = {}
+        for geometry, group in geometry_groups:
+            group_points = geometry.evaluate(self._get_stacked_parametric_coordinates(geometry, group)).reshape((-1, 3))
+            num_group_corner_points = 4 * len(group)
+            corner_points[id(geometry)] = group_points[0:num_group_corner_points]
+            start = num_group_corner_points
+            for rotor in group:
+                if rotor._disk_parametric is not None:
+                    rotor.disk_mesh = group_points[start:start+num_disk_points].reshape(disk_shape)
+                    start += num_disk_points
+
+        # Scatter the corner points back into rotor order
+        if len(geometry_groups) == 1:
+            points = corner_points[id(geometry_groups[0][0])]
+        else:
+            rotor_corner_points = {}
+            for geometry, group in geometry_groups:
+                for j, rotor in enumerate(group):
+                    rotor_corner_points[id(rotor)] = corner_points[id(geometry)][4*j:4*j+4]
+            points = csdl.vstack([rotor_corner_points[id(rotor)] for rotor in rotors])
+        points = points.reshape((num_rotors, 4, 3))
+        p1 = points[:, 0, :]
+        p2 = points[:, 1, :]
+        p3 = points[:, 2, :]
+        p4 = points[:, 3, :]
+
+        # Compute thrust origins as the mean of two corner points
+        self.thrust_origin = (p1 + p2) / 2
+        self.nodal_coordinates = self.thrust_origin
+
+        # Compute in-plane vectors from the corner points
+        in_plane_x = p1 - p2
+        self.radius = csdl.norm(in_plane_x, axes=(1, )) / 2
+        in_plane_ex = in_plane_x / csdl.expand(2 * self.radius, (num_rotors, 3), action='i->ij')
+
+        in_plane_y = p3 - p4
+        in_plane_ey = in_plane_y / csdl.expand(csdl.norm(in_plane_y, axes=(1, )), (num_rotors, 3), action='i->ij')
+
+        # compute thrust vectors
+        self.thrust_vector = csdl.cross(in_plane_ey, in_plane_ex, axis=1)
+
+        # Update the individual rotor discretizations from the stacked quantities
+        for i, rotor in enumerate(rotors):
+            rotor.thrust_origin = self.thrust_origin[i:i+1, :]
+            rotor.thrust_vector = self.thrust_vector[i:i+1, :]
+            rotor.radius = self.radius[i:i+1]
+            rotor._in_plane_ex = in_plane_ex[i:i+1, :]
+            rotor._in_plane_ey = in_plane_ey[i:i+1, :]
+            if rotor._blade_edges_parametric is not None:
+                rotor._update_blade_profiles()
+
+        self._stack_profiles()
+
+        return self
+
+    def _stack_profiles(self):
+        """Stack the chord and twist profiles (num_rotors, num_radial) if all rotors have them."""
+        rotors = self._rotor_discretizations
+        for profile_name in ["chord_profile", "twist_profile"]:
+            profiles = [getattr(rotor, profile_name) for rotor in rotors]
+            if any(profile is None for profile in profiles):
+                continue
+            profiles = [
+                profile.reshape((1, -1)) if isinstance(profile, csdl.Variable) 
+                else csdl.Variable(value=np.asarray(profile).reshape((1, -1))) for profile in profiles
+            ]
+            if len(profiles) == 1:
+                setattr(self, profile_name, profiles[0])
+            else:
+                setattr(self, profile_name, csdl.vstack(profiles))
+
+    def get_rotor_mask(self, inoperative_rotors:Union[int, str, list]) -> np.ndarray:
+        """Return a (num_rotors, ) array of ones with zeros for the 
+        inoperative rotors (given by index or name), e.g., for OEI cases."""
+        if not isinstance(inoperative_rotors, list):
+            inoperative_rotors = [inoperative_rotors]
+        
+        mask = np.ones((self.num_rotors, ))
+        for rotor in inoperative_rotors:
+            if isinstance(rotor, str):
+                if self.rotor_names is None or rotor not in self.rotor_names:
+                    raise KeyError(f"Unknown rotor '{rotor}'. Available rotors are {self.rotor_names}")
+                rotor = self.rotor_names.index(rotor)
+            mask[rotor] = 0.
+        
+        return mask
+
+
+def make_rotor_group(rotor_discretizations:Union[list, dict]) -> RotorGroup:
+    """Make a stacked discretization of several rotors with identical topology.
+
+    Parameters
+    ----------
+    rotor_discretizations : Union[list, dict]
+        The rotor discretizations (made with 'make_rotor_mesh'); if a 
+        dictionary is provided, the keys are used as rotor names
+
+    Returns
+    -------
+    RotorGroup
+        The stacked rotor discretization
+    """
+    csdl.check_parameter(rotor_discretizations, "rotor_discretizations", types=(list, dict))
+
+    if isinstance(rotor_discretizations, dict):
+        rotor_names = list(rotor_discretizations.keys())
+        rotor_discretizations = list(rotor_discretizations.values())
+    else:
+        rotor_names = None
+
+    if len(rotor_discretizations) == 0:
+        raise ValueError("Need at least one rotor discretization to make a rotor group")
+    
+    for rotor in rotor_discretizations:
+        if not isinstance(rotor, RotorDiscretization):
+            raise TypeError(f"Can only group rotor discretizations; received object of type {type(rotor)}")
+
+    first_rotor = rotor_discretizations[0]
+    for attribute in ["num_radial", "num_azimuthal", "num_blades"]:
+        values = set(getattr(rotor, attribute) for rotor in rotor_discretizations)
+        if len(values) > 1:
+            raise ValueError(f"All rotors in a group must have the same topology; found different values for '{attribute}': {values}")
+
+    rotor_group = RotorGroup(
+        nodal_coordinates=None,
+        num_rotors=len(rotor_discretizations),
+        num_radial=first_rotor.num_radial,
+        num_azimuthal=first_rotor.num_azimuthal,
+        num_blades=first_rotor.num_blades,
+        rotor_names=rotor_names,
+    )
+    rotor_group._rotor_discretizations = rotor_discretizations
+    rotor_group._update()
+
+    return rotor_group
+
 @dataclass
 class ShellDiscretization(Discretization):
+    """Shell (quad/triangle) mesh of a component, e.g., made with 'import_shell_mesh'.
+
+    The connectivity is an integer array of shape (num_elements, 4), where 
+    triangles are padded with -1 (see 'mesh_utils.build_connectivity').
+    """
     geometry:csdl.Variable=None
     connectivity:csdl.Variable=None
-    nodes_parametric:csdl.Variable=None
+    nodes_parametric:ParametricCoordinates=None
 
     def _update(self):
         self.nodes = self.geometry.evaluate(self.nodes_parametric)
         return self
+
+    def to_memmap(self, directory:str):
+        """Move the fixed topology (connectivity and parametric coordinates) 
+        to read-only memory-mapped (.npy) files in 'directory'.
+
+        Copies of the discretization (e.g., from Configuration.copy or 
+        vectorized conditions) share the memory maps, such that only the 
+        geometry-dependent nodal coordinates are stored per copy.
+
+        Parameters
+        ----------
+        directory : str
+            directory of the memory-mapped files
+        """
+        self.connectivity = memmap_array(self.connectivity, directory, "connectivity")
+        self.nodes_parametric = ParametricCoordinates(
+            memmap_array(self.nodes_parametric.surface_indices, directory, "surface_indices"),
+            memmap_array(self.nodes_parametric.uv, directory, "uv"),
+        )
+        return self
+
+    def partition(self, num_partitions:int, weights:np.ndarray=None):
+        """Partition the mesh with recursive coordinate bisection of the 
+        element centroids (see 'partition_mesh_rcb'), e.g., for 
+        multi-process assembly in a downstream solver.
+
+        Parameters
+        ----------
+        num_partitions : int
+            number of partitions
+
+        weights : np.ndarray, optional
+            weight of each element (e.g., per thickness/material group), by default uniform
+
+        Returns
+        -------
+        tuple
+            element indices, node indices and interface node indices of each partition
+        """
+        nodes = self.nodal_coordinates.value.reshape((-1, 3))
+        return partition_mesh_rcb(nodes, self.connectivity, num_partitions, weights=weights)
         
 def import_shell_mesh(file_name:str, 
                       geometry,
@@ -1930,9 +2686,24 @@ def import_shell_mesh(file_name:str,
                       grid_search_n = 1,
                       priority_inds=None,
                       priority_eps=1e-4,
-                      force_reprojection=False):
+                      force_reprojection=False,
+                      dedupe_tol=1e-6,
+                      use_cache=False,
+                      cache_dir=None,
+                      memmap_dir=None,
+                      include_triangles=True):
     """
     Create a shell mesh for a component using a mesh file
+
+    If 'use_cache' is True, the nodes, connectivity and projected parametric 
+    coordinates are stored in a sidecar file (see 'import_mesh'), such that 
+    repeat runs do not need to re-project the nodes. If 'memmap_dir' is 
+    specified, the connectivity and parametric coordinates are stored as 
+    read-only memory maps in that directory (see 'ShellDiscretization.to_memmap').
+
+    The connectivity is an integer array of shape (num_elements, 4), where 
+    triangles are padded with -1; with 'include_triangles=False', only 
+    the quad elements are included.
     """
     import CADDEE_alpha as cd
     if isinstance(geometry, cd.Component):
@@ -1944,11 +2715,17 @@ def import_shell_mesh(file_name:str,
                                                         grid_search_n=grid_search_n,
                                                         priority_inds=priority_inds,
                                                         priority_eps=priority_eps,
-                                                        force_reprojection=force_reprojection)
+                                                        force_reprojection=force_reprojection,
+                                                        dedupe_tol=dedupe_tol,
+                                                        use_cache=use_cache,
+                                                        cache_dir=cache_dir,
+                                                        include_triangles=include_triangles)
     shell_mesh = ShellDiscretization(nodal_coordinates=nodes, 
                                      connectivity=connectivity,
                                      nodes_parametric=nodes_parametric,
                                      geometry=geometry)
+    if memmap_dir is not None:
+        shell_mesh.to_memmap(memmap_dir)
     return shell_mesh
 
 class ShellMesh(SolverMesh):
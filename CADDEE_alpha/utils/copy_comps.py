@@ -20,6 +20,15 @@ def copy_comps(comp : Component, system_geometry=None):
             geometry_copy = comp.geometry.copy()
             comp_copy.geometry = geometry_copy
 
+        # 2a) Share the FFD block and surface area (if already computed) with the original
+        comp_copy._cached_ffd_block = comp._cached_ffd_block
+        comp_copy._cached_ffd_block_points = comp._cached_ffd_block_points
+        comp_copy._cached_surface_area = comp._cached_surface_area
+        comp_copy._cached_surface_area_key = comp._cached_surface_area_key
+
+        # 2b) Share the sectional (mesh) projections (same topology as the original)
+        comp_copy._sectional_projections = comp._sectional_projections
+
     # 3) Create shallow copy of the comp's children 
     # TODO: dictionary's __getitem__ error message is not copied right now
     # Possible solution: Make new ComponentDict object and populate with the component's children
@@ -34,10 +43,16 @@ def copy_comps(comp : Component, system_geometry=None):
     # 4b) Copy material properties
     mat_copy = copy.copy(quantities_copy.material_properties)
     quantities_copy.material_properties = mat_copy
+    # 4c) Compute the (lazy) surface area of the copy with the copy's geometry
+    if quantities_copy._surface_area_function is not None:
+        quantities_copy._surface_area_function = comp_copy._get_surface_area
     comp_copy.quantities = quantities_copy
 
     # 5) Create shallow copy of the comp's parameters
     parameters_copy = copy.copy(comp.parameters)
+    # 5a) Resolve the (lazy) wetted area of the copy with the copy's geometry
+    if getattr(parameters_copy, "_surface_area_function", None) is not None:
+        parameters_copy._surface_area_function = comp_copy._get_surface_area
     comp_copy.parameters = parameters_copy
 
     # # 6) discretizations
@@ -1,56 +1,289 @@
 import numpy as np
 import meshio
 import time
+import hashlib
+import os
 import lsdo_geo as lg
+from CADDEE_alpha.utils.parametric_coordinates import ParametricCoordinates
 
 
+def merge_duplicate_nodes(nodes:np.ndarray, tolerance:float=1e-6):
+    """Merge nodes that are within 'tolerance' (distance) of each other.
+
+    Near-duplicates are found with a KD-tree; each cluster of (transitively) 
+    close nodes is snapped to its first node before removing exact duplicates.
+
+    Parameters
+    ----------
+    nodes : np.ndarray
+        nodal coordinates; shape (num_nodes, 3)
+
+    tolerance : float, optional
+        merge distance; if 0, only exact duplicates are removed, by default 1e-6
+
+    Returns
+    -------
+    tuple
+        the unique nodes (sorted like np.unique) and the index of each 
+        original node into the unique nodes; shape (num_nodes, )
+    """
+    num_nodes = nodes.shape[0]
+    if tolerance > 0 and num_nodes > 1:
+        from scipy.spatial import cKDTree
+        from scipy.sparse import coo_matrix
+        from scipy.sparse.csgraph import connected_components
+
+        pairs = cKDTree(nodes).query_pairs(r=tolerance, output_type='ndarray')
+        if pairs.shape[0] > 0:
+            graph = coo_matrix(
+                (np.ones(pairs.shape[0]), (pairs[:, 0], pairs[:, 1])), shape=(num_nodes, num_nodes)
+            )
+            num_clusters, labels = connected_components(graph, directed=False)
+            first_node = np.full((num_clusters, ), num_nodes)
+            np.minimum.at(first_node, labels, np.arange(num_nodes))
+            nodes = nodes[first_node[labels]]
+
+    unique_nodes, index = np.unique(nodes, return_inverse=True, axis=0)
+    return unique_nodes, index.reshape((-1, ))
+
+def build_connectivity(cells, index:np.ndarray=None, include_triangles:bool=True) -> np.ndarray:
+    """Build the connectivity of quad and triangle cell blocks (e.g., meshio cells).
+
+    Parameters
+    ----------
+    cells : list
+        cell blocks with attributes 'type' and 'data'; other element types are ignored
+
+    index : np.ndarray, optional
+        maps the original node indices to new (e.g., merged) node indices
+
+    include_triangles : bool, optional
+        if False, only quad cells are included (as in previous versions), by default True
+
+    Returns
+    -------
+    np.ndarray
+        integer connectivity of shape (num_cells, 4); triangles are padded with -1
+    """
+    cell_types = ('quad', 'triangle') if include_triangles else ('quad', )
+    blocks = []
+    for cell in cells:
+        if cell.type not in cell_types:     #TODO: add aditional 2D element types
+            continue
+        data = np.asarray(cell.data, dtype=int)
+        if index is not None:
+            data = index[data]
+        if cell.type == 'triangle':
+            data = np.hstack((data, np.full((data.shape[0], 1), -1, dtype=int)))
+        blocks.append(data)
+
+    if len(blocks) == 0:
+        return np.zeros((0, 4), dtype=int)
+    return np.vstack(blocks)
+
+def compute_element_centroids(nodes:np.ndarray, connectivity:np.ndarray) -> np.ndarray:
+    """Compute the centroids of quad/triangle elements (triangles padded with -1)."""
+    mask = connectivity >= 0
+    element_nodes = nodes[np.where(mask, connectivity, 0)]
+    return np.einsum('ij,ijk->ik', mask, element_nodes) / mask.sum(axis=1).reshape((-1, 1))
+
+def partition_mesh_rcb(nodes:np.ndarray, connectivity:np.ndarray, num_partitions:int, weights:np.ndarray=None):
+    """Partition a mesh with recursive coordinate bisection (RCB) of the element centroids.
+
+    Each set of elements is split normal to the direction of its largest 
+    (centroid) extent, such that the total weight of the two halves is 
+    proportional to the number of partitions assigned to them. Any number 
+    of partitions (not only powers of two) is supported.
+
+    Parameters
+    ----------
+    nodes : np.ndarray
+        nodal coordinates; shape (num_nodes, 3)
+
+    connectivity : np.ndarray
+        connectivity of shape (num_elements, 4); triangles padded with -1
+
+    num_partitions : int
+        number of partitions
+
+    weights : np.ndarray, optional
+        weight (e.g., assembly cost per thickness/material group) of each 
+        element; shape (num_elements, ), by default uniform
+
+    Returns
+    -------
+    tuple
+        element indices of each partition, (sorted) node indices of each 
+        partition and the interface nodes (i.e., nodes shared with other 
+        partitions) of each partition
+    """
+    connectivity = np.asarray(connectivity, dtype=int)
+    num_elements = connectivity.shape[0]
+    if num_partitions < 1:
+        raise ValueError(f"Number of partitions must be at least 1; received {num_partitions}.")
+    if weights is None:
+        weights = np.ones((num_elements, ))
+    else:
+        weights = np.asarray(weights, dtype=float).reshape((-1, ))
+        if weights.shape[0] != num_elements:
+            raise ValueError(f"Number of weights ({weights.shape[0]}) and elements ({num_elements}) must match.")
+
+    centroids = compute_element_centroids(nodes, connectivity)
+
+    element_partitions = []
+    stack = [(np.arange(num_elements), num_partitions)]
+    while stack:
+        elements, parts = stack.pop()
+        if parts == 1 or elements.shape[0] <= 1:
+            element_partitions.append(elements)
+            element_partitions += [np.zeros((0, ), dtype=int)] * (parts - 1)
+            continue
+        parts_left = parts // 2
+        element_centroids = centroids[elements]
+        axis = np.argmax(element_centroids.max(axis=0) - element_centroids.min(axis=0))
+        order = elements[np.argsort(element_centroids[:, axis], kind="stable")]
+        cumulative_weights = np.cumsum(weights[order])
+        target_weight = cumulative_weights[-1] * parts_left / parts
+        split = np.searchsorted(cumulative_weights, target_weight)
+        # split after the element whose cumulative weight is closest to the target
+        if split == 0 or cumulative_weights[split] - target_weight < target_weight - cumulative_weights[split-1]:
+            split += 1
+        split = min(max(split, 1), elements.shape[0] - 1)
+        # push the right half first such that the partitions are ordered along the bisections
+        stack.append((order[split:], parts - parts_left))
+        stack.append((order[0:split], parts_left))
+
+    node_partitions = [np.unique(connectivity[elements][connectivity[elements] >= 0]) for elements in element_partitions]
+
+    num_partitions_per_node = np.zeros((nodes.shape[0], ), dtype=int)
+    for partition_nodes in node_partitions:
+        num_partitions_per_node[partition_nodes] += 1
+    interface_nodes = [partition_nodes[num_partitions_per_node[partition_nodes] > 1] for partition_nodes in node_partitions]
+
+    return element_partitions, node_partitions, interface_nodes
+
+def memmap_array(array:np.ndarray, directory:str, name:str) -> np.memmap:
+    """Store an array in a (.npy) file and return a read-only memory map of it.
+
+    The file name contains a hash of the array contents, such that arrays with 
+    the same contents (e.g., the topology of copied meshes) map to the same file, 
+    which is only written once and shared by all processes/copies.
+
+    Parameters
+    ----------
+    array : np.ndarray
+        the array to be stored
+
+    directory : str
+        directory of the (.npy) file
+
+    name : str
+        prefix of the file name
+
+    Returns
+    -------
+    np.memmap
+        read-only memory map of the array
+    """
+    if isinstance(array, np.memmap) and array.mode == 'r':
+        return array
+    array = np.ascontiguousarray(array)
+    sha = hashlib.sha256(array.tobytes())
+    sha.update(f"{array.dtype.str}{array.shape}".encode())
+    file_name = os.path.join(directory, f"{name}.{sha.hexdigest()[:16]}.npy")
+    if not os.path.isfile(file_name):
+        os.makedirs(directory, exist_ok=True)
+        tmp_file = file_name + '.tmp.npy'
+        np.save(tmp_file, array)
+        os.replace(tmp_file, file_name)
+    return np.load(file_name, mmap_mode='r')
+
+def _hash_mesh_import(file:str, component:lg.Geometry, settings:dict) -> str:
+    """Hash the mesh file contents (including a companion .h5 file, e.g., 
+    for xdmf), the geometry coefficients and the import/projection settings."""
+    sha = hashlib.sha256()
+    mesh_files = [file]
+    h5_file = os.path.splitext(file)[0] + '.h5'
+    if h5_file != file and os.path.isfile(h5_file):
+        mesh_files.append(h5_file)
+    for mesh_file in mesh_files:
+        with open(mesh_file, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                sha.update(chunk)
+
+    for ind, function in component.functions.items():
+        sha.update(str(ind).encode())
+        sha.update(np.ascontiguousarray(function.coefficients.value, dtype=np.float64).tobytes())
+
+    sha.update(repr(sorted(settings.items())).encode())
+    return sha.hexdigest()
+
+def _get_mesh_cache_file(file:str, cache_dir:str, key:str) -> str:
+    if cache_dir is None:
+        cache_dir = os.path.dirname(os.path.abspath(file))
+    return os.path.join(cache_dir, f"{os.path.basename(file)}.{key[:16]}.mesh_cache.npz")
+
 def import_mesh(file, component:lg.Geometry, rescale:list=[1,1,1], remove_dupes=True, plot=False, grid_search_n:int=5, force_reprojection=False,
-                priority_inds=None, priority_eps=1e-4):
+                priority_inds=None, priority_eps=1e-4, dedupe_tol:float=1e-6, use_cache:bool=False, cache_dir:str=None,
+                include_triangles:bool=True):
     '''
     Read mesh file (from any format meshio supports) and convert into mapped array + connectivity
     ------------
     Parameters:
         file: str, name of mesh file
         ms: mechanical structure object 
+        dedupe_tol: float, distance within which (duplicate) nodes are merged
+        use_cache: bool, store the nodes, connectivity and projected parametric coordinates 
+            in a (.npz) sidecar file, keyed by hashes of the mesh file, geometry coefficients 
+            and settings, and load them from there in repeat runs (unless 'force_reprojection' 
+            is True, in which case the sidecar file is overwritten)
+        cache_dir: str, directory of the sidecar file (by default next to the mesh file)
+        include_triangles: bool, include triangle cells in the connectivity; if False, 
+            only quad cells are included (as in previous versions)
         ...
     
+    Returns the mapped nodes, their parametric coordinates and the (quad/triangle) 
+    connectivity. The connectivity is an integer array of shape (num_cells, 4), 
+    where triangles are padded with -1; previous versions returned a float array 
+    of the quad cells only. Consumers that index with the connectivity need to 
+    mask the -1 entries (see, e.g., 'compute_element_centroids').
     '''
     optimize_projection = False
     ms = None
     am = None
     tol = None
+
+    if use_cache:
+        settings = {
+            "rescale" : tuple(float(factor) for factor in rescale), "remove_dupes" : remove_dupes,
+            "grid_search_n" : grid_search_n, "dedupe_tol" : dedupe_tol, "priority_eps" : priority_eps,
+            "include_triangles" : include_triangles,
+            "priority_inds" : None if priority_inds is None else tuple(np.asarray(priority_inds).flatten().tolist()),
+        }
+        cache_file = _get_mesh_cache_file(file, cache_dir, _hash_mesh_import(file, component, settings))
+        # a forced re-projection skips reading the cache, but still (over-)writes it
+        if os.path.isfile(cache_file) and not force_reprojection:
+            with np.load(cache_file) as data:
+                connectivity = data["connectivity"]
+                ma_nodes_parametric = ParametricCoordinates(data["surface_indices"], data["uv"])
+            ma_nodes = component.evaluate(ma_nodes_parametric)
+            return ma_nodes, ma_nodes_parametric, connectivity
+    else:
+        cache_file = None
+
     mesh = meshio.read(file)
     nodes = np.array([mesh.points[:,0]*rescale[0], mesh.points[:,1]*rescale[1], mesh.points[:,2]*rescale[2]]).T
 
     if remove_dupes:
         nnodes = nodes.shape[0]
-        # remove duplicate nodes
-        nodes, index = np.unique(nodes, return_inverse=True, axis=0)
-        #print('dupes removed in ' + str(end-start) + ' seconds')
-        # map indices in cells to new indices
-        cells = []
-        connectivity = np.ndarray((0,4))
-        nquads = 0
-        for cell in mesh.cells:
-            if cell.type == 'quad':     #TODO: add aditional 2D element types
-                for n in range(cell.data.shape[0]):
-                    row = cell.data[n,:]
-                    # row = np.array([cind2[i] for i in row])
-                    row = np.array([index[i] for i in row])
-                    connectivity = np.vstack((connectivity,row.reshape((1,4))))
-                    cell.data[n,:] = row
-                cells.append(cell)
-                nquads += cell.data.shape[0]
+        # merge (near-)duplicate nodes and map indices in cells to new indices
+        nodes, index = merge_duplicate_nodes(nodes, tolerance=dedupe_tol)
+        connectivity = build_connectivity(mesh.cells, index, include_triangles=include_triangles)
+        cells = [cell for cell in mesh.cells if cell.type in ('quad', 'triangle')]
         print('number of duplicates removed is ' + str(nnodes-nodes.shape[0]))
         nnodes = nodes.shape[0]
     else:
-        connectivity = np.ndarray((0,4))
-        nquads = 0
-        for cell in mesh.cells:
-            if cell.type == 'quad':     #TODO: add aditional 2D element types
-                for row in cell.data:
-                    connectivity = np.vstack((connectivity,row.reshape((1,4))))
-                nquads += cell.data.shape[0]
+        connectivity = build_connectivity(mesh.cells, include_triangles=include_triangles)
 
     if optimize_projection:
         # assign nodes to their cells, cell to a surface in ms
@@ -96,6 +329,204 @@ def import_mesh(file, component:lg.Geometry, rescale:list=[1,1,1], remove_dupes=
     else:
         ma_nodes_parametric = component.project(nodes, grid_search_density_parameter=grid_search_n, plot=plot, force_reprojection=force_reprojection,
                                                 priority_inds=priority_inds, priority_eps=priority_eps)
+        ma_nodes_parametric = ParametricCoordinates.from_list(ma_nodes_parametric)
         ma_nodes = component.evaluate(ma_nodes_parametric)
 
-    return ma_nodes, ma_nodes_parametric, connectivity
\ No newline at end of file
+    if cache_file is not None:
+        # write to a temporary file first such that an interrupted run does not leave a corrupt sidecar
+        tmp_file = cache_file + '.tmp.npz'
+        np.savez(tmp_file, nodes=nodes, connectivity=connectivity,
+                 surface_indices=ma_nodes_parametric.surface_indices, uv=ma_nodes_parametric.uv)
+        os.replace(tmp_file, cache_file)
+
+    return ma_nodes, ma_nodes_parametric, connectivity
+
+
+def grid_connectivity(num_i:int, num_j:int, offset:int=0) -> np.ndarray:
+    """Return the quad connectivity of a structured (num_i, num_j) grid of points (row-major)."""
+    index = np.arange(num_i * num_j).reshape((num_i, num_j)) + offset
+    return np.stack((index[:-1, :-1], index[1:, :-1], index[1:, 1:], index[:-1, 1:]), axis=2).reshape((-1, 4))
+
+def connectivity_to_cell_blocks(connectivity:np.ndarray, offset:int=0):
+    """Split a (num_elements, 4) connectivity (triangles padded with -1) into 
+    meshio cell blocks.
+
+    Returns
+    -------
+    tuple
+        list of (cell_type, data) blocks and the element indices in block order
+    """
+    connectivity = np.asarray(connectivity, dtype=int)
+    is_triangle = connectivity[:, 3] < 0
+    blocks = []
+    order = []
+    for cell_type, mask, num_vertices in (('quad', ~is_triangle, 4), ('triangle', is_triangle, 3)):
+        if np.any(mask):
+            blocks.append((cell_type, connectivity[mask, 0:num_vertices] + offset))
+            order.append(np.nonzero(mask)[0])
+    if len(order) == 0:
+        return blocks, np.zeros((0, ), dtype=int)
+    return blocks, np.concatenate(order)
+
+class XDMFTimeSeriesExporter:
+    """Stream the nodal coordinates and fields of (vectorized) discretizations 
+    into one XDMF+HDF5 time series.
+
+    The points of all discretizations and conditions (i.e., the copies of a 
+    vectorized discretization) are merged into one mesh, which is written once. 
+    Each call of 'write' appends one time step (e.g., an optimization iteration) 
+    with the current nodal coordinates, the (geometry) displacement w.r.t. the first step 
+    and the attached fields, which are written to the HDF5 file right away such 
+    that the history is never held in memory. Fields that are not defined on a 
+    discretization are padded with NaN.
+
+    Example
+    -------
+    with mesh_container.export_xdmf("results.xdmf") as exporter:
+        for iteration in range(num_iterations):
+            ...
+            exporter.write(iteration)
+    """
+    def __init__(self, file_name:str):
+        self.file_name = file_name
+        self._discretizations = {}
+        self._writer = None
+        self._reference_points = None
+        self._num_steps = 0
+
+    def add_discretization(self, name:str, discretization, point_fields:dict=None, cell_fields:dict=None):
+        """Add a discretization (or vectorized discretization/list of discretizations).
+
+        Parameters
+        ----------
+        name : str
+            name of the discretization
+
+        discretization : Discretization, VectorizedDiscretization, list
+            the discretization (of each condition)
+
+        point_fields : dict, optional
+            nodal fields (e.g., displacements), either one variable/array 
+            for all conditions or a list with one entry per condition
+
+        cell_fields : dict, optional
+            element fields (e.g., pressures, thickness), as for point fields
+        """
+        if self._writer is not None:
+            raise Exception("Cannot add discretizations after the first time step has been written.")
+        if hasattr(discretization, 'disc_list'):
+            discretizations = discretization.disc_list
+        elif isinstance(discretization, list):
+            discretizations = discretization
+        else:
+            discretizations = [discretization]
+        self._discretizations[name] = (discretizations, point_fields or {}, cell_fields or {})
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.__exit__(None, None, None)
+            self._writer = None
+
+    @staticmethod
+    def _get_value(variable) -> np.ndarray:
+        return np.asarray(getattr(variable, 'value', variable), dtype=float)
+
+    def _split_by_condition(self, variable, num_conditions:int, num_entities:int) -> list:
+        if isinstance(variable, (list, tuple)):
+            return [self._get_value(entry).reshape((num_entities, -1)) for entry in variable]
+        return list(self._get_value(variable).reshape((num_conditions, num_entities, -1)))
+
+    def _setup(self, coordinates:dict):
+        cells = []
+        offset = 0
+        self._topology = {}
+        for name, (discretizations, _, _) in self._discretizations.items():
+            connectivity = getattr(discretizations[0], 'connectivity', None)
+            self._topology[name] = []
+            for points in coordinates[name]:
+                if connectivity is not None:
+                    # one copy of the connectivity for each leading (e.g., num_nodes) index of the points
+                    num_mesh_points = points.shape[-2] if points.ndim >= 2 else points.size // 3
+                    num_copies = points.size // (3 * num_mesh_points)
+                    num_elements = np.asarray(connectivity).shape[0]
+                    blocks = []
+                    order = []
+                    for i in range(num_copies):
+                        copy_blocks, copy_order = connectivity_to_cell_blocks(connectivity, offset + i * num_mesh_points)
+                        blocks += copy_blocks
+                        order.append(copy_order + i * num_elements)
+                    order = np.concatenate(order)
+                elif points.ndim >= 3:
+                    num_i, num_j = points.shape[-3:-1]
+                    num_grids = points.size // (3 * num_i * num_j)
+                    blocks = [('quad', np.vstack([grid_connectivity(num_i, num_j, offset + i * num_i * num_j) for i in range(num_grids)]))]
+                    order = np.arange(blocks[0][1].shape[0])
+                else:
+                    num_points = points.size // 3
+                    blocks = [('line', np.stack((np.arange(num_points - 1), np.arange(1, num_points)), axis=1) + offset)]
+                    order = np.arange(num_points - 1)
+                num_points = points.size // 3
+                self._topology[name].append((offset, num_points, range(len(cells), len(cells) + len(blocks)), order))
+                cells += blocks
+                offset += num_points
+
+        self._num_points = offset
+        self._cell_blocks = cells
+        self._reference_points = np.vstack([points.reshape((-1, 3)) for points_list in coordinates.values() for points in points_list])
+        self._writer = meshio.xdmf.TimeSeriesWriter(self.file_name)
+        self._writer.__enter__()
+        self._writer.write_points_cells(self._reference_points, cells)
+
+    def write(self, time:float=None):
+        """Write the current values as a new time step (by default numbered consecutively)."""
+        coordinates = {
+            name : [self._get_value(discretization.nodal_coordinates) for discretization in discretizations]
+            for name, (discretizations, _, _) in self._discretizations.items()
+        }
+        if self._writer is None:
+            self._setup(coordinates)
+        if time is None:
+            time = self._num_steps
+
+        points = np.vstack([points.reshape((-1, 3)) for points_list in coordinates.values() for points in points_list])
+        point_data = {"nodal_coordinates" : points, "geometry_displacement" : points - self._reference_points}
+        cell_data = {
+            "discretization" : [np.zeros((data.shape[0], )) for _, data in self._cell_blocks],
+            "condition" : [np.zeros((data.shape[0], )) for _, data in self._cell_blocks],
+        }
+
+        for discretization_index, (name, (discretizations, point_fields, cell_fields)) in enumerate(self._discretizations.items()):
+            topology = self._topology[name]
+            num_conditions = len(discretizations)
+            for condition, (_, _, blocks, _) in enumerate(topology):
+                for block in blocks:
+                    cell_data["discretization"][block][:] = discretization_index
+                    cell_data["condition"][block][:] = condition
+
+            for field_name, variable in point_fields.items():
+                values = self._split_by_condition(variable, num_conditions, topology[0][1])
+                if field_name not in point_data:
+                    point_data[field_name] = np.full((self._num_points, values[0].shape[1]), np.nan)
+                for (offset, num_points, _, _), condition_values in zip(topology, values):
+                    point_data[field_name][offset:offset+num_points] = condition_values
+
+            for field_name, variable in cell_fields.items():
+                values = self._split_by_condition(variable, num_conditions, topology[0][3].shape[0])
+                if field_name not in cell_data:
+                    cell_data[field_name] = [np.full((data.shape[0], values[0].shape[1]), np.nan) for _, data in self._cell_blocks]
+                for (_, _, blocks, order), condition_values in zip(topology, values):
+                    condition_values = condition_values[order]
+                    start = 0
+                    for block in blocks:
+                        num_cells = self._cell_blocks[block][1].shape[0]
+                        cell_data[field_name][block][:] = condition_values[start:start+num_cells]
+                        start += num_cells
+
+        self._writer.write_data(time, point_data=point_data, cell_data=cell_data)
+        self._num_steps += 1
@@ -0,0 +1,136 @@
+import numpy as np
+from typing import Union, List
+
+
+class ParametricCoordinates:
+    """Compact representation of parametric coordinates on a set of surfaces.
+
+    Instead of a list of (surface_index, np.array([[u, v]])) tuples, the
+    coordinates are stored as an int32 array of surface indices and a
+    float64 array of (u, v) coordinates. Iterating over (or indexing with
+    an integer into) an instance yields the tuples, such that it can be
+    used wherever the list of tuples is expected (e.g., geometry.evaluate).
+
+    Parameters
+    ----------
+    surface_indices : np.ndarray
+        Surface (function) index of each point; shape (num_points, )
+
+    uv : np.ndarray
+        Parametric coordinates of each point; shape (num_points, 2)
+    """
+    def __init__(self, surface_indices: np.ndarray, uv: np.ndarray) -> None:
+        surface_indices = np.asarray(surface_indices, dtype=np.int32).reshape((-1, ))
+        uv = np.asarray(uv, dtype=np.float64).reshape((-1, 2))
+        if surface_indices.shape[0] != uv.shape[0]:
+            raise ValueError(f"Number of surface indices ({surface_indices.shape[0]}) and uv coordinates ({uv.shape[0]}) must match.")
+
+        self.surface_indices = surface_indices
+        self.uv = uv
+        self._surface_groups = None
+        self._inverse_surface_order = None
+
+    @classmethod
+    def from_list(cls, parametric_coordinates) -> "ParametricCoordinates":
+        """Make an instance from a list (or 'O,O' array) of (surface_index, uv) tuples.
+
+        Instances of ParametricCoordinates are returned as is.
+        """
+        if isinstance(parametric_coordinates, cls):
+            return parametric_coordinates
+
+        if isinstance(parametric_coordinates, tuple):
+            parametric_coordinates = [parametric_coordinates]
+
+        # structured arrays (dtype='O,O') as used for ribs and spars
+        if isinstance(parametric_coordinates, np.ndarray) and parametric_coordinates.dtype.names is not None:
+            field_1, field_2 = parametric_coordinates.dtype.names[0:2]
+            surface_indices = parametric_coordinates[field_1].flatten()
+            uv = parametric_coordinates[field_2].flatten()
+        else:
+            surface_indices = [parametric_coordinate[0] for parametric_coordinate in parametric_coordinates]
+            uv = [parametric_coordinate[1] for parametric_coordinate in parametric_coordinates]
+
+        num_points = len(surface_indices)
+        if num_points == 0:
+            return cls(np.zeros((0, ), dtype=np.int32), np.zeros((0, 2)))
+
+        surface_indices = np.fromiter(surface_indices, dtype=np.int32, count=num_points)
+        uv = np.vstack([np.asarray(coordinate, dtype=np.float64).reshape((1, 2)) for coordinate in uv])
+
+        return cls(surface_indices, uv)
+
+    @classmethod
+    def concatenate(cls, parametric_coordinates_list: List["ParametricCoordinates"]) -> "ParametricCoordinates":
+        """Concatenate several sets of parametric coordinates (or lists of tuples)."""
+        parametric_coordinates_list = [cls.from_list(parametric_coordinates) for parametric_coordinates in parametric_coordinates_list]
+        return cls(
+            np.concatenate([parametric_coordinates.surface_indices for parametric_coordinates in parametric_coordinates_list]),
+            np.concatenate([parametric_coordinates.uv for parametric_coordinates in parametric_coordinates_list]),
+        )
+
+    def to_list(self) -> list:
+        """Return the (compatibility) list of (surface_index, np.array([[u, v]])) tuples."""
+        return [(int(self.surface_indices[i]), self.uv[i:i+1]) for i in range(len(self))]
+
+    def group_by_surface(self) -> dict:
+        """Return a dictionary mapping each surface index to the (sorted) point indices on that surface.
+
+        The grouping is computed once per instance and cached.
+        """
+        if self._surface_groups is None:
+            order = np.argsort(self.surface_indices, kind="stable")
+            unique_indices, starts = np.unique(self.surface_indices[order], return_index=True)
+            self._surface_groups = {
+                int(surface_index) : point_indices for surface_index, point_indices
+                in zip(unique_indices, np.split(order, starts[1:]))
+            }
+        return self._surface_groups
+
+    def inverse_surface_order(self) -> np.ndarray:
+        """Return the indices that map values ordered by surface (i.e., 
+        concatenated in the order of 'group_by_surface') back to the original point order.
+        """
+        if self._inverse_surface_order is None:
+            groups = self.group_by_surface()
+            if len(groups) == 0:
+                self._inverse_surface_order = np.zeros((0, ), dtype=int)
+            else:
+                self._inverse_surface_order = np.argsort(np.concatenate(list(groups.values())), kind="stable")
+        return self._inverse_surface_order
+
+    def save(self, file_name: str):
+        """Save the parametric coordinates to a (.npz) file."""
+        np.savez(file_name, surface_indices=self.surface_indices, uv=self.uv)
+
+    @classmethod
+    def load(cls, file_name: str) -> "ParametricCoordinates":
+        """Load parametric coordinates saved with 'save'."""
+        with np.load(file_name) as data:
+            return cls(data["surface_indices"], data["uv"])
+
+    def __len__(self) -> int:
+        return self.surface_indices.shape[0]
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield (int(self.surface_indices[i]), self.uv[i:i+1])
+
+    def __getitem__(self, key) -> Union[tuple, "ParametricCoordinates"]:
+        """Integers return a (surface_index, uv) tuple; slices (views)
+        and index arrays return a new ParametricCoordinates instance."""
+        if isinstance(key, (int, np.integer)):
+            if key < 0:
+                key += len(self)
+            return (int(self.surface_indices[key]), self.uv[key:key+1])
+        else:
+            return ParametricCoordinates(self.surface_indices[key], self.uv[key])
+
+    def __add__(self, other) -> "ParametricCoordinates":
+        return ParametricCoordinates.concatenate([self, other])
+
+    def __radd__(self, other) -> "ParametricCoordinates":
+        return ParametricCoordinates.concatenate([other, self])
+
+    def __repr__(self) -> str:
+        return f"ParametricCoordinates(num_points={len(self)}, surfaces={np.unique(self.surface_indices).tolist()})"
@@ -1,7 +1,9 @@
 import csdl_alpha as csdl
 import numpy as np
+import scipy.sparse as sps
 import lsdo_function_spaces as lfs
 import CADDEE_alpha as cd
+from CADDEE_alpha.utils.parametric_coordinates import ParametricCoordinates
 
 
 def load_thickness_vars(fname, group):
@@ -26,100 +28,135 @@ def construct_bay_condition(upper, lower):
         return out.T
     return condition
 
+class BayThicknessSpace(lfs.LinearFunctionSpace):
+    """Piecewise-constant (or piecewise-linear) function space along one parametric direction.
+
+    The (sorted) breakpoints define the bays, e.g., between ribs. Points are located 
+    with np.searchsorted, so the basis matrix is a constant sparse matrix. 
+    Points outside of [breakpoints[0], breakpoints[-1]] evaluate to zero.
+
+    Parameters
+    ----------
+    breakpoints : np.ndarray
+        Sorted breakpoints of shape (num_bays + 1, )
+
+    order : int, optional
+        0 for piecewise-constant (one coefficient per bay) or 
+        1 for piecewise-linear (one coefficient per breakpoint), by default 0
+
+    parametric_dimension : int, optional
+        Parametric direction along which the bays are defined, by default 0 (i.e., u)
+    """
+    def __init__(self, breakpoints:np.ndarray, order:int=0, parametric_dimension:int=0):
+        csdl.check_parameter(order, "order", values=(0, 1))
+        breakpoints = np.asarray(breakpoints, dtype=float).flatten()
+        if np.any(np.diff(breakpoints) <= 0):
+            raise ValueError("'breakpoints' must be strictly increasing.")
+        
+        self.breakpoints = breakpoints
+        self.order = order
+        self.parametric_dimension = parametric_dimension
+        num_coefficients = len(breakpoints) - 1 + order
+        super().__init__(2, (num_coefficients, ))
+
+    def compute_basis_matrix(self, parametric_coordinates:np.ndarray, parametric_derivative_orders:np.ndarray=None, expansion_factor:int=None):
+        if parametric_derivative_orders is not None:
+            raise NotImplementedError('BayThicknessSpace does not support derivatives')
+        if expansion_factor is not None:
+            raise NotImplementedError('BayThicknessSpace does not support expansion factors')
+        
+        parametric_coordinates = np.asarray(parametric_coordinates).reshape((-1, self.num_parametric_dimensions))
+        u = parametric_coordinates[:, self.parametric_dimension]
+        num_points = u.shape[0]
+        num_bays = len(self.breakpoints) - 1
+
+        inside = np.logical_and(u >= self.breakpoints[0], u <= self.breakpoints[-1])
+        # Bays are closed on the right (and the first bay on the left as well)
+        bay_indices = np.clip(np.searchsorted(self.breakpoints, u, side='left') - 1, 0, num_bays - 1)
+        rows = np.arange(num_points)[inside]
+        bay_indices = bay_indices[inside]
+
+        if self.order == 0:
+            basis_matrix = sps.csr_matrix((np.ones(len(rows)), (rows, bay_indices)), shape=(num_points, num_bays))
+        else:
+            lower = self.breakpoints[bay_indices]
+            upper = self.breakpoints[bay_indices + 1]
+            t = (u[inside] - lower) / (upper - lower)
+            basis_matrix = sps.csr_matrix(
+                (np.concatenate((1 - t, t)), (np.concatenate((rows, rows)), np.concatenate((bay_indices, bay_indices + 1)))),
+                shape=(num_points, num_bays + 1),
+            )
+        
+        return basis_matrix
+
+
+def _make_bay_thickness_function(bays:list) -> lfs.Function:
+    """Make a piecewise-constant thickness function from a list of (lower, upper, thickness) bays.
+
+    Gaps between (sorted) bays are filled with zero-thickness bays.
+    """
+    bays = sorted(bays, key=lambda bay: bay[0])
+    breakpoints = [bays[0][0]]
+    thicknesses = []
+    for lower, upper, thickness in bays:
+        if lower > breakpoints[-1]:
+            breakpoints.append(lower)
+            thicknesses.append(None)
+        breakpoints.append(upper)
+        thicknesses.append(thickness)
+    
+    coefficients = csdl.Variable(shape=(len(thicknesses), ), value=0.)
+    for i, thickness in enumerate(thicknesses):
+        if thickness is not None:
+            coefficients = coefficients.set(csdl.slice[i:i+1], thickness.reshape((1, )))
+
+    return lfs.Function(BayThicknessSpace(np.array(breakpoints)), coefficients)
+
+
+def _make_thickness_variable(name, value, t_vars, t_out, add_dvs, minimum_thickness):
+    thickness = csdl.Variable(value=value, name=name)
+    if t_vars is not None:
+        thickness.value = t_vars[name]
+    t_out[thickness.name] = thickness
+    if add_dvs:
+        thickness.set_as_design_variable(upper=0.05, lower=minimum_thickness, scaler=1e3)
+    return thickness
+
+
 def construct_thickness_function(wing, num_ribs, top_array, bottom_array, material, 
                                  t_vars=None, skin_t=0.01, spar_t=0.01, rib_t=0.01, 
                                  minimum_thickness=0.0003, add_dvs=True):
+    """Add piecewise-constant skin and spar thicknesses (one per bay between ribs) 
+    and constant rib thicknesses to the material properties of the wing.
+    
+    Each skin/spar surface gets a single function in a BayThicknessSpace.
+    """
     bay_eps = 1e-2
     t_out = {}
-    for i in range(num_ribs-1):
-        # upper wing bays
-        lower = top_array[:, i]
-        upper = top_array[:, i+1]
-        l_surf_ind = lower[0][0]
-        u_surf_ind = upper[0][0]
-        l_coord_u = np.mean(np.array([coord[0,0] for (ind, coord) in lower])) - bay_eps
-        u_coord_u = np.mean(np.array([coord[0,0] for (ind, coord) in upper])) - bay_eps
-        if i == num_ribs-2:
-            u_coord_u = 1 + bay_eps
+    for skin, point_array in [('upper', top_array), ('lower', bottom_array)]:
+        surface_bays = {}
+        for i in range(num_ribs-1):
+            lower = ParametricCoordinates.from_list(point_array[:, i])
+            upper = ParametricCoordinates.from_list(point_array[:, i+1])
+            l_surf_ind = int(lower.surface_indices[0])
+            u_surf_ind = int(upper.surface_indices[0])
+            l_coord_u = np.mean(lower.uv[:, 0]) - bay_eps
+            u_coord_u = np.mean(upper.uv[:, 0]) - bay_eps
+            if i == num_ribs-2:
+                u_coord_u = 1 + bay_eps
 
-        if l_surf_ind == u_surf_ind:
-            condition = construct_bay_condition(u_coord_u, l_coord_u)
-            if t_vars is not None:
-                thickness = csdl.Variable(value=skin_t, name='upper_wing_thickness_'+str(i))
-                thickness.value = t_vars['upper_wing_thickness_'+str(i)]
-                t_out[thickness.name] = thickness
-            else:
-                thickness = csdl.Variable(value=skin_t, name='upper_wing_thickness_'+str(i))
-                t_out[thickness.name] = thickness
-            if add_dvs:
-                thickness.set_as_design_variable(upper=0.05, lower=minimum_thickness, scaler=1e3)
-            
-            function = lfs.Function(lfs.ConditionalSpace(2, condition), thickness)
-            functions = {l_surf_ind: function}
-            thickness_fs = lfs.FunctionSet(functions)
-            wing.quantities.material_properties.add_material(material, thickness_fs)
-        else:
-            condition1 = construct_bay_condition(1, l_coord_u)
-            condition2 = construct_bay_condition(u_coord_u, 0)
-            if t_vars is not None:
-                thickness = csdl.Variable(value=skin_t, name='upper_wing_thickness_'+str(i))
-                thickness.value = t_vars['upper_wing_thickness_'+str(i)]
-                t_out[thickness.name] = thickness
-            else:
-                thickness = csdl.Variable(value=skin_t, name='upper_wing_thickness_'+str(i))
-                t_out[thickness.name] = thickness
-            if add_dvs:
-                thickness.set_as_design_variable(upper=0.05, lower=minimum_thickness, scaler=1e3)
-            function1 = lfs.Function(lfs.ConditionalSpace(2, condition1), thickness)
-            function2 = lfs.Function(lfs.ConditionalSpace(2, condition2), thickness)
-            functions = {l_surf_ind: function1, u_surf_ind: function2}
-            thickness_fs = lfs.FunctionSet(functions)
-            wing.quantities.material_properties.add_material(material, thickness_fs)
+            thickness = _make_thickness_variable(f'{skin}_wing_thickness_'+str(i), skin_t, t_vars, t_out, add_dvs, minimum_thickness)
 
-        # lower wing bays
-        lower = bottom_array[:, i]
-        upper = bottom_array[:, i+1]
-        l_surf_ind = lower[0][0]
-        u_surf_ind = upper[0][0]
-        l_coord_u = np.mean(np.array([coord[0, 0] for (ind, coord) in lower])) - bay_eps
-        u_coord_u = np.mean(np.array([coord[0, 0] for (ind, coord) in upper])) - bay_eps
-        if i == num_ribs-2:
-            u_coord_u = 1 + bay_eps
-        # l_coord_u = lower[0][1][0, 0]
-        # u_coord_u = upper[0][1][0, 0]
-        if l_surf_ind == u_surf_ind:
-            condition = construct_bay_condition(u_coord_u, l_coord_u)
-            if t_vars is not None:
-                thickness = csdl.Variable(value=skin_t, name='lower_wing_thickness_'+str(i))
-                thickness.value = t_vars['lower_wing_thickness_'+str(i)]
-                t_out[thickness.name] = thickness
+            if l_surf_ind == u_surf_ind:
+                surface_bays.setdefault(l_surf_ind, []).append((l_coord_u, u_coord_u, thickness))
             else:
-                thickness = csdl.Variable(value=skin_t, name='lower_wing_thickness_'+str(i))
-                t_out[thickness.name] = thickness
-            if add_dvs:
-                thickness.set_as_design_variable(upper=0.05, lower=minimum_thickness, scaler=1e3)
-            function = lfs.Function(lfs.ConditionalSpace(2, condition), thickness)
-            functions = {l_surf_ind: function}
-            thickness_fs = lfs.FunctionSet(functions)
-            wing.quantities.material_properties.add_material(material, thickness_fs)
-        else:
-            condition1 = construct_bay_condition(1, l_coord_u)
-            condition2 = construct_bay_condition(u_coord_u, 0)
-            if t_vars is not None:
-                thickness = csdl.Variable(value=skin_t, name='lower_wing_thickness_'+str(i))
-                thickness.value = t_vars['lower_wing_thickness_'+str(i)]
-                t_out[thickness.name] = thickness
-            else:
-                thickness = csdl.Variable(value=skin_t, name='lower_wing_thickness_'+str(i))
-                t_out[thickness.name] = thickness
-            if add_dvs:
-                thickness.set_as_design_variable(upper=0.05, lower=minimum_thickness, scaler=1e3)
-            function1 = lfs.Function(lfs.ConditionalSpace(2, condition1), thickness)
-            function2 = lfs.Function(lfs.ConditionalSpace(2, condition2), thickness)
-            functions = {l_surf_ind: function1, u_surf_ind: function2}
-            thickness_fs = lfs.FunctionSet(functions)
-            wing.quantities.material_properties.add_material(material, thickness_fs)
+                # bay is split across two surfaces
+                surface_bays.setdefault(l_surf_ind, []).append((l_coord_u, 1., thickness))
+                surface_bays.setdefault(u_surf_ind, []).append((0., u_coord_u, thickness))
 
+        functions = {ind: _make_bay_thickness_function(bays) for ind, bays in surface_bays.items()}
+        thickness_fs = lfs.FunctionSet(functions)
+        wing.quantities.material_properties.add_material(material, thickness_fs)
 
     # ribs
     rib_geometry = wing.create_subgeometry(search_names=["rib"])
@@ -129,15 +166,7 @@ def construct_thickness_function(wing, num_ribs, top_array, bottom_array, materi
         if "-" in name:
             pass
         else:
-            if t_vars is not None:
-                thickness = csdl.Variable(value=rib_t, name=name+'_thickness')
-                thickness.value = t_vars[name+'_thickness']
-                t_out[thickness.name] = thickness
-            else:
-                thickness = csdl.Variable(value=rib_t, name=name+'_thickness')
-                t_out[thickness.name] = thickness
-            if add_dvs:
-                thickness.set_as_design_variable(upper=0.05, lower=minimum_thickness, scaler=1e3)
+            thickness = _make_thickness_variable(name+'_thickness', rib_t, t_vars, t_out, add_dvs, minimum_thickness)
             function = lfs.Function(rib_fsp, thickness)
             functions = {ind: function}
             thickness_fs = lfs.FunctionSet(functions)
@@ -145,30 +174,18 @@ def construct_thickness_function(wing, num_ribs, top_array, bottom_array, materi
 
     # spars
     u_cords = np.linspace(0, 1, num_ribs)
+    spar_breakpoints = u_cords - bay_eps
+    spar_breakpoints[-1] = 1 + 2*bay_eps
     spar_geometry = wing.create_subgeometry(search_names=["spar"], ignore_names=['_r_'])
     spar_inds = list(spar_geometry.functions)
-    for i in range(num_ribs-1):
-        lower = u_cords[i] - bay_eps
-        upper = u_cords[i+1] - bay_eps
-        if i == num_ribs-2:
-            upper = 1 + 2*bay_eps
-        condition = construct_bay_condition(upper, lower)
-        spar_num = 0
-        for ind in spar_inds:
-            if t_vars is not None:
-                thickness = csdl.Variable(value=spar_t, name=f'spar_{spar_num}_thickness_{i}')
-                thickness.value = t_vars[f'spar_{spar_num}_thickness_{i}']
-                t_out[thickness.name] = thickness
-            else:
-                thickness = csdl.Variable(value=spar_t, name=f'spar_{spar_num}_thickness_{i}')
-                t_out[thickness.name] = thickness
-            if add_dvs:
-                thickness.set_as_design_variable(upper=0.05, lower=minimum_thickness, scaler=1e3)
-            function = lfs.Function(lfs.ConditionalSpace(2, condition), thickness)
-            functions = {ind: function}
-            thickness_fs = lfs.FunctionSet(functions)
-            wing.quantities.material_properties.add_material(material, thickness_fs)
-            spar_num += 1
+    for spar_num, ind in enumerate(spar_inds):
+        bays = []
+        for i in range(num_ribs-1):
+            thickness = _make_thickness_variable(f'spar_{spar_num}_thickness_{i}', spar_t, t_vars, t_out, add_dvs, minimum_thickness)
+            bays.append((spar_breakpoints[i], spar_breakpoints[i+1], thickness))
+        functions = {ind: _make_bay_thickness_function(bays)}
+        thickness_fs = lfs.FunctionSet(functions)
+        wing.quantities.material_properties.add_material(material, thickness_fs)
 
     return t_out
     
@@ -197,86 +214,119 @@ def construct_plates(num_ribs, top_array, bottom_array):
     bay_eps = 1e-2
     for i in range(num_ribs-2):
         # upper wing bays
-        lower = top_array[1:3, i]
-        upper = top_array[1:3, i+1]
-        l_surf_ind = lower[0][0]
-        u_surf_ind = upper[0][0]
-        l_coord_u = np.mean(np.array([coord[0,0] for (ind, coord) in lower])) - bay_eps
-        u_coord_u = np.mean(np.array([coord[0,0] for (ind, coord) in upper])) + bay_eps
+        lower = ParametricCoordinates.from_list(top_array[1:3, i])
+        upper = ParametricCoordinates.from_list(top_array[1:3, i+1])
+        l_surf_ind = int(lower.surface_indices[0])
+        u_surf_ind = int(upper.surface_indices[0])
+        l_coord_u = np.mean(lower.uv[:, 0]) - bay_eps
+        u_coord_u = np.mean(upper.uv[:, 0]) + bay_eps
         if i == num_ribs-2:
             u_coord_u = 1 + bay_eps
         # l_coord_u = lower[0][1][0,0]
         # u_coord_u = upper[0][1][0,0]
         if l_surf_ind == u_surf_ind:
-            f_coord_v = (lower[0][1][0,1] + upper[0][1][0,1])/2 + bay_eps
-            b_coord_v = (lower[1][1][0,1] + upper[1][1][0,1])/2 - bay_eps
+            f_coord_v = (lower.uv[0, 1] + upper.uv[0, 1])/2 + bay_eps
+            b_coord_v = (lower.uv[1, 1] + upper.uv[1, 1])/2 - bay_eps
             condition = construct_plate_condition(u_coord_u, l_coord_u, f_coord_v, b_coord_v, l_surf_ind)
             bays['upper_wing_bay_'+str(i)] = [condition]
         else:
-            condition1 = construct_plate_condition(1, l_coord_u, lower[0][1][0,1]+bay_eps, lower[1][1][0,1]-bay_eps, l_surf_ind)
-            condition2 = construct_plate_condition(u_coord_u, 0, upper[0][1][0,1]+bay_eps, upper[1][1][0,1]-bay_eps, u_surf_ind)
+            condition1 = construct_plate_condition(1, l_coord_u, lower.uv[0, 1]+bay_eps, lower.uv[1, 1]-bay_eps, l_surf_ind)
+            condition2 = construct_plate_condition(u_coord_u, 0, upper.uv[0, 1]+bay_eps, upper.uv[1, 1]-bay_eps, u_surf_ind)
             bays['upper_wing_bay_'+str(i)] = [condition1, condition2]
 
         # lower wing bays
-        lower = bottom_array[1:3, i]
-        upper = bottom_array[1:3, i+1]
-        l_surf_ind = lower[0][0]
-        u_surf_ind = upper[0][0]
-        l_coord_u = np.mean(np.array([coord[0, 0] for (ind, coord) in lower])) - bay_eps
-        u_coord_u = np.mean(np.array([coord[0, 0] for (ind, coord) in upper])) + bay_eps
+        lower = ParametricCoordinates.from_list(bottom_array[1:3, i])
+        upper = ParametricCoordinates.from_list(bottom_array[1:3, i+1])
+        l_surf_ind = int(lower.surface_indices[0])
+        u_surf_ind = int(upper.surface_indices[0])
+        l_coord_u = np.mean(lower.uv[:, 0]) - bay_eps
+        u_coord_u = np.mean(upper.uv[:, 0]) + bay_eps
         if i == num_ribs-2:
             u_coord_u = 1 + bay_eps
         # l_coord_u = lower[0][1][0, 0]
         # u_coord_u = upper[0][1][0, 0]
         if l_surf_ind == u_surf_ind:
-            f_coord_v = (lower[0][1][0,1] + upper[0][1][0,1])/2 - bay_eps
-            b_coord_v = (lower[1][1][0,1] + upper[1][1][0,1])/2 + bay_eps
+            f_coord_v = (lower.uv[0, 1] + upper.uv[0, 1])/2 - bay_eps
+            b_coord_v = (lower.uv[1, 1] + upper.uv[1, 1])/2 + bay_eps
             condition = construct_plate_condition(u_coord_u, l_coord_u, b_coord_v, f_coord_v, l_surf_ind)
             bays['lower_wing_bay_'+str(i)] = [condition]
         else:
-            condition1 = construct_plate_condition(1, l_coord_u, lower[1][1][0,1]+bay_eps, lower[0][1][0,1]-bay_eps, l_surf_ind)
-            condition2 = construct_plate_condition(u_coord_u, 0, upper[1][1][0,1]+bay_eps, upper[0][1][0,1]-bay_eps, u_surf_ind)
+            condition1 = construct_plate_condition(1, l_coord_u, lower.uv[1, 1]+bay_eps, lower.uv[0, 1]-bay_eps, l_surf_ind)
+            condition2 = construct_plate_condition(u_coord_u, 0, upper.uv[1, 1]+bay_eps, upper.uv[0, 1]-bay_eps, u_surf_ind)
             bays['lower_wing_bay_'+str(i)] = [condition1, condition2]
     return bays
 
-def compute_buckling_loads(wing, material, point_array, t_vars):
-    compression_k_lookup = {0.2:22.2, 0.3:10.9, 0.4:6.92, 0.6:4.23, 0.8:3.45, 
-                        1.0:3.29, 1.2:3.40, 1.4:3.68, 1.6:3.45, 1.8:3.32, 
-                        2.0:3.29, 2.2:3.32, 2.4:3.40, 2.7:3.32, 3.0:3.29}
-    shear_k_lookup = {1.0:7.75, 1.2:6.58, 1.4:6.00, 1.5:5.84, 1.6:5.76, 
-                    1.8:5.59, 2.0:5.43, 2.5:5.18, 3.0:5.02}
+# Buckling coefficients (k-factors) of flat plates as a function of the aspect ratio
+compression_k_table = np.array([
+    [0.2, 22.2], [0.3, 10.9], [0.4, 6.92], [0.6, 4.23], [0.8, 3.45], 
+    [1.0, 3.29], [1.2, 3.40], [1.4, 3.68], [1.6, 3.45], [1.8, 3.32], 
+    [2.0, 3.29], [2.2, 3.32], [2.4, 3.40], [2.7, 3.32], [3.0, 3.29],
+])
+shear_k_table = np.array([
+    [1.0, 7.75], [1.2, 6.58], [1.4, 6.00], [1.5, 5.84], [1.6, 5.76], 
+    [1.8, 5.59], [2.0, 5.43], [2.5, 5.18], [3.0, 5.02],
+])
+
+def interpolate_k_factor(k_table:np.ndarray, aspect_ratio:np.ndarray) -> np.ndarray:
+    """Interpolate tabulated k-factors with a (C1-smooth) monotone cubic interpolant.
+    
+    Aspect ratios outside of the table are clamped to the table range.
+    """
+    from scipy.interpolate import PchipInterpolator
+    aspect_ratio = np.clip(aspect_ratio, k_table[0, 0], k_table[-1, 0])
+    return PchipInterpolator(k_table[:, 0], k_table[:, 1])(aspect_ratio)
+
+def _get_rib_points(point_array) -> ParametricCoordinates:
+    """Return the two (spar) points of each rib, ordered as [rib_0_s1, rib_0_s2, rib_1_s1, ...]."""
+    return ParametricCoordinates.from_list(point_array[0:2, :].T)
+
+def _compute_bay_dimensions(wing, rib_points:ParametricCoordinates):
+    """Compute the average side lengths of all bays, approximated as rectangles 
+    between ribs (length a) and spars (length b), with one geometry evaluation."""
+    corner_points = wing.geometry.evaluate(rib_points, non_csdl=True).reshape((-1, 2, 3))
+    lower = corner_points[:-1]
+    upper = corner_points[1:]
+    b = (np.linalg.norm(lower[:, 0] - lower[:, 1], axis=1) + np.linalg.norm(upper[:, 0] - upper[:, 1], axis=1)) / 2
+    a = (np.linalg.norm(lower[:, 0] - upper[:, 0], axis=1) + np.linalg.norm(lower[:, 1] - upper[:, 1], axis=1)) / 2
+    return a, b
+
+def _stack_bay_thicknesses(t_vars, surface, num_bays) -> csdl.Variable:
+    thicknesses = [t_vars[f'{surface}_wing_thickness_'+str(i)].reshape((1, 1)) for i in range(num_bays)]
+    if num_bays == 1:
+        return thicknesses[0].reshape((1, ))
+    return csdl.vstack(thicknesses).reshape((num_bays, ))
+
+def compute_buckling_loads(wing, material, point_array, t_vars, surface="upper"):
+    """Compute the critical compressive and shear stresses of all (flat) bays at once.
+
+    Returns
+    -------
+    tuple
+        sigma_cr and tau_cr, both of shape (num_bays, )
+    """
+    if surface not in ["upper", "lower"]:
+        raise ValueError("'surface' must either be 'upper' or 'lower'")
+
     E, nu, G = material.get_constants()
-    sigma_cr = []
-    tau_cr = []
-    for i in range(point_array.shape[1]-1):
-        # get relevant parametric points
-        lower = point_array[:, i].tolist()   # [s1, s2]
-        upper = point_array[:, i+1].tolist() # [s1, s2]
-
-        # get thickness
-        t = t_vars['upper_wing_thickness_'+str(i)]
-
-        # approximate the bay as a rectangle between ribs (lower and upper) and the spars (s1 and s2)
-        # compute the side lengths of the rectangle
-        corner_points_parametric = lower + upper
-        corner_points = wing.geometry.evaluate(corner_points_parametric, non_csdl=True)
-        b1 = np.linalg.norm(corner_points[0] - corner_points[1])
-        b2 = np.linalg.norm(corner_points[2] - corner_points[3])
-        a1 = np.linalg.norm(corner_points[0] - corner_points[2])
-        a2 = np.linalg.norm(corner_points[1] - corner_points[3])
-        a = (a1 + a2)/2
-        b = (b1 + b2)/2
-        aspect_ratio = a/b
-        compression_k = compression_k_lookup[min(compression_k_lookup, key=lambda x:abs(x-aspect_ratio))]
-        if aspect_ratio < 1:
-            aspect_ratio = 1/aspect_ratio
-        shear_k = shear_k_lookup[min(shear_k_lookup, key=lambda x:abs(x-aspect_ratio))]
-
-        sigma_cr.append(compression_k*E/(1-nu**2)*(t/b)**2)
-        tau_cr.append(shear_k*E/(1-nu**2)*(t/b)**2)
+    num_bays = point_array.shape[1]-1
+
+    a, b = _compute_bay_dimensions(wing, _get_rib_points(point_array))
+    aspect_ratio = a/b
+    compression_k = interpolate_k_factor(compression_k_table, aspect_ratio)
+    shear_k = interpolate_k_factor(shear_k_table, np.maximum(aspect_ratio, 1/aspect_ratio))
+
+    t = _stack_bay_thicknesses(t_vars, surface, num_bays)
+    t_over_b_squared = (t / b)**2
+    sigma_cr = compression_k*E/(1-nu**2)*t_over_b_squared
+    tau_cr = shear_k*E/(1-nu**2)*t_over_b_squared
     return sigma_cr, tau_cr
 
 def compute_curved_buckling_loads(wing, material, point_array, t_vars, surface="upper"):
+    """Compute the critical compressive stresses of all curved bays at once.
+
+    The radius of curvature of each bay is averaged over its four corner 
+    points and the mid-points of its two ribs.
+    """
     if surface not in ["upper", "lower"]:
         raise ValueError("'surface' must either be 'upper' or 'lower'")
     
@@ -285,36 +335,23 @@ def compute_curved_buckling_loads(wing, material, point_array, t_vars, surface="
         E = E.value
         nu = nu.value
         G = G.value
-    sigma_cr = csdl.Variable(shape=(point_array.shape[1]-1, ), value=0)
-    for i in range(point_array.shape[1]-1):
-        # get relevant parametric points
-        lower = point_array[:, i].tolist()
-        upper = point_array[:, i+1].tolist()
-        lower_middle = (lower[0][0], (lower[0][1]+lower[1][1])/2)
-        upper_middle = (upper[0][0], (upper[0][1]+upper[1][1])/2)
-
-        # get thickness
-        t = t_vars[f'{surface}_wing_thickness_'+str(i)]
-
-        # approximate the bay as a rectangle between ribs (lower and upper) and the spars (s1 and s2)
-        # compute the side lengths of the rectangle
-        corner_points_parametric = lower + upper
-        corner_points = wing.geometry.evaluate(corner_points_parametric, non_csdl=True)
-        b1 = np.linalg.norm(corner_points[0] - corner_points[1])
-        b2 = np.linalg.norm(corner_points[2] - corner_points[3])
-        a1 = np.linalg.norm(corner_points[0] - corner_points[2])
-        a2 = np.linalg.norm(corner_points[1] - corner_points[3])
-        a = (a1 + a2)/2
-        b = (b1 + b2)/2
-        
-        # compute average radius of curvature
-        r = np.sum(roc(wing, lower+upper+[lower_middle, upper_middle]))/6
-
-        # sigma_cr.append(1/6*E/(1-nu**2)*((12*(1-nu**2)*(t/r)**2+(np.pi*t/b)**4)**(1/2)+(np.pi*t/b)**2))
-        sigma_cr = sigma_cr.set(
-            csdl.slice[i], 
-            1/6*E/(1-nu**2)*((12*(1-nu**2)*(t/r)**2+(np.pi*t/b)**4)**(1/2)+(np.pi*t/b)**2)
-        )
+    num_bays = point_array.shape[1]-1
+
+    rib_points = _get_rib_points(point_array)
+    a, b = _compute_bay_dimensions(wing, rib_points)
+
+    # radius of curvature at the two spar points and the mid-point of each rib
+    rib_middle_points = ParametricCoordinates(
+        rib_points.surface_indices[0::2], 
+        (rib_points.uv[0::2] + rib_points.uv[1::2]) / 2,
+    )
+    rib_roc = roc(wing, rib_points + rib_middle_points)
+    num_ribs = num_bays + 1
+    rib_roc_sum = rib_roc[0:2*num_ribs].reshape((num_ribs, 2)).sum(axis=1) + rib_roc[2*num_ribs:]
+    r = (rib_roc_sum[:-1] + rib_roc_sum[1:]) / 6
+
+    t = _stack_bay_thicknesses(t_vars, surface, num_bays)
+    sigma_cr = 1/6*E/(1-nu**2)*((12*(1-nu**2)*(t/r)**2+(np.pi*t/b)**4)**(1/2)+(np.pi*t/b)**2)
     return sigma_cr
 
 def roc(wing:cd.Component, point):
@@ -0,0 +1,167 @@
+import csdl_alpha as csdl
+import numpy as np
+import scipy.sparse as sps
+from scipy.spatial import cKDTree
+from typing import Union
+from CADDEE_alpha.utils.parametric_coordinates import ParametricCoordinates
+
+
+class TransferOperator:
+    """Sparse load and displacement transfer between two discretizations.
+
+    The operator is a (num_load_points, num_nodes) sparse matrix H whose
+    rows sum to one, with
+        u_load_points = H @ u_nodes        (consistent displacement transfer)
+        f_nodes = H^T @ f_load_points      (conservative force transfer)
+    such that the total force and the virtual work are preserved. The load
+    points are, e.g., VLM panel centers and the nodes are, e.g., beam nodes.
+
+    Since the weights are computed once, from points that are attached to
+    the geometry through their parametric coordinates, the same operator is
+    reused for all design iterations and conditions; leading (num_nodes)
+    dimensions of the transferred variables are broadcast.
+
+    Parameters
+    ----------
+    matrix : sps.spmatrix
+        transfer matrix; shape (num_load_points, num_nodes)
+    """
+    def __init__(self, matrix: sps.spmatrix) -> None:
+        self.matrix = sps.csr_matrix(matrix)
+        self._transpose = self.matrix.T.tocsr()
+        self._broadcast_operators = {}
+
+    @classmethod
+    def from_points(cls, load_points: np.ndarray, nodes: np.ndarray, num_neighbors: int=4, power: float=2.) -> "TransferOperator":
+        """Make an inverse-distance weighted operator from the 'num_neighbors'
+        closest nodes of each load point.
+
+        Parameters
+        ----------
+        load_points : np.ndarray
+            coordinates of the load points; shape (num_load_points, 3)
+
+        nodes : np.ndarray
+            coordinates of the nodes; shape (num_nodes, 3)
+
+        num_neighbors : int, optional
+            number of nodes each load point is coupled to, by default 4
+
+        power : float, optional
+            exponent of the inverse distance weighting, by default 2.
+
+        Returns
+        -------
+        TransferOperator
+        """
+        load_points = np.asarray(load_points, dtype=float).reshape((-1, 3))
+        nodes = np.asarray(nodes, dtype=float).reshape((-1, 3))
+        num_load_points = load_points.shape[0]
+        num_nodes = nodes.shape[0]
+        num_neighbors = min(num_neighbors, num_nodes)
+
+        distances, indices = cKDTree(nodes).query(load_points, k=num_neighbors)
+        distances = distances.reshape((num_load_points, num_neighbors))
+        indices = indices.reshape((num_load_points, num_neighbors))
+
+        # load points that coincide with a node are fully assigned to it
+        coincident = distances < 1e-12 * max(np.ptp(nodes, axis=0).max(), 1.)
+        with np.errstate(divide='ignore'):
+            weights = np.where(coincident.any(axis=1, keepdims=True), coincident.astype(float), 1 / distances**power)
+        weights /= weights.sum(axis=1, keepdims=True)
+
+        rows = np.repeat(np.arange(num_load_points), num_neighbors)
+        matrix = sps.csr_matrix((weights.flatten(), (rows, indices.flatten())), shape=(num_load_points, num_nodes))
+        return cls(matrix)
+
+    @classmethod
+    def from_parametric_coordinates(
+        cls,
+        geometry,
+        load_points: Union[ParametricCoordinates, list, np.ndarray],
+        nodes: Union[ParametricCoordinates, list, np.ndarray],
+        num_neighbors: int=4,
+        power: float=2.,
+    ) -> "TransferOperator":
+        """Make an operator from parametric coordinates on a (shared) geometry.
+
+        The parametric coordinates are evaluated once (without csdl) and the
+        weights are computed from the resulting points (see 'from_points').
+        Points that are not on the geometry (e.g., beam nodes) can be given
+        as arrays instead.
+
+        Parameters
+        ----------
+        geometry : lg.Geometry, FunctionSet
+            geometry that both discretizations are attached to
+
+        load_points : ParametricCoordinates, list, np.ndarray
+            parametric coordinates (or coordinates) of the load points
+
+        nodes : ParametricCoordinates, list, np.ndarray
+            parametric coordinates (or coordinates) of the nodes
+
+        Returns
+        -------
+        TransferOperator
+        """
+        def get_points(points):
+            if isinstance(points, np.ndarray) and points.dtype.names is None:
+                return points
+            return geometry.evaluate(ParametricCoordinates.from_list(points), non_csdl=True)
+
+        return cls.from_points(get_points(load_points), get_points(nodes), num_neighbors=num_neighbors, power=power)
+
+    def _get_broadcast_operator(self, matrix: sps.csr_matrix, transpose: bool, num_copies: int, num_columns: int) -> sps.csr_matrix:
+        """Return the operator acting on the flattened (num_copies, num_rows, num_columns) values."""
+        key = (transpose, num_copies, num_columns)
+        if key not in self._broadcast_operators:
+            self._broadcast_operators[key] = sps.kron(
+                sps.identity(num_copies, format='csr'), sps.kron(matrix, sps.identity(num_columns, format='csr')), format='csr'
+            )
+        return self._broadcast_operators[key]
+
+    def _apply(self, matrix: sps.csr_matrix, transpose: bool, values: Union[csdl.Variable, np.ndarray]):
+        if len(values.shape) == 1:
+            values = values.reshape((values.shape[0], 1))
+        shape = values.shape
+        if shape[-2] != matrix.shape[1]:
+            raise ValueError(f"Expected {matrix.shape[1]} points in the second-to-last dimension of the values; received shape {shape}.")
+        num_copies = int(np.prod(shape[:-2]))
+        num_columns = shape[-1]
+        out_shape = tuple(shape[:-2]) + (matrix.shape[0], num_columns)
+
+        operator = self._get_broadcast_operator(matrix, transpose, num_copies, num_columns)
+        if isinstance(values, csdl.Variable):
+            return csdl.sparse.matvec(operator, values.reshape((values.size, 1))).reshape(out_shape)
+        return (operator @ np.asarray(values).reshape((-1, ))).reshape(out_shape)
+
+    def transfer_displacements(self, displacements: Union[csdl.Variable, np.ndarray]):
+        """Map nodal displacements to the load points.
+
+        Parameters
+        ----------
+        displacements : csdl.Variable, np.ndarray
+            nodal displacements; shape (..., num_nodes, num_components)
+
+        Returns
+        -------
+        csdl.Variable, np.ndarray
+            displacements at the load points; shape (..., num_load_points, num_components)
+        """
+        return self._apply(self.matrix, False, displacements)
+
+    def transfer_forces(self, forces: Union[csdl.Variable, np.ndarray]):
+        """Map forces at the load points to the nodes (conserving the total force).
+
+        Parameters
+        ----------
+        forces : csdl.Variable, np.ndarray
+            forces at the load points; shape (..., num_load_points, num_components)
+
+        Returns
+        -------
+        csdl.Variable, np.ndarray
+            nodal forces; shape (..., num_nodes, num_components)
+        """
+        return self._apply(self._transpose, True, forces)
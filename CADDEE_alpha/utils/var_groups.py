@@ -5,6 +5,7 @@ import numpy as np
 import lsdo_function_spaces as fs
 from caddee_materials import Material
 from csdl_alpha.utils.typing import VariableLike
+from CADDEE_alpha.utils.parametric_coordinates import ParametricCoordinates
 
 @dataclass
 class AircaftStates(csdl.VariableGroup):
@@ -67,6 +68,10 @@ class MaterialProperties:
         self.component = component
         self.direction = direction
         self.material_stack = [] # {material, surface_indices, bounding_function, thickness, orientation}
+        self._surface_material_map = None
+        self._surface_material_map_entries = None
+        self._materials = []
+        self._surface_ply_table = {}
         # TODO: think about using a dict for things like orientation and thickness
 
     def set_material(self, material:Material, thickness:Union[VariableLike, fs.FunctionSet]):
@@ -176,15 +181,48 @@ class MaterialProperties:
             Material stack for the given surface index.
             Dictionary containing ('material', 'bounding_function', 'thickness', 'orientation')
         """
-        material_stack = []
-        for material_info in self.material_stack:
-            surface_indices = material_info['surface_indices']
-            if surface_index in surface_indices:
-                material_stack.append({'material':material_info['material'], 
-                                       'bounding_function':material_info['bounding_function'], 
-                                       'thickness':material_info['thickness'], 
-                                       'orientation':material_info['orientation']})
-        return material_stack 
+        surface_material_map = self._get_surface_material_map()
+        return [{'material':material_info['material'], 
+                 'bounding_function':material_info['bounding_function'], 
+                 'thickness':material_info['thickness'], 
+                 'orientation':material_info['orientation']} 
+                 for material_info in surface_material_map.get(surface_index, [])]
+    
+    def _get_surface_material_map(self) -> dict:
+        """Return a dictionary mapping surface indices to the (ordered) entries of the material stack.
+
+        The map is cached and rebuilt whenever the entries of the material stack 
+        change. The stack is compared by identity of its entries rather than 
+        invalidated by the instance that modifies it, since (shallow) copies of 
+        the material properties (see 'copy_comps') share the same stack.
+        """
+        # the cached entries are kept (i.e., not only their ids), such that the ids cannot be reused
+        entries = self._surface_material_map_entries
+        if self._surface_material_map is None or len(entries) != len(self.material_stack) or any(
+            material_info is not cached_material_info for material_info, cached_material_info in zip(self.material_stack, entries)
+        ):
+            surface_material_map = {}
+            for material_info in self.material_stack:
+                for surface_index in material_info['surface_indices']:
+                    surface_material_map.setdefault(surface_index, []).append(material_info)
+            self._surface_material_map = surface_material_map
+            self._surface_material_map_entries = tuple(self.material_stack)
+
+            # Ply tables: index (into the list of unique materials) of each ply per surface
+            materials = []
+            for material_info in self.material_stack:
+                if not any(material_info['material'] is material for material in materials):
+                    materials.append(material_info['material'])
+            self._materials = materials
+            self._surface_ply_table = {
+                surface_index : np.array([
+                    next(i for i, material in enumerate(materials) if material is material_info['material']) 
+                    for material_info in surface_stack
+                ], dtype=int)
+                for surface_index, surface_stack in surface_material_map.items()
+            }
+        
+        return self._surface_material_map
     
     def plot_thickness(self, geo, opacity:float=1., color_map:str='jet', surface_texture:str="", show:bool=True, grid_n=25):
         '''
@@ -234,7 +272,7 @@ class MaterialProperties:
 
         Parameters
         ----------
-        parametric_coordinates : list
+        parametric_coordinates : Union[ParametricCoordinates, list]
             Parametric coordinates at which to evaluate the material stack.
 
         Returns
@@ -249,104 +287,165 @@ class MaterialProperties:
             else:
                 return np.ones(len(parametric_coordinates)) * self.thickness
 
-        # TODO: group inds together
-        index_group = {}
-        for i, parametric_coordinate in enumerate(parametric_coordinates):
-            ind = parametric_coordinate[0]
-            if ind not in index_group:
-                index_group[ind] = []
-            index_group[ind].append(i)
-
-        out = csdl.Variable(shape=(len(parametric_coordinates),), value=0)
-        parametric_coordinates = np.array(parametric_coordinates, dtype='O,O')
-        for ind, inds in index_group.items():
-            inds = np.array(inds)
-            material_stack = self.get_material_stack(ind)
-            if len(material_stack) == 0:
-                if isinstance(self.thickness, fs.FunctionSet):
-                    evaluated_thickness = self.thickness.evaluate(parametric_coordinates=[parametric_coordinates[inds[0]]])
-                elif self.thickness is not None:
-                    evaluated_thickness = self.thickness
+        # Points are grouped by surface (cached per set of parametric coordinates), 
+        # evaluated with one call per surface and material, and re-ordered with one gather
+        parametric_coordinates = ParametricCoordinates.from_list(parametric_coordinates)
+        surface_groups = parametric_coordinates.group_by_surface()
+        surface_material_map = self._get_surface_material_map()
+
+        evaluated_thicknesses = []
+        for ind, inds in surface_groups.items():
+            uv = parametric_coordinates.uv[inds]
+            evaluated_thickness = None
+            for material_info in surface_material_map.get(ind, []):
+                thickness = _evaluate_on_surface(material_info['thickness'], ind, uv)
+                bounding_function = material_info['bounding_function']
+                if isinstance(bounding_function, fs.FunctionSet):
+                    thickness = thickness * _evaluate_on_surface(bounding_function, ind, uv)
+                if evaluated_thickness is None:
+                    evaluated_thickness = thickness
                 else:
-                    evaluated_thickness = np.zeros(len(inds))
-            else:
-                evaluated_thickness = np.zeros(len(inds))
-                for material_info in material_stack:
-                    thickness = material_info['thickness']
-                    bounding_function = material_info['bounding_function']
-                    if isinstance(thickness, fs.FunctionSet):
-                        thickness = thickness.evaluate(parametric_coordinates[inds])
-                    if isinstance(bounding_function, fs.FunctionSet):
-                        bounding_function = bounding_function.evaluate(parametric_coordinates[inds])
-                        thickness = thickness * bounding_function
                     evaluated_thickness = evaluated_thickness + thickness
-            out = out.set(csdl.slice[[(ind,) for ind in inds]], evaluated_thickness.reshape((-1, 1)))
-
-
-
-        # out = csdl.Variable(shape=(len(parametric_coordinates),), value=0)
-        # for i, parametric_coordinate in enumerate(parametric_coordinates):
-        #     ind = parametric_coordinate[0]
-        #     material_stack = self.get_material_stack(ind)
-        #     if len(material_stack) == 0:
-        #         if isinstance(self.thickness, fs.FunctionSet):
-        #             evaluated_thickness = self.thickness.evaluate(parametric_coordinates=[parametric_coordinate])
-        #         elif self.thickness is not None:
-        #             evaluated_thickness = self.thickness
-        #         else:
-        #             evaluated_thickness = 0
-        #     else:
-        #         evaluated_thickness = 0
-        #         for material_info in material_stack:
-        #             thickness = material_info['thickness']
-        #             bounding_function = material_info['bounding_function']
-        #             if isinstance(thickness, fs.FunctionSet):
-        #                 thickness = thickness.evaluate([parametric_coordinate])
-        #             if isinstance(bounding_function, fs.FunctionSet):
-        #                 bounding_function = bounding_function.evaluate([parametric_coordinate])
-        #                 thickness = thickness * bounding_function
-        #             evaluated_thickness = evaluated_thickness + thickness
-        #     out = out.set(csdl.slice[i], evaluated_thickness)
-        return out
-
-    def evaluate_stack(self, parametric_coordinates):
+            if evaluated_thickness is None:
+                evaluated_thickness = csdl.Variable(value=np.zeros((len(inds), )))
+            evaluated_thicknesses.append(evaluated_thickness.reshape((-1, 1)))
+
+        if len(evaluated_thicknesses) == 1:
+            out = evaluated_thicknesses[0]
+        else:
+            out = csdl.vstack(evaluated_thicknesses)
+
+        return out[parametric_coordinates.inverse_surface_order().tolist()].reshape((-1, ))
+
+    def evaluate_stack(self, parametric_coordinates, as_arrays:bool=False):
         """Evaluates the material stack at the given parametric coordinates.
 
+        Each ply of a surface is evaluated for all points on that surface at once;
+        constant thicknesses and orientations are not evaluated per point.
+
         Parameters
         ----------
-        parametric_coordinates : np.ndarray
+        parametric_coordinates : Union[ParametricCoordinates, list]
             Parametric coordinates at which to evaluate the material stack.
 
+        as_arrays : bool, optional
+            If True, return stacked arrays instead of the list of dicts, by default False.
+
         Returns
         -------
         list
             List of list of dicts containing the evaluated material properties.
-            {'material', 'thickness', 'orientation'}
+            {'material', 'thickness', 'orientation'}; constant thicknesses and 
+            orientations are returned as given.
+
+        tuple
+            If as_arrays is True: (thickness, orientation, material_indices, materials), where
+            thickness and orientation are variables of shape (num_points, num_plies), 
+            material_indices is an integer array of shape (num_points, num_plies) indexing into
+            the list of materials. Surfaces with fewer plies are padded with zeros (index -1).
         """
         # TODO: addd computation of normal vectors somewhere
-        out = []
-        for parametric_coordinate in parametric_coordinates:
-            ind = parametric_coordinate[0]
-            material_stack = self.get_material_stack(ind)
-            evaluated_stack = []
-            for material_info in material_stack:
-                material = material_info['material']
+        parametric_coordinates = ParametricCoordinates.from_list(parametric_coordinates)
+        surface_groups = parametric_coordinates.group_by_surface()
+        surface_material_map = self._get_surface_material_map()
+
+        # Evaluate the (non-constant) thickness and orientation of each ply on all points of a surface
+        surface_plies = {}
+        for ind, inds in surface_groups.items():
+            uv = parametric_coordinates.uv[inds]
+            plies = []
+            for material_info in surface_material_map.get(ind, []):
                 thickness = material_info['thickness']
                 bounding_function = material_info['bounding_function']
+                if _is_evaluated(thickness, bounding_function):
+                    thickness = _evaluate_on_surface(thickness, ind, uv)
+                    if isinstance(bounding_function, fs.FunctionSet):
+                        thickness = thickness * _evaluate_on_surface(bounding_function, ind, uv)
+                
                 orientation = material_info['orientation']
-                if isinstance(thickness, fs.FunctionSet):
-                    thickness = thickness.evaluate(parametric_coordinate)
                 if isinstance(orientation, fs.FunctionSet):
-                    orientation = orientation.evaluate(parametric_coordinate)
-                if isinstance(bounding_function, fs.FunctionSet):
-                    bounding_function = bounding_function.evaluate(parametric_coordinate)
-                    thickness = thickness * bounding_function
+                    orientation = _evaluate_on_surface(orientation, ind, uv)
+                plies.append((thickness, orientation))
+            surface_plies[ind] = plies
+
+        if not as_arrays:
+            # Each point only indexes into its surface's (non-constant) ply values
+            out = [None] * len(parametric_coordinates)
+            for ind, inds in surface_groups.items():
+                surface_stack = surface_material_map.get(ind, [])
+                for k, i in enumerate(inds):
+                    evaluated_stack = []
+                    for material_info, (thickness, orientation) in zip(surface_stack, surface_plies[ind]):
+                        if _is_evaluated(material_info['thickness'], material_info['bounding_function']):
+                            thickness = thickness[k]
+                        if isinstance(material_info['orientation'], fs.FunctionSet):
+                            orientation = orientation[k]
+                        evaluated_stack.append({'material':material_info['material'],
+                                                'thickness':thickness, 
+                                                'orientation':orientation})
+                    out[i] = evaluated_stack
+            return out
+
+        num_points = len(parametric_coordinates)
+        num_plies = max([len(plies) for plies in surface_plies.values()] + [0])
+        material_indices = np.full((num_points, num_plies), -1, dtype=int)
+
+        if num_plies == 0:
+            return np.zeros((num_points, 0)), np.zeros((num_points, 0)), material_indices, self._materials
+
+        thickness_blocks = []
+        orientation_blocks = []
+        for ind, inds in surface_groups.items():
+            num_surface_points = len(inds)
+            thickness_block = csdl.Variable(value=np.zeros((num_surface_points, num_plies)))
+            orientation_block = csdl.Variable(value=np.zeros((num_surface_points, num_plies)))
+            surface_stack = surface_material_map.get(ind, [])
+            for j, (material_info, (thickness, orientation)) in enumerate(zip(surface_stack, surface_plies[ind])):
+                if not _is_evaluated(material_info['thickness'], material_info['bounding_function']):
+                    thickness = _expand_to_points(thickness, num_surface_points)
+                thickness_block = thickness_block.set(csdl.slice[:, j], thickness)
+
+                if orientation is not None:
+                    if not isinstance(material_info['orientation'], fs.FunctionSet):
+                        orientation = _expand_to_points(orientation, num_surface_points)
+                    orientation_block = orientation_block.set(csdl.slice[:, j], orientation)
+
+            if ind in self._surface_ply_table:
+                material_indices[inds, 0:len(self._surface_ply_table[ind])] = self._surface_ply_table[ind]
+            thickness_blocks.append(thickness_block)
+            orientation_blocks.append(orientation_block)
+
+        # Re-order the stacked blocks to the original point order
+        inverse_order = parametric_coordinates.inverse_surface_order().tolist()
+        if len(thickness_blocks) == 1:
+            thickness = thickness_blocks[0][inverse_order]
+            orientation = orientation_blocks[0][inverse_order]
+        else:
+            thickness = csdl.vstack(thickness_blocks)[inverse_order]
+            orientation = csdl.vstack(orientation_blocks)[inverse_order]
 
-                evaluated_stack.append({'material':material,
-                                        'thickness':thickness, 
-                                        'orientation':orientation})
-            out.append(evaluated_stack)
-        return out        
+        return thickness, orientation, material_indices, self._materials
+
+def _is_evaluated(thickness, bounding_function) -> bool:
+    """Return True if a ply thickness varies over the surface (i.e., is evaluated per point)."""
+    return isinstance(thickness, fs.FunctionSet) or isinstance(bounding_function, fs.FunctionSet)
+
+def _expand_to_points(value, num_points:int) -> csdl.Variable:
+    """Expand a constant (float, int, variable) to a vector of length num_points."""
+    if isinstance(value, csdl.Variable):
+        return csdl.expand(value.reshape((1, )), (num_points, ))
+    return csdl.Variable(value=np.ones((num_points, )) * value)
+
+def _evaluate_on_surface(quantity, surface_index:int, uv:np.ndarray) -> csdl.Variable:
+    """Evaluate a (material) quantity at several points on one surface.
+    
+    The quantity can be a function set or a constant (float, int, variable).
+    """
+    num_points = uv.shape[0]
+    if isinstance(quantity, fs.FunctionSet):
+        return quantity.functions[surface_index].evaluate(uv).reshape((num_points, ))
+    else:
+        return _expand_to_points(quantity, num_points)
 
 class MassProperties:
     def __init__(
@@ -10,4 +10,29 @@ import numpy as np
 #     recorder = csdl.Recorder(inline=True)
 #     recorder.start()
 
-    
\ No newline at end of file
+    
+
+def test_half_model_loads():
+    """Test that only the half-model loads are reconstructed for the full aircraft."""
+    recorder = csdl.Recorder(inline=True)
+    recorder.start()
+
+    cruise = cd.aircraft.conditions.CruiseCondition(
+        altitude=1e3,
+        range=60e3,
+        mach_number=0.2,
+    )
+    force = csdl.Variable(shape=(1, 3), value=np.array([[1., 2., 3.]]))
+    moment = csdl.Variable(shape=(1, 3), value=np.array([[4., 5., 6.]]))
+    half_model_force = csdl.Variable(shape=(1, 3), value=np.array([[10., 20., 30.]]))
+    half_model_moment = csdl.Variable(shape=(1, 3), value=np.array([[40., 50., 60.]]))
+
+    total_forces, total_moments = cruise.assemble_forces_and_moments(
+        aero_propulsive_forces=[force],
+        aero_propulsive_moments=[moment],
+        half_model_forces=[half_model_force],
+        half_model_moments=[half_model_moment],
+    )
+
+    np.testing.assert_almost_equal(total_forces.value, np.array([[21., 2., 63.]]))
+    np.testing.assert_almost_equal(total_moments.value, np.array([[4., 105., 6.]]))
@@ -59,6 +59,28 @@ class TestFFD:
             decimal=7,
         )
 
+    def test_lazy_ffd_block_and_surface_area(self):
+        """Test that the FFD block and surface area are memoized after first access."""
+        assert self.wing._ffd_block is self.wing._ffd_block
+        assert self.wing.ffd_block_center is self.wing.ffd_block_center
+        assert self.wing.quantities.surface_area is self.wing.quantities.surface_area
+        assert self.wing.parameters.S_wet is self.wing.quantities.surface_area
+
+    def test_lazy_wetted_area(self):
+        """Test that S_wet is available right after instantiation and that a user-supplied value is kept."""
+        wing = cd.aircraft.components.Wing(
+            S_ref=90, AR=10.2, taper_ratio=0.5, geometry=self.wing_geometry.copy(),
+        )
+        S_wet = wing.parameters.S_wet
+        assert S_wet is not None
+        assert S_wet is wing.quantities.surface_area
+        np.testing.assert_almost_equal(S_wet.value, self.wing.quantities.surface_area.value, decimal=7)
+
+        wing_with_S_wet = cd.aircraft.components.Wing(
+            S_ref=90, AR=10.2, taper_ratio=0.5, S_wet=200., geometry=self.wing_geometry.copy(),
+        )
+        assert wing_with_S_wet.parameters.S_wet == 200.
+
     def test_inner_optimization_wing(self):
         """Test that inner optimization can manipulate a wing with comprehensive parameterization."""
         desired_ffd_block_coeff_norm_after_inner_opt = 48.21388335
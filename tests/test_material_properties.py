@@ -0,0 +1,195 @@
+import CADDEE_alpha as cd
+import copy
+import csdl_alpha as csdl
+import lsdo_function_spaces as lfs
+import numpy as np
+import pytest
+
+
+def _make_function_set(coefficients_list):
+    """Make a function set of bilinear functions from a list of (2, 2, num_physical_dimensions) coefficients."""
+    space = lfs.BSplineSpace(num_parametric_dimensions=2, degree=(1, 1), coefficients_shape=(2, 2))
+    return lfs.FunctionSet(functions=[
+        lfs.Function(space=space, coefficients=csdl.Variable(value=coefficients)) for coefficients in coefficients_list
+    ])
+
+
+def _evaluate_thickness_per_point(material_properties, parametric_coordinates):
+    """Reference: evaluate the material stack thickness one point at a time."""
+    thicknesses = []
+    for parametric_coordinate in parametric_coordinates:
+        ind = parametric_coordinate[0]
+        evaluated_thickness = 0.
+        for material_info in material_properties.get_material_stack(ind):
+            thickness = material_info['thickness']
+            bounding_function = material_info['bounding_function']
+            if isinstance(thickness, lfs.FunctionSet):
+                thickness = thickness.evaluate([parametric_coordinate]).value
+            elif isinstance(thickness, csdl.Variable):
+                thickness = thickness.value
+            if isinstance(bounding_function, lfs.FunctionSet):
+                thickness = thickness * bounding_function.evaluate([parametric_coordinate]).value
+            evaluated_thickness = evaluated_thickness + thickness
+        thicknesses.append(np.asarray(evaluated_thickness).flatten()[0])
+    return np.array(thicknesses)
+
+
+def _evaluate_stack_per_point(material_properties, parametric_coordinates):
+    """Reference: evaluate the material stack one point and one ply at a time."""
+    def get_value(quantity, parametric_coordinate):
+        if isinstance(quantity, lfs.FunctionSet):
+            return quantity.evaluate([parametric_coordinate]).value.flatten()[0]
+        elif isinstance(quantity, csdl.Variable):
+            return quantity.value.flatten()[0]
+        return quantity
+
+    out = []
+    for parametric_coordinate in parametric_coordinates:
+        evaluated_stack = []
+        for material_info in material_properties.get_material_stack(parametric_coordinate[0]):
+            thickness = get_value(material_info['thickness'], parametric_coordinate)
+            if material_info['bounding_function'] is not None:
+                thickness = thickness * get_value(material_info['bounding_function'], parametric_coordinate)
+            evaluated_stack.append({'material' : material_info['material'],
+                                    'thickness' : thickness,
+                                    'orientation' : get_value(material_info['orientation'], parametric_coordinate)})
+        out.append(evaluated_stack)
+    return out
+
+
+def _get_value(value):
+    if isinstance(value, csdl.Variable):
+        return value.value.flatten()[0]
+    return value
+
+
+@pytest.fixture(scope="class")
+def setup_test_class():
+    recorder = csdl.Recorder(inline=True)
+    recorder.start()
+
+    # Two flat unit patches next to each other
+    x, y = np.meshgrid(np.array([0., 1.]), np.array([0., 1.]), indexing="ij")
+    geometry = _make_function_set([
+        np.stack((x, y, np.zeros_like(x)), axis=-1),
+        np.stack((x + 1., y, np.zeros_like(x)), axis=-1),
+    ])
+
+    # Bilinear (scalar) thickness, bounding and orientation functions on both surfaces
+    skin_thickness = _make_function_set([
+        np.array([[1., 2.], [3., 4.]]).reshape((2, 2, 1)) * 1e-3,
+        np.array([[4., 3.], [2., 1.]]).reshape((2, 2, 1)) * 1e-3,
+    ])
+    bounding_function = _make_function_set([
+        np.array([[0., 0.], [1., 1.]]).reshape((2, 2, 1)),
+        np.array([[1., 0.], [1., 0.]]).reshape((2, 2, 1)),
+    ])
+    orientation = _make_function_set([
+        np.array([[0., 0.5], [0.5, 1.]]).reshape((2, 2, 1)),
+        np.array([[1., 1.], [0., 0.]]).reshape((2, 2, 1)),
+    ])
+
+    aluminum = cd.materials.IsotropicMaterial(name='aluminum', E=69E9, G=26E9, density=2700, nu=0.33)
+    steel = cd.materials.IsotropicMaterial(name='steel', E=200E9, G=79E9, density=7850, nu=0.3)
+
+    component = cd.Component(geometry=geometry)
+    material_properties = component.quantities.material_properties
+    material_properties.add_material(aluminum, skin_thickness)
+    material_properties.add_material(steel, csdl.Variable(shape=(1, ), value=2e-3),
+                                     bounding_function=bounding_function, orientation=orientation)
+    material_properties.add_material(aluminum, 5e-4, surface_indices=[1], orientation=0.25)
+
+    parametric_coordinates = [
+        (1, np.array([[0.2, 0.3]])),
+        (0, np.array([[0.5, 0.5]])),
+        (1, np.array([[0.9, 0.1]])),
+        (0, np.array([[0.1, 0.8]])),
+        (0, np.array([[1., 0.]])),
+    ]
+
+    return {
+        "material_properties" : material_properties,
+        "parametric_coordinates" : parametric_coordinates,
+        "materials" : [aluminum, steel],
+    }
+
+@pytest.mark.usefixtures("setup_test_class")
+class TestMaterialProperties:
+    @pytest.fixture(autouse=True)
+    def _setup(self, setup_test_class):
+        self.material_properties = setup_test_class["material_properties"]
+        self.parametric_coordinates = setup_test_class["parametric_coordinates"]
+        self.materials = setup_test_class["materials"]
+
+    def test_evaluate_thickness(self):
+        """Test that the batched thickness evaluation matches the per-point evaluation."""
+        thickness = self.material_properties.evaluate_thickness(self.parametric_coordinates)
+        expected_thickness = _evaluate_thickness_per_point(self.material_properties, self.parametric_coordinates)
+
+        np.testing.assert_almost_equal(thickness.value, expected_thickness, decimal=12)
+
+    def test_evaluate_stack(self):
+        """Test that the batched material stack matches the per-point evaluation."""
+        expected_stack = _evaluate_stack_per_point(self.material_properties, self.parametric_coordinates)
+        evaluated_stack = self.material_properties.evaluate_stack(self.parametric_coordinates)
+
+        assert len(evaluated_stack) == len(expected_stack)
+        for point_stack, expected_point_stack in zip(evaluated_stack, expected_stack):
+            assert len(point_stack) == len(expected_point_stack)
+            for ply, expected_ply in zip(point_stack, expected_point_stack):
+                assert ply['material'] is expected_ply['material']
+                np.testing.assert_almost_equal(_get_value(ply['thickness']), expected_ply['thickness'], decimal=12)
+                if expected_ply['orientation'] is None:
+                    assert ply['orientation'] is None
+                else:
+                    np.testing.assert_almost_equal(_get_value(ply['orientation']), expected_ply['orientation'], decimal=12)
+
+        # Constant orientations are returned as given
+        assert evaluated_stack[0][2]['orientation'] == 0.25
+
+        thickness, orientation, material_indices, materials = self.material_properties.evaluate_stack(
+            self.parametric_coordinates, as_arrays=True
+        )
+        assert thickness.shape == (len(self.parametric_coordinates), 3)
+        for i, expected_point_stack in enumerate(expected_stack):
+            for j in range(3):
+                if j < len(expected_point_stack):
+                    expected_ply = expected_point_stack[j]
+                    assert materials[material_indices[i, j]] is expected_ply['material']
+                    np.testing.assert_almost_equal(thickness.value[i, j], expected_ply['thickness'], decimal=12)
+                    expected_orientation = 0. if expected_ply['orientation'] is None else expected_ply['orientation']
+                    np.testing.assert_almost_equal(orientation.value[i, j], expected_orientation, decimal=12)
+                else:
+                    assert material_indices[i, j] == -1
+                    assert thickness.value[i, j] == 0.
+
+    def test_surface_material_map_invalidation(self):
+        """Test that adding and removing materials invalidates the cached surface material map."""
+        material_properties = self.material_properties
+        surface_material_map = material_properties._get_surface_material_map()
+        assert material_properties._get_surface_material_map() is surface_material_map
+        assert len(material_properties.get_material_stack(0)) == 2
+
+        material_properties.add_material(self.materials[1], 1e-3, surface_indices=[0])
+        assert len(material_properties.get_material_stack(0)) == 3
+        thickness = material_properties.evaluate_thickness(self.parametric_coordinates)
+        expected_thickness = _evaluate_thickness_per_point(material_properties, self.parametric_coordinates)
+        np.testing.assert_almost_equal(thickness.value, expected_thickness, decimal=12)
+
+        material_properties.remove_material(-1)
+        assert len(material_properties.get_material_stack(0)) == 2
+        thickness = material_properties.evaluate_thickness(self.parametric_coordinates)
+        expected_thickness = _evaluate_thickness_per_point(material_properties, self.parametric_coordinates)
+        np.testing.assert_almost_equal(thickness.value, expected_thickness, decimal=12)
+
+        # Shallow copies (see 'copy_comps') share the material stack, so changes through one copy apply to the other
+        material_properties_copy = copy.copy(material_properties)
+        assert len(material_properties_copy.get_material_stack(0)) == 2
+        material_properties.add_material(self.materials[1], 1e-3, surface_indices=[0])
+        assert len(material_properties_copy.get_material_stack(0)) == 3
+        thickness = material_properties_copy.evaluate_thickness(self.parametric_coordinates)
+        expected_thickness = _evaluate_thickness_per_point(material_properties, self.parametric_coordinates)
+        np.testing.assert_almost_equal(thickness.value, expected_thickness, decimal=12)
+
+        material_properties_copy.remove_material(-1)
+        assert len(material_properties.get_material_stack(0)) == 2
@@ -0,0 +1,138 @@
+from CADDEE_alpha.utils.mesh_utils import merge_duplicate_nodes, build_connectivity, memmap_array, partition_mesh_rcb, \
+    grid_connectivity, connectivity_to_cell_blocks, XDMFTimeSeriesExporter
+import meshio
+import numpy as np
+import pytest
+
+
+class Cells:
+    def __init__(self, type, data):
+        self.type = type
+        self.data = np.array(data)
+
+
+class ShellMesh:
+    def __init__(self, nodal_coordinates, connectivity):
+        self.nodal_coordinates = nodal_coordinates
+        self.connectivity = connectivity
+
+
+@pytest.fixture(scope="class")
+def setup_test_class():
+    nodes = np.array([
+        [0., 0., 0.],
+        [1., 0., 0.],
+        [1e-9, 0., 0.],
+        [1., 1., 0.],
+        [0., 1., 0.],
+        [1., 1e-8, 0.],
+    ])
+    cells = [
+        Cells("quad", [[0, 1, 3, 4]]),
+        Cells("line", [[0, 1]]),
+        Cells("triangle", [[2, 5, 3]]),
+    ]
+
+    return {"nodes" : nodes, "cells" : cells}
+
+@pytest.mark.usefixtures("setup_test_class")
+class TestMeshUtils:
+    @pytest.fixture(autouse=True)
+    def _setup(self, setup_test_class):
+        self.nodes = setup_test_class["nodes"]
+        self.cells = setup_test_class["cells"]
+
+    def test_merge_duplicate_nodes(self):
+        """Test that near-duplicate nodes are merged within the tolerance."""
+        unique_nodes, index = merge_duplicate_nodes(self.nodes, tolerance=1e-6)
+        assert unique_nodes.shape == (4, 3)
+        np.testing.assert_almost_equal(unique_nodes[index], self.nodes, decimal=6)
+
+        unique_nodes, index = merge_duplicate_nodes(self.nodes, tolerance=0.)
+        assert unique_nodes.shape == (6, 3)
+
+    def test_build_connectivity(self):
+        """Test the connectivity remap of mixed quad/triangle cell blocks."""
+        unique_nodes, index = merge_duplicate_nodes(self.nodes, tolerance=1e-6)
+        connectivity = build_connectivity(self.cells, index)
+
+        np.testing.assert_almost_equal(connectivity, np.array([[0, 2, 3, 1], [0, 2, 3, -1]]))
+        assert np.issubdtype(connectivity.dtype, np.integer)
+
+        quad_connectivity = build_connectivity(self.cells, index, include_triangles=False)
+        np.testing.assert_almost_equal(quad_connectivity, np.array([[0, 2, 3, 1]]))
+
+    def test_memmap_array(self, tmp_path):
+        """Test that arrays are stored once and returned as read-only memory maps."""
+        unique_nodes, index = merge_duplicate_nodes(self.nodes, tolerance=1e-6)
+        connectivity = build_connectivity(self.cells, index)
+        connectivity_map = memmap_array(connectivity, tmp_path, "connectivity")
+        connectivity_map_2 = memmap_array(connectivity.copy(), tmp_path, "connectivity")
+
+        assert not connectivity_map.flags.writeable
+        assert len(list(tmp_path.iterdir())) == 1
+        np.testing.assert_almost_equal(connectivity_map, connectivity)
+        np.testing.assert_almost_equal(connectivity_map_2, connectivity)
+
+    def test_partition_mesh_rcb(self):
+        """Test recursive coordinate bisection of a structured quad mesh."""
+        x, y = np.meshgrid(np.arange(5.), np.arange(5.), indexing='ij')
+        nodes = np.stack((x.flatten(), y.flatten(), np.zeros((25, ))), axis=1)
+        index = np.arange(25).reshape((5, 5))
+        connectivity = np.stack((index[:-1, :-1], index[1:, :-1], index[1:, 1:], index[:-1, 1:]), axis=2).reshape((-1, 4))
+
+        element_partitions, node_partitions, interface_nodes = partition_mesh_rcb(nodes, connectivity, 4)
+        np.testing.assert_almost_equal(np.sort(np.concatenate(element_partitions)), np.arange(16))
+        assert [len(elements) for elements in element_partitions] == [4, 4, 4, 4]
+        assert [len(partition_nodes) for partition_nodes in node_partitions] == [9, 9, 9, 9]
+        np.testing.assert_almost_equal(interface_nodes[0], np.array([2, 7, 10, 11, 12]))
+
+        weights = np.ones((16, ))
+        weights[0:8] = 3.
+        element_partitions, _, _ = partition_mesh_rcb(nodes, connectivity, 2, weights=weights)
+        assert [weights[elements].sum() for elements in element_partitions] == [15., 17.]
+
+    def test_connectivity_to_cell_blocks(self):
+        """Test the conversion of grids and mixed connectivities into (meshio) cell blocks."""
+        np.testing.assert_almost_equal(grid_connectivity(2, 3, offset=1), np.array([[1, 4, 5, 2], [2, 5, 6, 3]]))
+
+        unique_nodes, index = merge_duplicate_nodes(self.nodes, tolerance=1e-6)
+        connectivity = np.vstack((build_connectivity(self.cells, index), np.array([[1, 2, 3, 0]])))
+        blocks, order = connectivity_to_cell_blocks(connectivity)
+
+        assert [cell_type for cell_type, _ in blocks] == ['quad', 'triangle']
+        np.testing.assert_almost_equal(blocks[1][1], np.array([[0, 2, 3]]))
+        np.testing.assert_almost_equal(order, np.array([0, 2, 1]))
+
+    def test_xdmf_time_series(self, tmp_path):
+        """Test writing two time steps of a vectorized shell mesh and reading them back."""
+        unique_nodes, index = merge_duplicate_nodes(self.nodes, tolerance=1e-6)
+        connectivity = build_connectivity(self.cells, index)
+        num_points = unique_nodes.shape[0]
+
+        # leading (num_nodes=2) axis of the nodal coordinates
+        shell_mesh = ShellMesh(np.stack((unique_nodes, unique_nodes + 2.)), connectivity)
+        thickness = np.array([[1., 2.], [3., 4.]])
+
+        file_name = str(tmp_path / "shell.xdmf")
+        with XDMFTimeSeriesExporter(file_name) as exporter:
+            exporter.add_discretization("shell", shell_mesh, cell_fields={"thickness" : thickness})
+            exporter.write()
+            shell_mesh.nodal_coordinates = shell_mesh.nodal_coordinates + 1.
+            exporter.write(time=1.5)
+
+        with meshio.xdmf.TimeSeriesReader(file_name) as reader:
+            points, cells = reader.read_points_cells()
+            assert points.shape == (2 * num_points, 3)
+            assert [cell_block.type for cell_block in cells] == ['quad', 'triangle', 'quad', 'triangle']
+            np.testing.assert_almost_equal(cells[2].data, connectivity[0:1] + num_points)
+            np.testing.assert_almost_equal(cells[3].data, connectivity[1:2, 0:3] + num_points)
+
+            assert reader.num_steps == 2
+            for k, (expected_time, expected_displacement) in enumerate([(0., 0.), (1.5, 1.)]):
+                time, point_data, cell_data = reader.read_data(k)
+                np.testing.assert_almost_equal(time, expected_time)
+                np.testing.assert_almost_equal(point_data["geometry_displacement"], expected_displacement)
+                np.testing.assert_almost_equal(point_data["nodal_coordinates"], points + expected_displacement)
+                np.testing.assert_almost_equal(np.concatenate(cell_data["thickness"]).flatten(), thickness.flatten())
+                np.testing.assert_almost_equal(np.concatenate(cell_data["condition"]).flatten(), np.zeros((4, )))
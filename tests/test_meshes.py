@@ -1,9 +1,46 @@
 import CADDEE_alpha as cd
+from CADDEE_alpha.core.mesh.mesh import VectorizedDiscretization
+from CADDEE_alpha.core.mesh.meshers import make_mesh_symmetric, _get_group_points_parametric
+from CADDEE_alpha.utils.parametric_coordinates import ParametricCoordinates
 import csdl_alpha as csdl
 import numpy as np
 import pytest
 
 
+def _make_mesh_symmetric_loop(quantity, num_spanwise, spanwise_index=0):
+    """Reference: make a quantity symmetric one span-wise index (pair) at a time."""
+    symmetric_quantity = np.zeros(quantity.shape)
+    center_index = int(num_spanwise/2)
+    for i in range(int(num_spanwise/2 + 1)):
+        index = center_index + i
+        symmetric_index = center_index - i
+        if spanwise_index is None:
+            spanwise_mean = (quantity[index] + quantity[symmetric_index]) / 2
+            symmetric_quantity[index] = spanwise_mean
+            symmetric_quantity[symmetric_index] = spanwise_mean
+            continue
+
+        if spanwise_index == 0:
+            entry, mirror_entry = quantity[index], quantity[symmetric_index]
+            spanwise_mean_y = (np.abs(entry[1]) + np.abs(mirror_entry[1])) / 2
+        else:
+            entry, mirror_entry = quantity[:, index], quantity[:, symmetric_index]
+            spanwise_mean_y = (np.abs(entry[:, 1] + 1e-5) + np.abs(mirror_entry[:, 1] + 1e-5)) / 2
+        spanwise_mean = (entry + mirror_entry) / 2
+        spanwise_mean[..., 1] = spanwise_mean_y
+        mirror_spanwise_mean = spanwise_mean.copy()
+        if index != symmetric_index:
+            mirror_spanwise_mean[..., 1] = -spanwise_mean_y
+
+        if spanwise_index == 0:
+            symmetric_quantity[index] = spanwise_mean
+            symmetric_quantity[symmetric_index] = mirror_spanwise_mean
+        else:
+            symmetric_quantity[:, index] = spanwise_mean
+            symmetric_quantity[:, symmetric_index] = mirror_spanwise_mean
+    return symmetric_quantity
+
+
 @pytest.fixture(scope="class")
 def setup_test_class():
     recorder = csdl.Recorder(inline=True)
@@ -63,6 +100,149 @@ class TestMeshes:
             decimal=7
         )
 
+    def test_vlm_surface_family(self):
+        """Test that coarse family members match directly projected meshes."""
+        vlm_meshes = cd.mesh.make_vlm_surface_family(
+            self.wing,
+            resolutions=[(16, 4), (8, 2)],
+            ignore_camber=True,
+        )
+        coarse_nodes = vlm_meshes[(8, 2)].nodal_coordinates.value
+
+        self.wing._sectional_projections.clear()
+        chord_surface = cd.mesh.make_vlm_surface(
+            self.wing,
+            num_spanwise=8,
+            num_chordwise=2,
+            ignore_camber=True,
+        )
+
+        np.testing.assert_almost_equal(
+            coarse_nodes,
+            chord_surface.nodal_coordinates.value,
+            decimal=5
+        )
+
+    def test_airfoil_sections(self):
+        """Test the extracted chord, twist and thickness-to-chord ratio, including for a vectorized surface."""
+        num_spanwise = 8
+        camber_surface = cd.mesh.make_vlm_surface(
+            self.wing,
+            num_spanwise=num_spanwise,
+            num_chordwise=2,
+        )
+        sections = camber_surface.extract_airfoil_sections(num_points=40)
+
+        assert sections.upper_coordinates.shape == (1, num_spanwise, 40, 2)
+        assert sections.thickness_to_chord.shape == (1, num_spanwise, 40)
+        assert sections.chord.shape == (1, num_spanwise)
+        assert sections.twist.shape == (1, num_spanwise)
+        assert sections.max_thickness_to_chord.shape == (1, num_spanwise)
+
+        # Reference chord and twist from the mid-panel leading and trailing edges of the camber mesh
+        nodes = camber_surface.nodal_coordinates.value
+        LE_points = (nodes[0, :-1] + nodes[0, 1:]) / 2
+        TE_points = (nodes[-1, :-1] + nodes[-1, 1:]) / 2
+        delta_x = TE_points[:, 0] - LE_points[:, 0]
+        delta_z = TE_points[:, 2] - LE_points[:, 2]
+        chord = (delta_x**2 + delta_z**2)**0.5
+        twist = np.arcsin(-delta_z / chord)
+
+        np.testing.assert_almost_equal(sections.chord.value[0] / chord, np.ones((num_spanwise, )), decimal=2)
+        np.testing.assert_almost_equal(sections.twist.value[0], twist, decimal=2)
+
+        thickness_to_chord = sections.thickness_to_chord.value
+        assert np.all(thickness_to_chord > -1e-8)
+        # smooth (KS) maximum: bounded by the maximum of the distribution plus log(num_points) / rho
+        max_thickness_to_chord = sections.max_thickness_to_chord.value
+        assert np.all(max_thickness_to_chord >= thickness_to_chord.max(axis=-1) - 1e-12)
+        assert np.all(max_thickness_to_chord <= thickness_to_chord.max(axis=-1) + np.log(40) / 1e4)
+        assert np.all((sections.max_thickness_to_chord.value > 0.) & (sections.max_thickness_to_chord.value < 0.3))
+
+        # Vectorized surfaces stack the sections of all conditions
+        wing_geometry = self.wing.geometry
+        vectorized_surface = VectorizedDiscretization(camber_surface, [wing_geometry, wing_geometry], 2)
+        vectorized_sections = vectorized_surface.extract_airfoil_sections(num_points=40)
+
+        assert vectorized_sections.upper_coordinates.shape == (2, num_spanwise, 40, 2)
+        assert vectorized_sections.max_thickness_to_chord.shape == (2, num_spanwise)
+        for i in range(2):
+            np.testing.assert_almost_equal(vectorized_sections.chord.value[i], sections.chord.value[0])
+            np.testing.assert_almost_equal(vectorized_sections.twist.value[i], sections.twist.value[0])
+            np.testing.assert_almost_equal(vectorized_sections.max_thickness_to_chord.value[i], sections.max_thickness_to_chord.value[0])
+
+    def test_make_mesh_symmetric(self):
+        """Test the gathered symmetrization against the index-by-index reference."""
+        rng = np.random.default_rng(0)
+        for num_spanwise in [4, 5]:
+            num_entries = int(num_spanwise/2) + int(num_spanwise/2 + 1)
+            shapes = {None : (num_entries, 2), 0 : (num_entries, 3), 1 : (3, num_entries, 3)}
+            for spanwise_index, shape in shapes.items():
+                quantity = rng.standard_normal(shape)
+                symmetric_quantity = make_mesh_symmetric(csdl.Variable(value=quantity), num_spanwise, spanwise_index=spanwise_index)
+
+                np.testing.assert_almost_equal(
+                    symmetric_quantity.value,
+                    _make_mesh_symmetric_loop(quantity, num_spanwise, spanwise_index=spanwise_index),
+                    decimal=12,
+                )
+
+    def test_half_model_surface(self):
+        """Test that half models keep the y >= 0 half of the mesh and of the airfoil stations."""
+        num_spanwise = 8
+        chord_wise_points_for_airfoil = np.linspace(0., 1., 10)
+        meshes = {}
+        for half_model in [False, True]:
+            meshes[half_model] = cd.mesh.make_vlm_surface(
+                self.wing,
+                num_spanwise=num_spanwise,
+                num_chordwise=2,
+                chord_wise_points_for_airfoil=chord_wise_points_for_airfoil,
+                half_model=half_model,
+            )
+        full_mesh, half_mesh = meshes[False], meshes[True]
+
+        assert half_mesh.symmetry_plane == "xz"
+        assert half_mesh.nodal_coordinates.shape == (3, num_spanwise // 2 + 1, 3)
+        assert np.all(half_mesh.nodal_coordinates.value[:, :, 1] >= 0.)
+        np.testing.assert_almost_equal(half_mesh.nodal_coordinates.value, full_mesh.nodal_coordinates.value[:, num_spanwise // 2:])
+
+        full_airfoil_nodes = full_mesh.airfoil_nodes_upper.value.reshape((10, num_spanwise, 3))
+        assert half_mesh.airfoil_nodes_upper.shape == (10, num_spanwise // 2, 3)
+        np.testing.assert_almost_equal(half_mesh.airfoil_nodes_upper.value, full_airfoil_nodes[:, num_spanwise // 2:])
+
+        full_sections = full_mesh.extract_airfoil_sections(num_points=20)
+        half_sections = half_mesh.extract_airfoil_sections(num_points=20)
+        assert half_sections.chord.shape == (1, num_spanwise // 2)
+        np.testing.assert_almost_equal(half_sections.chord.value, full_sections.chord.value[:, num_spanwise // 2:])
+        np.testing.assert_almost_equal(half_sections.twist.value, full_sections.twist.value[:, num_spanwise // 2:])
+
+        with pytest.raises(ValueError):
+            cd.mesh.make_vlm_surface(self.wing, num_spanwise=7, num_chordwise=2, half_model=True)
+
+    def test_packed_mesh_buffer(self):
+        """Test that packed surfaces are unpacked by offset."""
+        surfaces = {}
+        for num_spanwise, num_chordwise in [(8, 2), (4, 3)]:
+            chord_surface = cd.mesh.make_vlm_surface(
+                self.wing,
+                num_spanwise=num_spanwise,
+                num_chordwise=num_chordwise,
+                ignore_camber=True,
+            )
+            chord_surface.nodal_coordinates = chord_surface.nodal_coordinates.reshape((1, ) + chord_surface.nodal_coordinates.shape)
+            surfaces[f"{num_spanwise}x{num_chordwise}"] = chord_surface
+
+        packed_buffer = cd.mesh.pack_discretizations(surfaces)
+        np.testing.assert_almost_equal(packed_buffer.offsets, np.array([0, 27, 47]))
+        np.testing.assert_almost_equal(packed_buffer.panel_offsets, np.array([0, 16, 28]))
+        assert packed_buffer.nodal_coordinates.shape == (1, 47, 3)
+        assert packed_buffer.nodal_velocities is None
+
+        unpacked = packed_buffer.unpack(packed_buffer.nodal_coordinates)
+        for name, surface in surfaces.items():
+            np.testing.assert_almost_equal(unpacked[name].value, surface.nodal_coordinates.value)
+
     def test_spar_rib_helper(self):
         """Test the helper function for making ribs and spars"""
         desired_coeff_norm_sum_before = 1357.73155717
@@ -95,3 +275,29 @@ class TestMeshes:
             decimal=7
         )
 
+
+def test_group_points_parametric():
+    """Test that the concatenated points of a group of beams are cached and re-used."""
+    class Beam:
+        _group_points_parametric = None
+
+        def __init__(self, num_points, surface_index):
+            self._points = ParametricCoordinates(np.full((num_points, ), surface_index), np.random.rand(num_points, 2))
+
+        def _get_geometry_points_parametric(self):
+            return self._points
+
+        def _get_thickness_points_parametric(self):
+            return self._points[::-1]
+
+    beams = [Beam(3, 0), Beam(2, 1)]
+    assert _get_group_points_parametric(beams[0:1], "geometry") is beams[0]._points
+
+    geometry_points = _get_group_points_parametric(beams, "geometry")
+    assert _get_group_points_parametric(beams, "geometry") is geometry_points
+    np.testing.assert_almost_equal(geometry_points.uv, np.vstack((beams[0]._points.uv, beams[1]._points.uv)))
+    np.testing.assert_almost_equal(geometry_points.surface_indices, np.array([0, 0, 0, 1, 1]))
+
+    thickness_points = _get_group_points_parametric(beams, "thickness")
+    assert thickness_points is not geometry_points
+    np.testing.assert_almost_equal(thickness_points.uv, np.vstack((beams[0]._points.uv[::-1], beams[1]._points.uv[::-1])))
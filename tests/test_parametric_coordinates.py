@@ -0,0 +1,79 @@
+from CADDEE_alpha.utils.parametric_coordinates import ParametricCoordinates
+import numpy as np
+import pytest
+
+
+@pytest.fixture(scope="class")
+def setup_test_class():
+    tuple_list = [
+        (3, np.array([[0.1, 0.2]])),
+        (1, np.array([[0.3, 0.4]])),
+        (3, np.array([0.5, 0.6])),
+        (2, np.array([[0.7, 0.8]])),
+        (1, np.array([[0.9, 1.0]])),
+    ]
+    parametric_coordinates = ParametricCoordinates.from_list(tuple_list)
+
+    return {"tuple_list" : tuple_list, "parametric_coordinates" : parametric_coordinates}
+
+@pytest.mark.usefixtures("setup_test_class")
+class TestParametricCoordinates:
+    @pytest.fixture(autouse=True)
+    def _setup(self, setup_test_class):
+        self.tuple_list = setup_test_class["tuple_list"]
+        self.parametric_coordinates = setup_test_class["parametric_coordinates"]
+
+    def test_from_list(self):
+        """Test conversion from (and back to) the list of tuples."""
+        assert self.parametric_coordinates.surface_indices.dtype == np.int32
+        assert self.parametric_coordinates.uv.shape == (5, 2)
+
+        for (ind, uv), (ind_expected, uv_expected) in zip(self.parametric_coordinates, self.tuple_list):
+            assert ind == ind_expected
+            np.testing.assert_almost_equal(uv, uv_expected.reshape((1, 2)))
+
+        assert len(self.parametric_coordinates.to_list()) == 5
+
+    def test_structured_array(self):
+        """Test conversion from 'O,O' arrays (e.g., ribs and spars)."""
+        structured_array = np.empty((5, ), dtype='O,O')
+        for i, parametric_coordinate in enumerate(self.tuple_list):
+            structured_array[i] = parametric_coordinate
+
+        parametric_coordinates = ParametricCoordinates.from_list(structured_array)
+        np.testing.assert_almost_equal(parametric_coordinates.uv, self.parametric_coordinates.uv)
+        np.testing.assert_almost_equal(parametric_coordinates.surface_indices, self.parametric_coordinates.surface_indices)
+
+    def test_slicing_and_concatenation(self):
+        """Test that slicing returns views and concatenation preserves order."""
+        sliced = self.parametric_coordinates[1:3]
+        assert np.shares_memory(sliced.uv, self.parametric_coordinates.uv)
+        assert sliced[0][0] == 1
+        np.testing.assert_almost_equal(sliced[0][1], np.array([[0.3, 0.4]]))
+
+        combined = sliced + self.tuple_list[0:1]
+        np.testing.assert_almost_equal(combined.surface_indices, np.array([1, 3, 3]))
+        np.testing.assert_almost_equal(combined.uv[-1], np.array([0.1, 0.2]))
+
+    def test_group_by_surface(self):
+        """Test grouping of point indices by surface index."""
+        groups = self.parametric_coordinates.group_by_surface()
+        assert list(groups.keys()) == [1, 2, 3]
+        np.testing.assert_almost_equal(groups[1], np.array([1, 4]))
+        np.testing.assert_almost_equal(groups[2], np.array([3]))
+        np.testing.assert_almost_equal(groups[3], np.array([0, 2]))
+
+    def test_save_and_load(self, tmp_path):
+        """Test (de)serialization."""
+        file_name = tmp_path / "parametric_coordinates.npz"
+        self.parametric_coordinates.save(file_name)
+        loaded = ParametricCoordinates.load(file_name)
+        np.testing.assert_almost_equal(loaded.uv, self.parametric_coordinates.uv)
+        np.testing.assert_almost_equal(loaded.surface_indices, self.parametric_coordinates.surface_indices)
+
+    def test_inverse_surface_order(self):
+        """Test that values ordered by surface are mapped back to the original order."""
+        groups = self.parametric_coordinates.group_by_surface()
+        values_by_surface = np.concatenate([self.parametric_coordinates.uv[inds, 0] for inds in groups.values()])
+        inverse_order = self.parametric_coordinates.inverse_surface_order()
+        np.testing.assert_almost_equal(values_by_surface[inverse_order], self.parametric_coordinates.uv[:, 0])
@@ -0,0 +1,153 @@
+import CADDEE_alpha as cd
+from CADDEE_alpha.core.mesh.mesh import VectorizedDiscretization
+import csdl_alpha as csdl
+import lsdo_function_spaces as lfs
+import numpy as np
+import pytest
+
+
+def _make_rotor_geometry(center, radius, thickness=0.05):
+    """Make a (thin) square rotor disk geometry from two flat bilinear patches."""
+    space = lfs.BSplineSpace(num_parametric_dimensions=2, degree=(1, 1), coefficients_shape=(2, 2))
+    x, y = np.meshgrid(np.array([-radius, radius]), np.array([-radius, radius]), indexing="ij")
+    functions = []
+    for z in [0., thickness]:
+        coefficients = np.stack((x, y, np.full(x.shape, z)), axis=-1) + np.reshape(center, (1, 1, 3))
+        functions.append(lfs.Function(space=space, coefficients=csdl.Variable(value=coefficients)))
+    return lfs.FunctionSet(functions=functions)
+
+
+def _make_blade_coefficients(root_radius, tip_radius, chord, root_twist, tip_twist, z_offset):
+    """Make the (2, 2, 3) coefficients of a flat, rectangular blade along the x-axis 
+    with a linear chord vector between the (nose-up) root and tip twist angles."""
+    coefficients = np.zeros((2, 2, 3))
+    for i, (radius, twist) in enumerate(((root_radius, root_twist), (tip_radius, tip_twist))):
+        half_chord_vector = chord / 2 * np.array([0., np.cos(twist), np.sin(twist)])
+        coefficients[i, 0] = np.array([radius, 0., z_offset]) + half_chord_vector
+        coefficients[i, 1] = np.array([radius, 0., z_offset]) - half_chord_vector
+    return coefficients
+
+
+@pytest.fixture(scope="class")
+def setup_test_class():
+    recorder = csdl.Recorder(inline=True)
+    recorder.start()
+
+    rotor_centers = [np.array([0., 0., 0.]), np.array([3., 1., 0.5])]
+    rotor_radii = [1., 0.8]
+    rotors = [
+        cd.aircraft.components.Rotor(radius=radius, geometry=_make_rotor_geometry(center, radius))
+        for center, radius in zip(rotor_centers, rotor_radii)
+    ]
+
+    # Rotor of radius 1 with a rectangular blade (chord 0.2, linear chord vector from 20 to 10 deg twist)
+    blade_parameters = {"root_radius" : 0.1, "tip_radius" : 1., "chord" : 0.2, 
+                        "root_twist" : np.deg2rad(20.), "tip_twist" : np.deg2rad(10.), "z_offset" : 0.05}
+    blade_space = lfs.BSplineSpace(num_parametric_dimensions=2, degree=(1, 1), coefficients_shape=(2, 2))
+    blade_function = lfs.Function(
+        space=blade_space, coefficients=csdl.Variable(value=_make_blade_coefficients(**blade_parameters))
+    )
+    disk_geometry = _make_rotor_geometry(np.zeros((3, )), 1., thickness=0.1)
+    bladed_rotor_geometry = lfs.FunctionSet(functions={0 : disk_geometry.functions[0], 1 : disk_geometry.functions[1], 2 : blade_function})
+    bladed_rotor = cd.aircraft.components.Rotor(radius=1., geometry=bladed_rotor_geometry)
+    blade_geometry = lfs.FunctionSet(functions={2 : blade_function})
+
+    return {
+        "rotors" : rotors, 
+        "rotor_radii" : rotor_radii,
+        "bladed_rotor" : bladed_rotor,
+        "blade_geometry" : blade_geometry,
+        "blade_parameters" : blade_parameters,
+    }
+
+@pytest.mark.usefixtures("setup_test_class")
+class TestRotorMeshes:
+    @pytest.fixture(autouse=True)
+    def _setup(self, setup_test_class):
+        self.rotors = setup_test_class["rotors"]
+        self.rotor_radii = setup_test_class["rotor_radii"]
+        self.bladed_rotor = setup_test_class["bladed_rotor"]
+        self.blade_geometry = setup_test_class["blade_geometry"]
+        self.blade_parameters = setup_test_class["blade_parameters"]
+
+    def _get_expected_profiles(self, radial_stations, chord_scale=1.):
+        """Chord and twist profiles of the blade from its (linearly varying) chord vector."""
+        parameters = self.blade_parameters
+        s = (radial_stations - parameters["root_radius"]) / (parameters["tip_radius"] - parameters["root_radius"])
+        twists = np.array([parameters["root_twist"], parameters["tip_twist"]])
+        chord_vectors = chord_scale * parameters["chord"] * np.stack((np.cos(twists), np.sin(twists)), axis=1)
+        local_chord_vectors = np.outer(1 - s, chord_vectors[0]) + np.outer(s, chord_vectors[1])
+
+        chord = np.linalg.norm(local_chord_vectors, axis=1)
+        twist = np.arctan2(local_chord_vectors[:, 1], local_chord_vectors[:, 0])
+        return chord, twist
+
+    def test_rotor_group(self):
+        """Test that the stacked rotor group matches the individual rotor discretizations."""
+        rotor_meshes = [
+            cd.mesh.make_rotor_mesh(rotor, num_radial=5, num_azimuthal=4, do_disk_projections=True) for rotor in self.rotors
+        ]
+        expected_disk_meshes = [rotor_mesh.disk_mesh.value for rotor_mesh in rotor_meshes]
+        expected = [
+            (rotor_mesh.thrust_origin.value.reshape((3, )), rotor_mesh.thrust_vector.value.reshape((3, )), rotor_mesh.radius.value.reshape(()))
+            for rotor_mesh in rotor_meshes
+        ]
+        np.testing.assert_almost_equal(np.array([radius for _, _, radius in expected]), np.array(self.rotor_radii))
+
+        rotor_group = cd.mesh.make_rotor_group({"front" : rotor_meshes[0], "rear" : rotor_meshes[1]})
+        assert rotor_group.num_rotors == 2
+        assert rotor_group.thrust_origin.shape == (2, 3)
+        np.testing.assert_almost_equal(rotor_group.get_rotor_mask("rear"), np.array([1., 0.]))
+
+        for i, (thrust_origin, thrust_vector, radius) in enumerate(expected):
+            np.testing.assert_almost_equal(rotor_group.thrust_origin.value[i], thrust_origin, decimal=10)
+            np.testing.assert_almost_equal(rotor_group.thrust_vector.value[i], thrust_vector, decimal=10)
+            np.testing.assert_almost_equal(rotor_group.radius.value[i], radius, decimal=10)
+
+            # The individual rotors are updated from the stacked quantities
+            rotor_mesh = rotor_meshes[i]
+            np.testing.assert_almost_equal(rotor_mesh.thrust_origin.value.reshape((3, )), thrust_origin, decimal=10)
+            np.testing.assert_almost_equal(rotor_mesh.thrust_vector.value.reshape((3, )), thrust_vector, decimal=10)
+            np.testing.assert_almost_equal(rotor_mesh.radius.value.reshape(()), radius, decimal=10)
+            assert rotor_mesh.disk_mesh.shape == (5, 4, 3)
+            np.testing.assert_almost_equal(rotor_mesh.disk_mesh.value, expected_disk_meshes[i], decimal=10)
+
+    def test_blade_profiles(self):
+        """Test the chord and twist profiles of a rectangular twisted blade, including for vectorized copies."""
+        num_radial = 10
+        rotor_mesh = cd.mesh.make_rotor_mesh(self.bladed_rotor, num_radial=num_radial, blade_comps=self.blade_geometry)
+
+        hub_radius = self.bladed_rotor.parameters.hub_radius
+        norm_radius_linspace = 1.0 / num_radial / 2.0 + np.linspace(0.0, 1.0 - 1.0 / num_radial, num_radial)
+        radial_stations = hub_radius + (1 - hub_radius) * norm_radius_linspace
+        expected_chord, expected_twist = self._get_expected_profiles(radial_stations)
+
+        np.testing.assert_almost_equal(rotor_mesh.radius.value.reshape(()), 1., decimal=10)
+        np.testing.assert_almost_equal(rotor_mesh.chord_profile.value, expected_chord, decimal=3)
+        np.testing.assert_almost_equal(rotor_mesh.twist_profile.value, expected_twist, decimal=3)
+
+        # Vectorized copies evaluate the blade on their own geometry (here, with a doubled chord)
+        rotor_geometry = self.bladed_rotor.geometry
+        blade_coefficients = _make_blade_coefficients(**dict(self.blade_parameters, chord=2 * self.blade_parameters["chord"]))
+        modified_blade_function = lfs.Function(
+            space=rotor_geometry.functions[2].space, coefficients=csdl.Variable(value=blade_coefficients)
+        )
+        modified_geometry = lfs.FunctionSet(
+            functions={0 : rotor_geometry.functions[0], 1 : rotor_geometry.functions[1], 2 : modified_blade_function}
+        )
+        vectorized_rotor_mesh = VectorizedDiscretization(rotor_mesh, [rotor_geometry, modified_geometry], 2)
+        vectorized_rotor_mesh._update()
+
+        chord_profiles = vectorized_rotor_mesh.chord_profile
+        twist_profiles = vectorized_rotor_mesh.twist_profile
+        modified_chord, modified_twist = self._get_expected_profiles(radial_stations, chord_scale=2.)
+        np.testing.assert_almost_equal(chord_profiles[0].value, expected_chord, decimal=3)
+        np.testing.assert_almost_equal(chord_profiles[1].value, modified_chord, decimal=3)
+        np.testing.assert_almost_equal(twist_profiles[1].value, modified_twist, decimal=3)
+
+        # A separately made blade geometry whose function index collides with a rotor surface is evaluated on its own
+        separate_blade_geometry = lfs.FunctionSet(functions={0 : self.blade_geometry.functions[2]})
+        separate_rotor_mesh = cd.mesh.make_rotor_mesh(self.bladed_rotor, num_radial=num_radial, blade_comps=separate_blade_geometry)
+        assert not separate_rotor_mesh._blade_in_geom
+        np.testing.assert_almost_equal(separate_rotor_mesh.chord_profile.value, expected_chord, decimal=3)
+        np.testing.assert_almost_equal(separate_rotor_mesh.twist_profile.value, expected_twist, decimal=3)
@@ -0,0 +1,55 @@
+from CADDEE_alpha.utils.struct_utils import BayThicknessSpace, interpolate_k_factor
+import numpy as np
+import pytest
+
+
+@pytest.fixture(scope="class")
+def setup_test_class():
+    breakpoints = np.array([0., 0.25, 0.5, 1.])
+    parametric_coordinates = np.array([
+        [0., 0.5],
+        [0.1, 0.2],
+        [0.25, 0.9],
+        [0.3, 0.1],
+        [1., 0.5],
+        [1.1, 0.5],
+    ])
+
+    return {"breakpoints" : breakpoints, "parametric_coordinates" : parametric_coordinates}
+
+@pytest.mark.usefixtures("setup_test_class")
+class TestBayThicknessSpace:
+    @pytest.fixture(autouse=True)
+    def _setup(self, setup_test_class):
+        self.breakpoints = setup_test_class["breakpoints"]
+        self.parametric_coordinates = setup_test_class["parametric_coordinates"]
+
+    def test_piecewise_constant(self):
+        """Test that points are assigned to the correct bays (zero outside)."""
+        space = BayThicknessSpace(self.breakpoints)
+        thicknesses = np.array([1., 2., 3.])
+        values = space.compute_basis_matrix(self.parametric_coordinates) @ thicknesses
+
+        np.testing.assert_almost_equal(values, np.array([1., 1., 1., 2., 3., 0.]))
+
+    def test_piecewise_linear(self):
+        """Test linear interpolation between breakpoints."""
+        space = BayThicknessSpace(self.breakpoints, order=1)
+        nodal_thicknesses = np.array([1., 2., 3., 5.])
+        values = space.compute_basis_matrix(self.parametric_coordinates) @ nodal_thicknesses
+
+        np.testing.assert_almost_equal(values, np.array([1., 1.4, 2., 2.2, 5., 0.]))
+
+    def test_unsorted_breakpoints(self):
+        """Test that unsorted breakpoints raise an error."""
+        with pytest.raises(ValueError):
+            BayThicknessSpace(np.array([0., 0.5, 0.25]))
+
+def test_interpolate_k_factor():
+    """Test that the k-factor interpolant reproduces the table and clamps outside of it."""
+    k_table = np.array([[1.0, 7.75], [1.5, 5.84], [2.0, 5.43], [3.0, 5.02]])
+    aspect_ratio = np.array([0.5, 1.0, 1.5, 1.75, 3.0, 4.0])
+    k = interpolate_k_factor(k_table, aspect_ratio)
+
+    np.testing.assert_almost_equal(k[[0, 1, 2, 4, 5]], np.array([7.75, 7.75, 5.84, 5.02, 5.02]))
+    assert 5.43 < k[3] < 5.84
@@ -0,0 +1,93 @@
+import CADDEE_alpha as cd
+from CADDEE_alpha.core.component import _get_quadrature_rule
+import csdl_alpha as csdl
+import lsdo_function_spaces as lfs
+import numpy as np
+import pytest
+
+
+def _compute_mesh_area(geometry, grid_resolution=50):
+    """Reference (triangulated mesh-based) surface area of a geometry."""
+    num_surfaces = len(geometry.functions)
+    parametric_grid = geometry.generate_parametric_grid(grid_resolution=(grid_resolution, grid_resolution))
+    coords = geometry.evaluate(parametric_grid, non_csdl=True).reshape((num_surfaces, grid_resolution, grid_resolution, 3))
+
+    diagonal_1 = coords[:, 1:, 1:, :] - coords[:, :-1, :-1, :]
+    diagonal_2 = coords[:, :-1, 1:, :] - coords[:, 1:, :-1, :]
+
+    return 0.5 * np.linalg.norm(np.cross(diagonal_1, diagonal_2), axis=-1).sum()
+
+
+@pytest.fixture(scope="class")
+def setup_test_class():
+    recorder = csdl.Recorder(inline=True)
+    recorder.start()
+
+    # Flat rectangular (bi-cubic) patch of size 3 x 2
+    length, width = 3., 2.
+    flat_space = lfs.BSplineSpace(num_parametric_dimensions=2, degree=(3, 3), coefficients_shape=(6, 5))
+    u, v = np.meshgrid(np.linspace(0, 1, 6), np.linspace(0, 1, 5), indexing="ij")
+    flat_coefficients = np.stack((length * u, width * v, np.zeros_like(u)), axis=-1)
+    flat_patch = lfs.Function(space=flat_space, coefficients=csdl.Variable(value=flat_coefficients))
+
+    # Quarter cylinder segment of radius 1.5 and length 4 (fitted cubic in u, linear in v)
+    radius, cylinder_length = 1.5, 4.
+    cylinder_space = lfs.BSplineSpace(num_parametric_dimensions=2, degree=(3, 1), coefficients_shape=(12, 2))
+    u, v = np.meshgrid(np.linspace(0, 1, 60), np.linspace(0, 1, 2), indexing="ij")
+    theta = np.pi / 2 * u
+    cylinder_points = np.stack((radius * np.cos(theta), radius * np.sin(theta), cylinder_length * v), axis=-1)
+    cylinder_segment = cylinder_space.fit_function(
+        values=cylinder_points.reshape((-1, 3)),
+        parametric_coordinates=np.stack((u.flatten(), v.flatten()), axis=1),
+    )
+
+    wing_geometry = cd.import_geometry("simple_wing.stp")
+
+    return {
+        "flat_patch" : lfs.FunctionSet(functions=[flat_patch]),
+        "flat_area" : length * width,
+        "cylinder_segment" : lfs.FunctionSet(functions=[cylinder_segment]),
+        "cylinder_area" : np.pi / 2 * radius * cylinder_length,
+        "wing_geometry" : wing_geometry,
+    }
+
+@pytest.mark.usefixtures("setup_test_class")
+class TestSurfaceArea:
+    @pytest.fixture(autouse=True)
+    def _setup(self, setup_test_class):
+        self.flat_patch = setup_test_class["flat_patch"]
+        self.flat_area = setup_test_class["flat_area"]
+        self.cylinder_segment = setup_test_class["cylinder_segment"]
+        self.cylinder_area = setup_test_class["cylinder_area"]
+        self.wing_geometry = setup_test_class["wing_geometry"]
+
+    def test_flat_patch_area(self):
+        """Test that the area of a flat rectangular patch is exact."""
+        component = cd.Component(geometry=self.flat_patch)
+        area = component._compute_surface_area(geometry=self.flat_patch)
+
+        np.testing.assert_almost_equal(area.value, self.flat_area, decimal=10)
+
+    def test_cylinder_segment_area(self):
+        """Test the area of a (fitted) quarter cylinder segment against the analytical value."""
+        component = cd.Component(geometry=self.cylinder_segment)
+        area = component._compute_surface_area(geometry=self.cylinder_segment)
+
+        np.testing.assert_almost_equal(area.value / self.cylinder_area, 1., decimal=4)
+
+    def test_quadrature_rule(self):
+        """Test that the quadrature weights integrate to one and that rules are shared per space."""
+        space = self.cylinder_segment.functions[0].space
+        points, weights = _get_quadrature_rule(space)
+
+        np.testing.assert_almost_equal(weights.sum(), 1., decimal=12)
+        assert np.all((points >= 0.) & (points <= 1.))
+        assert _get_quadrature_rule(space)[0] is points
+
+    def test_wing_area(self):
+        """Test the wing surface area against a fine triangulated mesh of the geometry."""
+        wing = cd.aircraft.components.Wing(S_ref=45, AR=7.2, taper_ratio=0.2, geometry=self.wing_geometry)
+        area = wing.quantities.surface_area
+        mesh_area = _compute_mesh_area(self.wing_geometry, grid_resolution=100)
+
+        np.testing.assert_almost_equal(area.value / mesh_area, 1., decimal=3)
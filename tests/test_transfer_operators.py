@@ -0,0 +1,38 @@
+from CADDEE_alpha.utils.transfer_operators import TransferOperator
+import numpy as np
+import pytest
+
+
+@pytest.fixture(scope="class")
+def setup_test_class():
+    rng = np.random.default_rng(0)
+    nodes = np.stack((np.zeros((5, )), np.linspace(0., 4., 5), np.zeros((5, ))), axis=1)
+    load_points = rng.random((20, 3)) * np.array([1., 4., 0.1])
+    transfer_operator = TransferOperator.from_points(load_points, nodes, num_neighbors=2)
+
+    return {"nodes" : nodes, "transfer_operator" : transfer_operator, "rng" : rng}
+
+@pytest.mark.usefixtures("setup_test_class")
+class TestTransferOperator:
+    @pytest.fixture(autouse=True)
+    def _setup(self, setup_test_class):
+        self.nodes = setup_test_class["nodes"]
+        self.transfer_operator = setup_test_class["transfer_operator"]
+        self.rng = setup_test_class["rng"]
+
+    def test_conservation(self):
+        """Test that forces are conserved and displacements are consistent (virtual work)."""
+        forces = self.rng.random((3, 20, 3))
+        displacements = self.rng.random((3, 5, 3))
+        nodal_forces = self.transfer_operator.transfer_forces(forces)
+        load_point_displacements = self.transfer_operator.transfer_displacements(displacements)
+
+        assert nodal_forces.shape == (3, 5, 3)
+        assert load_point_displacements.shape == (3, 20, 3)
+        np.testing.assert_almost_equal(nodal_forces.sum(axis=1), forces.sum(axis=1))
+        np.testing.assert_almost_equal(np.sum(load_point_displacements * forces), np.sum(displacements * nodal_forces))
+
+    def test_coincident_points(self):
+        """Test that coincident load points and nodes give the identity."""
+        transfer_operator = TransferOperator.from_points(self.nodes, self.nodes)
+        np.testing.assert_almost_equal(transfer_operator.matrix.toarray(), np.eye(5))